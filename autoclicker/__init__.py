@@ -6,21 +6,42 @@ This package provides a modular autoclicker with:
 - Hotkey-based coordinate capture
 - Save/load click configurations
 - Randomization options for anti-detection
+
+Public names are imported lazily on first access, so headless use
+(``from autoclicker import AutoClicker``) never loads tkinter or pynput.
 """
 
-from .models import ClickPoint
-from .core import AutoClicker
-from .hotkeys import HotkeyListener
-from .gui import AutoClickerGUI
-from .utils import get_configs_dir, CONFIGS_DIR
-
-__all__ = [
-    'ClickPoint',
-    'AutoClicker',
-    'HotkeyListener',
-    'AutoClickerGUI',
-    'get_configs_dir',
-    'CONFIGS_DIR',
-]
+import importlib
+
+_EXPORTS = {
+    'ClickPoint': '.models',
+    'PointTable': '.models',
+    'AutoClicker': '.core',
+    'ProcessAutoClicker': '.process',
+    'HotkeyListener': '.hotkeys',
+    'MacroRecorder': '.recorder',
+    'InputBackend': '.backends',
+    'RecordingBackend': '.backends',
+    'create_backend': '.backends',
+    'AutoClickerGUI': '.gui',
+    'get_configs_dir': '.utils',
+    'CONFIGS_DIR': '.utils',
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
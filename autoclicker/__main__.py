@@ -0,0 +1,9 @@
+"""
+Allows running the package with ``python -m autoclicker``.
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
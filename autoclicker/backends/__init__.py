@@ -0,0 +1,52 @@
+"""
+Input backend package.
+
+Backends move the cursor and send clicks for the AutoClicker. Each one is
+imported only when selected, so a missing optional dependency (pynput,
+libXtst) only matters if that backend is actually used.
+"""
+
+import os
+import sys
+
+from .base import InputBackend
+from .recording import RecordingBackend
+
+BACKEND_NAMES = ('auto', 'xtest', 'pynput', 'recording')
+
+
+def create_backend(name='auto'):
+    """
+    Create an input backend by name.
+    
+    Args:
+        name: 'xtest', 'pynput', 'recording' or 'auto' (XTest on X11 when
+            available, otherwise pynput)
+            
+    Returns:
+        An InputBackend instance
+    """
+    if name == 'auto':
+        if sys.platform.startswith('linux') and os.environ.get('DISPLAY'):
+            try:
+                return create_backend('xtest')
+            except RuntimeError:
+                pass
+        return create_backend('pynput')
+    if name == 'xtest':
+        from .xtest import XTestBackend
+        return XTestBackend()
+    if name == 'pynput':
+        from .pynput_backend import PynputBackend
+        return PynputBackend()
+    if name == 'recording':
+        return RecordingBackend()
+    raise ValueError(f"Unknown input backend: {name}")
+
+
+__all__ = [
+    'InputBackend',
+    'RecordingBackend',
+    'BACKEND_NAMES',
+    'create_backend',
+]
@@ -0,0 +1,46 @@
+"""
+Input backend interface module.
+
+This module contains the InputBackend base class which every mouse
+input backend implements.
+"""
+
+
+class InputBackend:
+    """Base class for mouse input backends"""
+    
+    name = 'base'
+    
+    def get_position(self):
+        """Get the current cursor position as an (x, y) tuple"""
+        raise NotImplementedError
+        
+    def move(self, x, y):
+        """Move the cursor to (x, y)"""
+        raise NotImplementedError
+        
+    def click(self, button='left'):
+        """Press and release a mouse button at the current position"""
+        raise NotImplementedError
+        
+    def click_at(self, x, y, button='left'):
+        """Move to (x, y) and click; backends may send this as one batch"""
+        self.move(x, y)
+        self.click(button)
+        
+    def watch_motion(self, callback):
+        """
+        Start reporting cursor motion to callback(x, y) from a passive listener.
+        
+        Returns:
+            True if motion watching is supported and started
+        """
+        return False
+        
+    def unwatch_motion(self):
+        """Stop reporting cursor motion"""
+        pass
+        
+    def close(self):
+        """Release any resources held by the backend"""
+        pass
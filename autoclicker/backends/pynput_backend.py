@@ -0,0 +1,56 @@
+"""
+pynput input backend module.
+
+Wraps pynput's generic mouse Controller. Works on every platform pynput
+supports, at the cost of a display round trip per call.
+"""
+
+from pynput.mouse import Controller as MouseController, Button, Listener as MouseListener
+
+from .base import InputBackend
+
+BUTTONS = {
+    'left': Button.left,
+    'right': Button.right,
+    'middle': Button.middle,
+}
+
+
+class PynputBackend(InputBackend):
+    """Input backend using pynput's mouse controller"""
+    
+    name = 'pynput'
+    
+    def __init__(self):
+        self.mouse = MouseController()
+        self.listener = None
+        
+    def get_position(self):
+        """Get the current cursor position"""
+        x, y = self.mouse.position
+        return (int(x), int(y))
+        
+    def move(self, x, y):
+        """Move the cursor to (x, y)"""
+        self.mouse.position = (x, y)
+        
+    def click(self, button='left'):
+        """Click a mouse button at the current position"""
+        self.mouse.click(BUTTONS[button])
+        
+    def watch_motion(self, callback):
+        """Report cursor motion through a pynput mouse listener"""
+        self.unwatch_motion()
+        self.listener = MouseListener(on_move=callback)
+        self.listener.start()
+        return True
+        
+    def unwatch_motion(self):
+        """Stop the mouse listener"""
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+            
+    def close(self):
+        """Stop the mouse listener if one is running"""
+        self.unwatch_motion()
@@ -0,0 +1,68 @@
+"""
+Recording input backend module.
+
+An in-memory backend that records every call instead of touching the
+real cursor. Used for tests, benchmarks and dry runs.
+"""
+
+import time
+from collections import deque
+
+from .base import InputBackend
+
+
+class RecordingBackend(InputBackend):
+    """Input backend that records moves and clicks in memory"""
+    
+    name = 'recording'
+    
+    def __init__(self, clock=time.monotonic_ns, max_events=None):
+        """
+        Initialize the backend.
+        
+        Args:
+            clock: Function returning the timestamp stored with each event
+            max_events: Keep only the most recent events (None = keep all)
+        """
+        self.clock = clock
+        self.position = (0, 0)
+        self.events = deque(maxlen=max_events)  # (kind, x, y, timestamp_ns)
+        self.click_count = 0
+        self.motion_callback = None
+        
+    def get_position(self):
+        """Get the simulated cursor position"""
+        return self.position
+        
+    def move(self, x, y):
+        """Record a move to (x, y)"""
+        self.position = (x, y)
+        self.events.append(('move', x, y, self.clock()))
+        if self.motion_callback:
+            self.motion_callback(x, y)
+        
+    def click(self, button='left'):
+        """Record a click at the simulated cursor position"""
+        x, y = self.position
+        self.click_count += 1
+        self.events.append((button, x, y, self.clock()))
+        
+    def nudge(self, x, y):
+        """Simulate the user moving the cursor to (x, y) (not recorded as ours)"""
+        self.position = (x, y)
+        if self.motion_callback:
+            self.motion_callback(x, y)
+            
+    def watch_motion(self, callback):
+        """Report simulated motion (our moves and nudges) to callback"""
+        self.motion_callback = callback
+        return True
+        
+    def unwatch_motion(self):
+        """Stop reporting simulated motion"""
+        self.motion_callback = None
+        
+    @property
+    def clicks(self):
+        """List of recorded (button, x, y, timestamp_ns) click events"""
+        return [e for e in self.events if e[0] != 'move']
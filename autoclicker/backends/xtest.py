@@ -0,0 +1,137 @@
+"""
+X11 XTest input backend module.
+
+Talks to libX11/libXtst directly through ctypes. A click is sent as a
+motion, press and release event followed by a single flush, instead of
+the separate round trips pynput makes for each call.
+"""
+
+import ctypes
+import ctypes.util
+import threading
+
+from .base import InputBackend
+
+BUTTONS = {
+    'left': 1,
+    'middle': 2,
+    'right': 3,
+}
+
+
+def _load_library(name):
+    """Load a shared library by short name, raising RuntimeError if missing"""
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise RuntimeError(f"lib{name} not found - install the X11/XTest client libraries")
+    return ctypes.CDLL(path)
+
+
+class XTestBackend(InputBackend):
+    """Input backend sending fake input through the XTest extension"""
+    
+    name = 'xtest'
+    
+    def __init__(self, display=None):
+        """
+        Initialize the backend.
+        
+        Args:
+            display: X display name (default: the DISPLAY environment variable)
+        """
+        self._x11 = _load_library('X11')
+        self._xtst = _load_library('Xtst')
+        self._declare()
+        
+        self._display = self._x11.XOpenDisplay(display.encode() if display else None)
+        if not self._display:
+            raise RuntimeError("Cannot open X display - is DISPLAY set?")
+        self._root = self._x11.XDefaultRootWindow(self._display)
+        # Xlib connections are not thread-safe; the GUI also reads the position
+        self._lock = threading.Lock()
+        self._listener = None
+        
+    def _declare(self):
+        """Declare the ctypes signatures of the functions we call"""
+        x11, xtst = self._x11, self._xtst
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XQueryPointer.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_uint),
+        ]
+        x11.XQueryPointer.restype = ctypes.c_int
+        xtst.XTestFakeMotionEvent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+                                              ctypes.c_int, ctypes.c_ulong]
+        xtst.XTestFakeButtonEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+                                              ctypes.c_ulong]
+                                              
+    def get_position(self):
+        """Query the current cursor position from the X server"""
+        root = ctypes.c_ulong()
+        child = ctypes.c_ulong()
+        root_x, root_y = ctypes.c_int(), ctypes.c_int()
+        win_x, win_y = ctypes.c_int(), ctypes.c_int()
+        mask = ctypes.c_uint()
+        with self._lock:
+            self._x11.XQueryPointer(self._display, self._root,
+                                    ctypes.byref(root), ctypes.byref(child),
+                                    ctypes.byref(root_x), ctypes.byref(root_y),
+                                    ctypes.byref(win_x), ctypes.byref(win_y),
+                                    ctypes.byref(mask))
+        return (root_x.value, root_y.value)
+        
+    def move(self, x, y):
+        """Move the cursor to (x, y)"""
+        with self._lock:
+            self._xtst.XTestFakeMotionEvent(self._display, -1, x, y, 0)
+            self._x11.XFlush(self._display)
+            
+    def click(self, button='left'):
+        """Click a mouse button at the current position"""
+        code = BUTTONS[button]
+        with self._lock:
+            self._xtst.XTestFakeButtonEvent(self._display, code, True, 0)
+            self._xtst.XTestFakeButtonEvent(self._display, code, False, 0)
+            self._x11.XFlush(self._display)
+            
+    def click_at(self, x, y, button='left'):
+        """Move and click in one batch with a single flush"""
+        code = BUTTONS[button]
+        with self._lock:
+            self._xtst.XTestFakeMotionEvent(self._display, -1, x, y, 0)
+            self._xtst.XTestFakeButtonEvent(self._display, code, True, 0)
+            self._xtst.XTestFakeButtonEvent(self._display, code, False, 0)
+            self._x11.XFlush(self._display)
+            
+    def watch_motion(self, callback):
+        """Report cursor motion through a pynput listener, when pynput is installed"""
+        try:
+            from pynput.mouse import Listener as MouseListener
+        except ImportError:
+            return False
+        self.unwatch_motion()
+        self._listener = MouseListener(on_move=callback)
+        self._listener.start()
+        return True
+        
+    def unwatch_motion(self):
+        """Stop the motion listener"""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+            
+    def close(self):
+        """Close the X display connection"""
+        self.unwatch_motion()
+        with self._lock:
+            if self._display:
+                self._x11.XCloseDisplay(self._display)
+                self._display = None
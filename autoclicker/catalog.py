@@ -0,0 +1,151 @@
+"""
+Config catalog module.
+
+This module contains the ConfigCatalog class which keeps a persistent
+index of the configs directory (name, description, point count and save
+date per file). A config file is only parsed again when its modification
+time or size has changed since it was last indexed.
+"""
+
+import json
+import os
+
+from .utils import get_configs_dir
+
+CATALOG_FILENAME = '.catalog.json'
+CATALOG_VERSION = 1
+
+
+def is_config_filename(filename):
+    """Whether a directory entry is a config file (dotfiles such as the index are not)"""
+    return filename.endswith('.json') and not filename.startswith('.')
+
+
+class CatalogChanges:
+    """Filenames added, updated and removed by a catalog scan"""
+    
+    def __init__(self):
+        self.added = []
+        self.updated = []
+        self.removed = []
+        
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+
+class ConfigCatalog:
+    """Persistent metadata index of the configs directory"""
+    
+    def __init__(self, configs_dir=None):
+        """
+        Initialize the catalog and load its saved index.
+        
+        Args:
+            configs_dir: Directory to index (default: get_configs_dir())
+        """
+        self.configs_dir = configs_dir or get_configs_dir()
+        self.index_path = os.path.join(self.configs_dir, CATALOG_FILENAME)
+        self.entries = {}  # filename -> metadata dict
+        self._load_index()
+        
+    def _load_index(self):
+        """Load the saved index, starting empty if it is missing or unreadable"""
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('version') == CATALOG_VERSION:
+                self.entries = index.get('entries', {})
+        except (OSError, ValueError):
+            self.entries = {}
+            
+    def _save_index(self):
+        """Write the index atomically next to the configs"""
+        tmp_path = self.index_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': CATALOG_VERSION, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # The index is only a cache; the next scan rebuilds it
+            
+    def path(self, filename):
+        """Full path of a config file in the catalog"""
+        return os.path.join(self.configs_dir, filename)
+        
+    def scan(self, filenames=None):
+        """
+        Bring the index up to date, re-reading only files that changed.
+        
+        Args:
+            filenames: Only check these files (e.g. from a directory watcher);
+                None checks the whole directory
+                
+        Returns:
+            CatalogChanges listing what was added, updated and removed
+        """
+        changes = CatalogChanges()
+        if filenames is None:
+            try:
+                with os.scandir(self.configs_dir) as it:
+                    stats = {e.name: e.stat() for e in it if is_config_filename(e.name) and e.is_file()}
+            except OSError:
+                stats = {}
+            gone = [name for name in self.entries if name not in stats]
+        else:
+            stats = {}
+            gone = []
+            for name in filenames:
+                if not is_config_filename(name):
+                    continue
+                try:
+                    stats[name] = os.stat(self.path(name))
+                except OSError:
+                    if name in self.entries:
+                        gone.append(name)
+                        
+        for name in gone:
+            del self.entries[name]
+            changes.removed.append(name)
+            
+        for name, st in stats.items():
+            entry = self.entries.get(name)
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                continue
+            self.entries[name] = self._read_metadata(name, st)
+            (changes.updated if entry else changes.added).append(name)
+            
+        if changes:
+            self._save_index()
+        return changes
+        
+    def _read_metadata(self, filename, st):
+        """Parse one config file into an index entry"""
+        entry = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'name': filename,
+            'description': '',
+            'points': 0,
+            'saved_at': 'Unknown',
+            'error': None,
+        }
+        try:
+            with open(self.path(filename), 'r') as f:
+                config = json.load(f)
+            if not isinstance(config, dict):
+                raise ValueError("top level is not an object")
+            entry['name'] = config.get('name', filename)
+            entry['description'] = config.get('description', '')
+            entry['points'] = len(config.get('click_points', []))
+            entry['saved_at'] = config.get('saved_at', 'Unknown')
+        except (OSError, ValueError, TypeError) as e:
+            entry['error'] = str(e)
+        return entry
+        
+    def sorted_entries(self):
+        """(filename, entry) pairs sorted by filename"""
+        return sorted(self.entries.items())
+        
+    def invalid(self):
+        """(filename, error) pairs for config files that could not be read"""
+        return [(name, e['error']) for name, e in self.sorted_entries() if e['error']]
@@ -0,0 +1,489 @@
+"""
+Headless command-line runner.
+
+Drives an AutoClicker straight from a saved config without the GUI, for
+sessions on Xvfb displays or over SSH. Nothing here imports tkinter.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+from .backends import BACKEND_NAMES, create_backend
+from .core import AutoClicker
+from .events import ConsoleLogger, FileLogger, MetricsExporter
+from .perf import PRIORITY_NAMES, PerformanceProfile
+from .timing import STRATEGY_NAMES, calibrate, create_strategy, measure
+from .trace import EXPORTERS, export, load, wall_time
+
+
+def format_stats(stats):
+    """Format run statistics as a single status line"""
+    line = (f"Loops: {stats['loops']} | Clicks: {stats['clicks']} | "
+            f"Elapsed: {stats['elapsed']:.1f}s | "
+            f"Drift: {stats['drift_ms']:+.1f} ms (max {stats['max_drift_ms']:.1f} ms)")
+    if stats.get('condition_hits') or stats.get('condition_misses'):
+        line += (f" | Conditions: {stats['condition_hits']} matched, {stats['condition_misses']} timed out "
+                 f"({stats['condition_saved_s']:.1f}s saved)")
+    if stats.get('idle_hits') or stats.get('idle_misses'):
+        line += (f" | Idle waits: {stats['idle_hits']} settled, {stats['idle_misses']} timed out "
+                 f"({stats['idle_saved_s']:.1f}s saved)")
+    if stats.get('slots_skipped'):
+        line += f" | Drops: {stats['slots_skipped']} empty slots skipped ({stats['slots_saved_s']:.1f}s saved)"
+    if stats.get('paused'):
+        line += " | PAUSED"
+    return line
+
+
+def format_perf_stats(stats):
+    """Format the performance profile results as a single line"""
+    line = (f"CPU: {stats['perf_cpu'] if stats['perf_cpu'] is not None else 'any'} | "
+            f"Scheduling: {stats['perf_policy']} | Preempted: {stats['involuntary_switches']}x | "
+            f"GC: {stats['gc_collections']} between loops (max {stats['gc_max_pause_ms']:.1f} ms)")
+    if stats['perf_notes']:
+        line += " | " + ", ".join(stats['perf_notes'])
+    return line
+
+
+def format_timing_stats(timing):
+    """Format per-click latency percentiles as one line per stage"""
+    return '\n'.join(f"{stage:9s} p50 {t['p50_ms']:7.3f} ms | p99 {t['p99_ms']:7.3f} ms | "
+                     f"max {t['max_ms']:7.3f} ms | n={t['count']}"
+                     for stage, t in timing.items() if t['count'])
+
+
+def format_search_stats(searches):
+    """Format template search latency and outcomes as one line per point"""
+    return '\n'.join(f"point {point + 1:<3d} p50 {s['p50_ms']:7.3f} ms | p99 {s['p99_ms']:7.3f} ms | "
+                     f"max {s['max_ms']:7.3f} ms | {s['local']} local, {s['global']} global, "
+                     f"{s['missed']} missed | score {s['score']:.2f}"
+                     for point, s in searches.items())
+
+
+def run(config_path, loops=None, start_delay=None, backend='auto', interval=10.0, log_path=None,
+        metrics_path=None, wait='sleep', margin_ms=2.0, performance=None, trace_path=None, poll_ms=50.0,
+        settle_ms=None):
+    """
+    Run a saved configuration headless until it finishes or is interrupted.
+    
+    Args:
+        config_path: Path to a config JSON file
+        loops: Override the config's loop count (0 = infinite)
+        start_delay: Override the config's start delay in seconds
+        backend: Input backend name (see create_backend)
+        interval: Seconds between periodic stats lines
+        log_path: Append every engine event to this file
+        metrics_path: Keep a Prometheus text file of run totals here
+        wait: Wait strategy name (see timing.STRATEGY_NAMES)
+        margin_ms: Precise-wait margin for the timerfd/hybrid strategies
+        performance: PerformanceProfile for the click thread
+        trace_path: Record every click to this binary trace file
+        poll_ms: How often pixel conditions are checked
+        settle_ms: Hover time before each click (None = adaptive, 0 = move
+            and click in one batch)
+        
+    Returns:
+        Process exit code
+    """
+    clicker = AutoClicker(backend=create_backend(backend))
+    config = clicker.load_config(config_path)
+    if loops is not None:
+        clicker.loop_count = loops
+    if start_delay is not None:
+        clicker.start_delay = start_delay
+    clicker.wait_strategy = wait
+    clicker.wait_margin_ms = margin_ms
+    if performance is not None:
+        clicker.performance = performance
+    clicker.trace_path = trace_path
+    clicker.condition_poll_ms = poll_ms
+    clicker.settle_time = settle_ms / 1000 if settle_ms is not None else None
+    consumers = [ConsoleLogger(clicker.events, prefix=f"[{config.get('name', 'config')}] ")]
+    if log_path:
+        consumers.append(FileLogger(clicker.events, log_path))
+    if metrics_path:
+        consumers.append(MetricsExporter(clicker.events, metrics_path))
+    for consumer in consumers:
+        consumer.start()
+    
+    # SIGUSR1 = a game tick just happened, SIGUSR2 = pause/resume
+    if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGUSR1, lambda signum, frame: clicker.sync_ticks())
+        signal.signal(signal.SIGUSR2, lambda signum, frame: clicker.toggle_pause())
+        
+    print(f"Backend: {clicker.backend.name} | Wait: {wait} | Points: {len(clicker.click_points)} | "
+          f"Loops: {clicker.loop_count or 'infinite'}", flush=True)
+    try:
+        if not clicker.start():
+            print("Nothing to run - the config has no enabled click points", file=sys.stderr)
+            return 1
+            
+        try:
+            while clicker.thread.is_alive():
+                clicker.thread.join(interval)
+                if clicker.thread.is_alive():
+                    print(format_stats(clicker.get_run_stats()), flush=True)
+        except KeyboardInterrupt:
+            clicker.stop()
+            clicker.thread.join()
+    finally:
+        # Flush whatever the loggers still have queued
+        for consumer in consumers:
+            consumer.stop()
+            
+    stats = clicker.get_run_stats()
+    print(format_stats(stats), flush=True)
+    if clicker.performance.enabled:
+        print(format_perf_stats(stats), flush=True)
+    if stats['clicks']:
+        print(format_timing_stats(clicker.get_timing_stats()), flush=True)
+    searches = clicker.get_search_stats()
+    if searches:
+        print("Template search:", flush=True)
+        print(format_search_stats(searches), flush=True)
+    if trace_path:
+        print(f"Trace written to {trace_path} (export with: python -m autoclicker trace export {trace_path})",
+              flush=True)
+    return 0
+
+
+def record(macro_path, config_path=None, speed=1.0):
+    """
+    Record clicks and key presses until ESC and save them as a macro.
+    
+    Args:
+        macro_path: Macro JSON file to write
+        config_path: Also save the clicks as a click config here
+        speed: Speed multiplier applied to the config's delays
+        
+    Returns:
+        Process exit code
+    """
+    # pynput is only needed here, never on the headless run path
+    from .recorder import MacroRecorder
+    recorder = MacroRecorder()
+    recorder.start()
+    print("Recording clicks and key presses - press ESC to stop", flush=True)
+    try:
+        macro = recorder.wait()
+    except KeyboardInterrupt:
+        macro = recorder.stop()
+    with open(macro_path, 'w') as f:
+        json.dump(macro.to_dict(), f)
+    print(f"Recorded {len(macro.clicks)} clicks and {len(macro.events) - len(macro.clicks)} key presses "
+          f"over {macro.duration:.1f}s to {macro_path}" + (f" ({macro.dropped} dropped)" if macro.dropped else ""))
+    if config_path:
+        clicker = AutoClicker(backend=create_backend('recording'))
+        for point in macro.to_points(speed):
+            clicker.add_point(point)
+        clicker.save_config(config_path, name=os.path.splitext(os.path.basename(config_path))[0],
+                            description=f"Recorded routine ({len(clicker.click_points)} clicks)")
+        print(f"Saved {len(clicker.click_points)} click points to {config_path}")
+    return 0
+
+
+def replay(macro_path, speed=1.0, start_delay=3.0, backend='auto'):
+    """
+    Play back a recorded macro once.
+    
+    Args:
+        macro_path: Macro JSON file written by record
+        speed: Speed multiplier (2.0 = twice as fast)
+        start_delay: Seconds before the first event
+        backend: Input backend name (see create_backend)
+        
+    Returns:
+        Process exit code
+    """
+    from .recorder import Macro, replay as replay_macro
+    with open(macro_path, 'r') as f:
+        macro = Macro.from_dict(json.load(f))
+    input_backend = create_backend(backend)
+    print(f"Replaying {len(macro.events)} events ({macro.duration / speed:.1f}s at {speed:g}x) "
+          f"in {start_delay:g}s - Ctrl+C to stop", flush=True)
+    stop = threading.Event()
+    try:
+        if stop.wait(start_delay):
+            return 0
+        played = replay_macro(macro, input_backend, speed, stop)
+    except KeyboardInterrupt:
+        stop.set()
+        return 130
+    finally:
+        input_backend.close()
+    print(f"Replayed {played} events")
+    return 0
+
+
+def capture(out_path, region=None, seconds=5.0, fps=10.0):
+    """
+    Record screen frames to a file a ReplaySource can play back.
+    
+    Args:
+        out_path: Recording file to write (.npz)
+        region: (x, y, width, height) to capture (default: whole screen)
+        seconds: How long to record
+        fps: Frames per second
+        
+    Returns:
+        Process exit code
+    """
+    # NumPy and the capture backends are only loaded by this command
+    from .vision import CaptureThread, Region, create_source, save_recording
+    source = create_source()
+    frames = []
+    times = []
+    try:
+        region = Region(*(region or (0, 0) + source.screen_size()))
+        capturer = CaptureThread(source, [region], 1.0 / fps)
+        capturer.start()
+        print(f"Capturing {region.width}x{region.height} at ({region.x}, {region.y}) for {seconds:g}s "
+              f"- Ctrl+C to stop early", flush=True)
+        end = time.monotonic() + seconds
+        seen = 0
+        try:
+            while time.monotonic() < end:
+                latest = capturer.wait(seen, timeout=1.0)
+                if latest is None:
+                    break
+                seen = capturer.frame_count
+                frame = latest[region]
+                frames.append(frame.pixels.copy())  # The capture buffers are reused
+                times.append(frame.timestamp_ns)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            capturer.stop()
+        if capturer.error:
+            raise capturer.error
+    finally:
+        source.close()
+    if not frames:
+        print("Error: no frames captured", file=sys.stderr)
+        return 1
+    save_recording(out_path, frames, times, region[:2])
+    print(f"Saved {len(frames)} frames to {out_path} ({capturer.skipped} skipped)")
+    return 0
+
+
+def inventory(first, last, columns=4, rows=7, sample=False):
+    """
+    Check an inventory grid calibration against the screen.
+    
+    Prints which slots look occupied and the grid as it would be saved
+    in a config's drop point.
+    
+    Args:
+        first, last: (x, y) centres of the top left and bottom right slots
+        columns, rows: Grid size
+        sample: Measure the empty-slot colour instead of using the default
+        
+    Returns:
+        Process exit code
+    """
+    # NumPy and the capture backends are only loaded by this command
+    from .models import InventoryGrid
+    from .vision import create_source
+    from .vision.inventory import SlotScanner
+    grid = InventoryGrid.calibrate(first, last, columns, rows)
+    source = create_source()
+    try:
+        scanner = SlotScanner(grid, source)
+        source.check_region(scanner.region)
+        pixels = source.grab(scanner.region).pixels
+        if sample:
+            grid = grid.replace(background=scanner.sample_background(pixels))
+            scanner = SlotScanner(grid, source)
+        start = time.perf_counter()
+        fill = scanner.fill(pixels)
+        elapsed = time.perf_counter() - start
+    finally:
+        source.close()
+    print(f"Slot pitch {grid.pitch_x:g} x {grid.pitch_y:g} | background #%02x%02x%02x | scan {elapsed * 1e6:.0f} us"
+          % grid.background)
+    for row in range(grid.rows):
+        cells = fill[row * grid.columns:(row + 1) * grid.columns]
+        print('  '.join(f"{'#' if value > grid.min_fill else '.'} {value:4.0%}" for value in cells))
+    occupied = int((fill > grid.min_fill).sum())
+    print(f"{occupied} of {len(grid)} slots occupied")
+    print(json.dumps({'inventory': grid.to_dict()}))
+    return 0
+
+
+def trace_info(path):
+    """Print a summary of a trace file"""
+    trace = load(path)
+    records = trace.records
+    print(f"{path}: {len(records)} clicks (capacity {trace.capacity}, "
+          f"{max(0, trace.written - trace.capacity)} overwritten)")
+    if records:
+        first, last = records[0], records[-1]
+        late = sorted(r.late_ns for r in records)
+        print(f"From {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_time(trace, first.timestamp_ns)))} "
+              f"for {(last.timestamp_ns - first.timestamp_ns) / 1e9:.1f}s | loops {first.loop}-{last.loop} | "
+              f"position corrections {sum(1 for r in records if r.drifted)}")
+        print(f"Lateness: p50 {late[len(late) // 2] / 1e6:.3f} ms | p99 {late[int(len(late) * 0.99)] / 1e6:.3f} ms | "
+              f"max {late[-1] / 1e6:.3f} ms")
+
+
+def build_parser():
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(prog='python -m autoclicker',
+                                     description="OSRS AutoClicker (no arguments starts the GUI)")
+    commands = parser.add_subparsers(dest='command')
+    
+    run_parser = commands.add_parser('run', help="Run a saved config headless")
+    run_parser.add_argument('config', help="Path to a config JSON file")
+    run_parser.add_argument('--loops', type=int, default=None, help="Loop count (0 = infinite)")
+    run_parser.add_argument('--start-delay', type=float, default=None, help="Seconds before the first click")
+    run_parser.add_argument('--backend', choices=BACKEND_NAMES, default='auto', help="Input backend")
+    run_parser.add_argument('--interval', type=float, default=10.0, help="Seconds between stats lines")
+    run_parser.add_argument('--log', default=None, metavar='FILE', help="Append every engine event to FILE")
+    run_parser.add_argument('--metrics', default=None, metavar='FILE',
+                            help="Write run totals to FILE in Prometheus text format")
+    
+    run_parser.add_argument('--wait', choices=STRATEGY_NAMES, default='sleep', help="Wait strategy")
+    run_parser.add_argument('--margin-ms', type=float, default=2.0,
+                            help="Precise-wait margin for timerfd/hybrid (see the calibrate command)")
+    run_parser.add_argument('--cpu', type=int, default=None, help="Pin the click thread to this core")
+    run_parser.add_argument('--priority', choices=PRIORITY_NAMES, default='normal',
+                            help="Click thread priority (realtime = SCHED_FIFO when permitted)")
+    run_parser.add_argument('--gc-control', action='store_true',
+                            help="Disable the garbage collector during loops, collecting between them")
+    run_parser.add_argument('--trace', default=None, metavar='FILE',
+                            help="Record every click to a binary trace FILE (see the trace command)")
+    run_parser.add_argument('--poll-ms', type=float, default=50.0,
+                            help="How often pixel conditions are checked, in milliseconds")
+    run_parser.add_argument('--settle-ms', type=float, default=None,
+                            help="Hover time before each click (default: adaptive; 0 = move and click in one batch)")
+                            
+    record_parser = commands.add_parser('record', help="Record clicks and key presses until ESC")
+    record_parser.add_argument('macro', help="Macro JSON file to write")
+    record_parser.add_argument('--config', default=None, metavar='FILE',
+                               help="Also save the clicks as a click config with their measured delays")
+    record_parser.add_argument('--speed', type=float, default=1.0, help="Speed multiplier for the config's delays")
+    
+    replay_parser = commands.add_parser('replay', help="Play back a recorded macro")
+    replay_parser.add_argument('macro', help="Macro JSON file written by record")
+    replay_parser.add_argument('--speed', type=float, default=1.0, help="Speed multiplier (2 = twice as fast)")
+    replay_parser.add_argument('--start-delay', type=float, default=3.0, help="Seconds before the first event")
+    replay_parser.add_argument('--backend', choices=BACKEND_NAMES, default='auto', help="Input backend")
+    
+    simulate_parser = commands.add_parser('simulate', help="Estimate a config's timeline without clicking")
+    simulate_parser.add_argument('config', help="Path to a config JSON file")
+    simulate_parser.add_argument('--loops', type=int, default=None, help="Loop count (0 = infinite)")
+    simulate_parser.add_argument('--start-delay', type=float, default=None, help="Seconds before the first click")
+    
+    calibrate_parser = commands.add_parser('calibrate', help="Measure sleep wake-up error and suggest a margin")
+    calibrate_parser.add_argument('--samples', type=int, default=200, help="Number of sleeps to measure")
+    
+    trace_parser = commands.add_parser('trace', help="Inspect or export a session trace")
+    trace_commands = trace_parser.add_subparsers(dest='trace_command', required=True)
+    export_parser = trace_commands.add_parser('export', help="Export a trace for a trace viewer or spreadsheet")
+    export_parser.add_argument('file', help="Trace file recorded with run --trace or the GUI")
+    export_parser.add_argument('--format', choices=list(EXPORTERS), default='chrome',
+                               help="chrome = trace_event JSON for chrome://tracing or Perfetto")
+    export_parser.add_argument('-o', '--output', default=None, help="Output path (default: next to the trace)")
+    info_parser = trace_commands.add_parser('info', help="Summarize a trace")
+    info_parser.add_argument('file', help="Trace file")
+    
+    capture_parser = commands.add_parser('capture', help="Record screen frames for offline replay")
+    capture_parser.add_argument('output', help="Recording file to write (.npz)")
+    capture_parser.add_argument('--region', type=int, nargs=4, default=None, metavar=('X', 'Y', 'W', 'H'),
+                                help="Screen rectangle to capture (default: whole screen)")
+    capture_parser.add_argument('--seconds', type=float, default=5.0, help="How long to record")
+    capture_parser.add_argument('--fps', type=float, default=10.0, help="Frames per second")
+    
+    inventory_parser = commands.add_parser('inventory', help="Check an inventory grid calibration on screen")
+    inventory_parser.add_argument('--first', type=int, nargs=2, required=True, metavar=('X', 'Y'),
+                                  help="Centre of the top left slot")
+    inventory_parser.add_argument('--last', type=int, nargs=2, required=True, metavar=('X', 'Y'),
+                                  help="Centre of the bottom right slot")
+    inventory_parser.add_argument('--columns', type=int, default=4, help="Slots per row")
+    inventory_parser.add_argument('--rows', type=int, default=7, help="Number of rows")
+    inventory_parser.add_argument('--sample-background', action='store_true',
+                                  help="Measure the empty-slot colour (with a mostly empty inventory)")
+                                  
+    commands.add_parser('gui', help="Start the GUI (default)")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    args = build_parser().parse_args(argv)
+    if args.command == 'run':
+        return run(args.config, args.loops, args.start_delay, args.backend, args.interval, args.log,
+                   args.metrics, args.wait, args.margin_ms,
+                   PerformanceProfile(args.cpu, args.priority, args.gc_control), args.trace, args.poll_ms,
+                   args.settle_ms)
+    if args.command == 'trace':
+        try:
+            if args.trace_command == 'info':
+                trace_info(args.file)
+            else:
+                out_path, count = export(args.file, args.format, args.output)
+                print(f"Exported {count} clicks to {out_path}")
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+    if args.command == 'capture':
+        try:
+            return capture(args.output, args.region, args.seconds, args.fps)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    if args.command == 'inventory':
+        try:
+            return inventory(args.first, args.last, args.columns, args.rows, args.sample_background)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    if args.command == 'record':
+        return record(args.macro, args.config, args.speed)
+    if args.command == 'replay':
+        try:
+            return replay(args.macro, args.speed, args.start_delay, args.backend)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    if args.command == 'simulate':
+        # Imported here so runs don't pay for the statistics module
+        from .simulate import format_estimate, simulate
+        try:
+            with open(args.config, 'r') as f:
+                config = json.load(f)
+            if args.start_delay is not None:
+                config['start_delay'] = args.start_delay
+            estimate = simulate(config, args.loops)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"[{config.get('name', 'config')}] {len(config.get('click_points', []))} points, "
+              f"loops: {estimate.loops or 'infinite'}")
+        print(format_estimate(estimate))
+        return 0
+    if args.command == 'calibrate':
+        result = calibrate(args.samples)
+        print(f"time.sleep wake-up error: p50 {result.p50_ms:.3f} ms | p90 {result.p90_ms:.3f} ms | "
+              f"p99 {result.p99_ms:.3f} ms | max {result.max_ms:.3f} ms")
+        print(f"Suggested margin: --margin-ms {result.margin_ms}")
+        for name in STRATEGY_NAMES:
+            try:
+                strategy = create_strategy(name, result.margin_ms / 1000)
+            except RuntimeError as e:
+                print(f"{name:8s} unavailable: {e}")
+                continue
+            errors = measure(strategy, args.samples)
+            strategy.close()
+            print(f"{name:8s} p50 {errors[len(errors) // 2] / 1e6:.3f} ms | "
+                  f"p99 {errors[int(len(errors) * 0.99)] / 1e6:.3f} ms | max {errors[-1] / 1e6:.3f} ms")
+        return 0
+        
+    from .main import main as gui_main
+    gui_main()
+    return 0
@@ -6,34 +6,98 @@ autoclicking functionality including threading and click execution.
 """
 
 import json
-import random
 import threading
 import time
+from collections import namedtuple
 from datetime import datetime
 
-from pynput.mouse import Controller as MouseController, Button
+from .backends import create_backend
+from .cursor import CursorTracker
+from .events import ClickEvent, DebugEvent, EventBus, LoopEvent, SearchEvent, StatusEvent
+from .models import PointTable
+from .perf import PerformanceProfile
+from .plan import ClickPlan
+from .scheduler import DeadlineScheduler
+from .telemetry import ClickTelemetry, SearchTelemetry
+from .ticks import TickClock
+from .timing import NS_PER_SECOND, create_strategy
+from .trace import TraceRecorder
 
-from .models import ClickPoint
+# Screen reading set up for a plan (see AutoClicker._open_vision); parts the
+# plan doesn't need are None
+ScreenChecks = namedtuple('ScreenChecks', 'source monitor idle locator scanners')
+NO_SCREEN_CHECKS = ScreenChecks(None, None, None, None, None)
 
 
 class AutoClicker:
     """Main autoclicker logic"""
     
-    def __init__(self):
-        self.click_points = []
-        self.mouse = MouseController()
+    def __init__(self, backend=None, clock=None):
+        """
+        Initialize the autoclicker.
+        
+        Args:
+            backend: InputBackend used to move and click (default: best
+                available for this platform)
+            clock: VirtualClock to run the engine in simulated time, e.g.
+                for benchmarks and dry runs (default: real time)
+        """
+        self.click_points = PointTable()
+        self.backend = backend if backend is not None else create_backend()
+        self.cursor = CursorTracker(self.backend)
         self.running = False
         self.start_delay = 8.0
         self.loop_count = 0  # 0 = infinite
         self.current_loop = 0
         self.click_count = 0
-        self.on_status_change = None
-        self.on_click = None
-        self.on_loop_complete = None
+        self.events = EventBus()  # Status, click and loop events for observers
         self.thread = None
         self.stop_requested = False
         self.verify_position = True  # Re-check position before clicking
         self.debug_mode = False  # Print debug info to console
+        self.settle_time = None  # Pre-click settle in seconds (None = adaptive, 0 = move and click in one batch)
+        self.paused = False
+        self.pause_latency_ns = 0  # Time from pause() until the engine held
+        self.stop_latency_ns = 0  # Time from stop() until the engine exited
+        self._pause_requested_ns = 0
+        self._stop_requested_ns = 0
+        self._wakeup = threading.Condition()
+        self.clock = clock
+        if clock is None:
+            self.scheduler = DeadlineScheduler(sleep=self._sleep)
+        else:
+            self.scheduler = DeadlineScheduler(clock, clock.sleep)
+        self.plan = None  # ClickPlan compiled from click_points at start
+        self._reload_requested = False
+        self.tick_mode = False  # Phase-lock clicks to 600 ms game ticks
+        self.tick_lead_ms = 50.0  # Fire this long before each tick boundary
+        self.tick_clock = TickClock() if clock is None else TickClock(clock=clock)
+        self.wait_strategy = 'sleep'  # How deadlines are waited for (see timing.STRATEGY_NAMES)
+        self.wait_margin_ms = 2.0  # Precise-wait margin for the timerfd/hybrid strategies
+        self.performance = PerformanceProfile()  # CPU pinning, priority and GC control for runs
+        self.timing = ClickTelemetry()  # Per-click latency histograms for the current run
+        self.trace_path = None  # Record every click to this binary trace file (see the trace module)
+        self.frame_source = None  # vision FrameSource for screen checks (default: the screen)
+        self.condition_poll_ms = 50.0  # How often pixel conditions and idle waits are captured and checked
+        self.condition_hits = 0  # Conditional clicks fired because their condition matched
+        self.condition_misses = 0  # Conditional clicks fired at their timeout
+        self.condition_saved_ns = 0  # Time cut from delays by conditions that matched early
+        self.idle_hits = 0  # Idle waits that ended early because their region settled
+        self.idle_misses = 0  # Idle waits that ran to their timeout
+        self.idle_saved_ns = 0  # Time cut from delays by idle waits
+        self._loop_saved_ns = 0  # Time cut from the current loop's delays by screen checks
+        self.slots_skipped = 0  # Empty inventory slots a drop point didn't click
+        self.slots_saved_ns = 0  # Delays of the skipped slots
+        self.search_timing = self.events.attach(SearchTelemetry())  # Template search latency per point
+        
+    def set_backend(self, backend):
+        """Replace the input backend (only while stopped)"""
+        if self.running:
+            return False
+        self.backend.close()
+        self.backend = backend
+        self.cursor = CursorTracker(backend)
+        return True
         
     def add_point(self, point):
         """Add a click point"""
@@ -49,116 +113,534 @@ class AutoClicker:
         self.click_points.clear()
         
     def start(self):
-        """Start the autoclicker in a separate thread"""
-        if self.running or not self.click_points:
+        """
+        Start the autoclicker in a separate thread.
+        
+        Returns:
+            False if it is already running or no click point is enabled
+        """
+        if self.running or not any(self.click_points.enabled):
             return False
         self.running = True
         self.stop_requested = False
+        self.paused = False
+        self.pause_latency_ns = 0
+        self.stop_latency_ns = 0
         self.current_loop = 0
         self.click_count = 0
+        self.condition_hits = 0
+        self.condition_misses = 0
+        self.condition_saved_ns = 0
+        self.idle_hits = 0
+        self.idle_misses = 0
+        self.idle_saved_ns = 0
+        self.slots_skipped = 0
+        self.slots_saved_ns = 0
+        self.timing.reset()
+        self.search_timing.reset()
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
         return True
         
     def stop(self):
-        """Stop the autoclicker"""
-        self.stop_requested = True
+        """Stop the autoclicker (wakes the engine out of any wait)"""
+        with self._wakeup:
+            if not self.stop_requested:
+                self._stop_requested_ns = time.monotonic_ns()
+            self.stop_requested = True
+            self._wakeup.notify_all()
+            
+    def pause(self):
+        """Pause the autoclicker, keeping its place in the sequence"""
+        with self._wakeup:
+            if self.running and not self.paused:
+                self._pause_requested_ns = time.monotonic_ns()
+                self.paused = True
+                self._wakeup.notify_all()
+                
+    def resume(self):
+        """Resume a paused autoclicker with the remaining delay intact"""
+        with self._wakeup:
+            self.paused = False
+            self._wakeup.notify_all()
+            
+    def toggle_pause(self):
+        """Pause if running, resume if paused"""
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+        
+    def sync_ticks(self, timestamp_ns=None):
+        """Re-sync the tick phase: a game tick happened at timestamp_ns (default now)"""
+        self.tick_clock.sync(timestamp_ns)
+        
+    def get_run_stats(self):
+        """Get statistics for the current (or last) run"""
+        stats = {
+            'loops': self.current_loop,
+            'clicks': self.click_count,
+        }
+        stats.update(self.scheduler.get_stats())
+        stats.update(self.cursor.get_stats())
+        stats.update(self.performance.get_stats())
+        stats['paused'] = self.paused
+        stats['pause_latency_ms'] = self.pause_latency_ns / 1e6
+        stats['stop_latency_ms'] = self.stop_latency_ns / 1e6
+        stats['condition_hits'] = self.condition_hits
+        stats['condition_misses'] = self.condition_misses
+        stats['condition_saved_s'] = self.condition_saved_ns / 1e9
+        stats['idle_hits'] = self.idle_hits
+        stats['idle_misses'] = self.idle_misses
+        stats['idle_saved_s'] = self.idle_saved_ns / 1e9
+        stats['slots_skipped'] = self.slots_skipped
+        stats['slots_saved_s'] = self.slots_saved_ns / 1e9
+        if self.tick_mode:
+            stats['tick_syncs'] = self.tick_clock.syncs
+            stats['tick_phase_ms'] = self.tick_clock.phase_ms()
+        return stats
+        
+    def get_timing_stats(self):
+        """
+        Get per-click latency percentiles for the current (or last) run.
+        
+        Returns:
+            Dict keyed by stage - 'lateness' (scheduled vs actual click
+            time), 'backend' (click call), 'verify' (position check) and
+            'callback' (event publishing) - of dicts with count, mean_ms,
+            min_ms, p50_ms, p90_ms, p99_ms and max_ms
+        """
+        return self.timing.get_stats()
+        
+    def get_search_stats(self):
+        """
+        Get template search results per point for the current (or last) run.
+        
+        Returns:
+            Dict of point index -> dict with count, local, global and
+            missed searches, the last score and latency (mean_ms, p50_ms,
+            p90_ms, p99_ms, max_ms, ...)
+        """
+        return self.search_timing.get_stats()
+        
+    def _sleep(self, seconds):
+        """
+        Sleep that returns early when stop or pause is requested.
+        
+        Returns:
+            True if the sleep was interrupted
+        """
+        with self._wakeup:
+            if not (self.stop_requested or self.paused):
+                self._wakeup.wait(seconds)
+            return self.stop_requested or self.paused
+            
+    def _status(self, text):
+        """Publish a status event"""
+        self.events.publish(StatusEvent(self.scheduler.clock(), text))
+        
+    def _hold(self):
+        """Block while paused; the remaining delay is kept by shifting the schedule"""
+        paused_at = time.monotonic_ns()
+        self.pause_latency_ns = paused_at - self._pause_requested_ns
+        self._status(f"Paused - Loop {self.current_loop}")
+        with self._wakeup:
+            while self.paused and not self.stop_requested:
+                self._wakeup.wait()
+        self.scheduler.shift(time.monotonic_ns() - paused_at)
+        if not self.stop_requested:
+            self._status(f"Running - Loop {self.current_loop}")
+            
+    def _wait(self, ahead=None):
+        """
+        Wait for the scheduler's deadline (or ahead seconds before it),
+        honouring pause and stop requests.
+        
+        Returns:
+            False if the engine should stop, True once the time is reached
+        """
+        while True:
+            if ahead is None:
+                reached = self.scheduler.wait() is not None
+            else:
+                reached = self.scheduler.wait_ahead(ahead)
+            if self.stop_requested:
+                return False
+            if self.paused:
+                self._hold()
+                continue
+            if reached:
+                return True
+                
+    def _wait_condition(self, monitor, index, since):
+        """
+        Poll a plan entry's pixel condition (or idle wait) until it is met
+        or the scheduler's deadline (its timeout) passes, honouring pause
+        and stop requests.
+        
+        Args:
+            monitor: ConditionMonitor or IdleMonitor
+            index: Plan entry
+            since: Start of the wait; earlier frames don't count
+            
+        Returns:
+            True if the condition was met, False on timeout, None if the
+            engine should stop
+        """
+        scheduler = self.scheduler
+        poll = self.condition_poll_ms / 1000
+        while True:
+            if monitor.check(index, since):
+                return True
+            remaining = scheduler.remaining()
+            if remaining <= 0:
+                return False
+            scheduler.sleep(min(poll, remaining))
+            if self.stop_requested:
+                return None
+            if self.paused:
+                self._hold()
+                
+    def _wait_screen(self, checks, plan, i):
+        """
+        Hold plan entry i until its idle wait and pixel condition are met
+        (in that order) or its deadline, their timeout, passes. A click
+        released early has its deadline moved up to now.
+        
+        Returns:
+            False if the engine should stop
+        """
+        scheduler = self.scheduler
+        clock = scheduler.clock
+        since = clock()  # Frames from before the previous click don't count
+        released = None  # The check that let the click go before its deadline
+        if checks.idle is not None and plan.idles[i] is not None:
+            settled = self._wait_condition(checks.idle, i, since)
+            if settled is None:
+                return False
+            if settled:
+                self.idle_hits += 1
+                released = 'idle'
+            else:
+                self.idle_misses += 1
+        if checks.monitor is not None and plan.conditions[i] is not None:
+            matched = self._wait_condition(checks.monitor, i, since)
+            if matched is None:
+                return False
+            if matched:
+                self.condition_hits += 1
+                released = 'condition'
+            else:
+                self.condition_misses += 1
+                released = None
+        if released is not None:
+            saved = max(0, scheduler.deadline_ns - clock())
+            if released == 'idle':
+                self.idle_saved_ns += saved
+            else:
+                self.condition_saved_ns += saved
+            self._loop_saved_ns += saved
+            scheduler.advance_to(clock())
+        return True
+        
+    def _open_vision(self, plan):
+        """
+        Set up screen reading for the plan's pixel conditions, idle waits,
+        template targets and inventory grids.
+        
+        Returns:
+            ScreenChecks: the FrameSource, a started ConditionMonitor and
+            IdleMonitor, a TemplateLocator and a dict of InventoryGrid ->
+            SlotScanner, each None if the plan doesn't need it or the
+            screen can't be read. Without them, conditional clicks and
+            idle waits fire at their timeout, template targets are clicked
+            where they were saved and drop points click every slot.
+        """
+        if not (plan.has_conditions() or plan.has_idles() or plan.has_templates() or plan.has_grids()):
+            return NO_SCREEN_CHECKS
+        if self.frame_source is None and self.clock is not None:
+            return NO_SCREEN_CHECKS  # A simulated run can't see the screen
+        source = monitor = idle = locator = scanners = None
+        try:
+            from .vision import create_source
+            from .vision.idle import IdleMonitor
+            from .vision.inventory import SlotScanner
+            from .vision.probe import ConditionMonitor
+            from .vision.template import TemplateLocator
+            source = self.frame_source if self.frame_source is not None else create_source()
+            interval = self.condition_poll_ms / 1000
+            if plan.has_conditions():
+                monitor = ConditionMonitor(plan.conditions, source, interval, background=self.clock is None)
+                monitor.start()
+            if plan.has_idles():
+                idle = IdleMonitor(plan.idles, source, interval, background=self.clock is None)
+                idle.start()
+            if plan.has_templates():
+                locator = TemplateLocator(plan.templates, zip(plan.xs, plan.ys), source)
+            if plan.has_grids():
+                scanners = {grid: SlotScanner(grid, source) for grid in set(plan.grids) if grid is not None}
+                for scanner in scanners.values():
+                    source.check_region(scanner.region)
+        except Exception as e:
+            self._status(f"Screen checks disabled: {str(e)}")
+            self._close_vision(ScreenChecks(source, monitor, idle, None, None))
+            return NO_SCREEN_CHECKS
+        return ScreenChecks(source, monitor, idle, locator, scanners)
+        
+    def _close_vision(self, checks):
+        """Stop the monitors and close the frame source if the engine opened it"""
+        for monitor in (checks.monitor, checks.idle):
+            if monitor is not None:
+                monitor.stop()
+        if checks.source is not None and checks.source is not self.frame_source:
+            checks.source.close()
+            
+    def _locate(self, locator, plan, i):
+        """
+        Find plan entry i's template target and publish the search.
         
+        Returns:
+            (x, y) to click, or None if the target isn't on screen
+        """
+        clock = self.scheduler.clock
+        start = clock()
+        x, y, score, scope = locator.locate(i)
+        duration = clock() - start
+        locator.durations[i] = duration / NS_PER_SECOND
+        self.events.publish(SearchEvent(clock(), plan.indices[i], x, y, score, scope, duration))
+        return None if scope == 'missed' else (x, y)
+        
+    def _advance(self, plan, i):
+        """Schedule the deadline after plan entry i"""
+        if self.tick_mode:
+            self.tick_clock.advance(self.scheduler, plan.delays[i])
+        else:
+            # Small randomization to delay (±5%)
+            self.scheduler.advance(plan.delay(i))
+            
     def _run(self):
         """Main autoclicker loop"""
+        scheduler = self.scheduler
+        cursor = self.cursor
+        profile = self.performance
+        timing = self.timing
+        clock = scheduler.clock
+        trace = None
+        checks = NO_SCREEN_CHECKS
+        occupied = ()
+        cursor.start()
         try:
-            # Initial delay
-            if self.on_status_change:
-                self.on_status_change(f"Starting in {self.start_delay}s...")
-            time.sleep(self.start_delay)
+            profile.apply()
+            # The precise strategies finish waits on the real clock, so a
+            # virtual clock always uses plain (virtual) sleeps
+            strategy = self.wait_strategy if self.clock is None else 'sleep'
+            scheduler.strategy = create_strategy(strategy, self.wait_margin_ms / 1000)
             
-            enabled_points = [p for p in self.click_points if p.enabled]
-            if not enabled_points:
+            # Compiled before the start delay, so the first click isn't late
+            plan = self.plan = ClickPlan.compile(self.click_points)
+            if not len(plan):
                 self.running = False
-                if self.on_status_change:
-                    self.on_status_change("No enabled click points!")
+                self._status("No enabled click points!")
+                return
+            if self.trace_path:
+                trace = TraceRecorder(self.trace_path)
+            checks = self._open_vision(plan)
+            
+            # Initial delay - every later deadline is measured from here,
+            # so time spent clicking is absorbed instead of accumulating
+            self._status(f"Starting in {self.start_delay}s...")
+            scheduler.start(self.start_delay)
+            if not self._wait():
                 return
+            if self.tick_mode:
+                self.tick_clock.lead_ms = self.tick_lead_ms
+                self.tick_clock.align(scheduler)
             
             while self.running and not self.stop_requested:
                 self.current_loop += 1
                 
+                # Pick up a hot-reloaded config at the loop boundary
+                if self._reload_requested:
+                    self._reload_requested = False
+                    plan = self.plan = ClickPlan.compile(self.click_points)
+                    if not len(plan):
+                        break
+                    self._close_vision(checks)
+                    checks = self._open_vision(plan)
+                        
                 # Check loop count limit
                 if self.loop_count > 0 and self.current_loop > self.loop_count:
                     break
                 
-                if self.on_status_change:
-                    self.on_status_change(f"Running - Loop {self.current_loop}")
+                if self._loop_saved_ns:
+                    self._status(f"Running - Loop {self.current_loop} (loop {self.current_loop - 1} finished "
+                                 f"{self._loop_saved_ns / NS_PER_SECOND:.1f}s early)")
+                else:
+                    self._status(f"Running - Loop {self.current_loop}")
+                self._loop_saved_ns = 0
+                locator = checks.locator
+                scanners = checks.scanners
                 
-                for i, point in enumerate(enabled_points):
+                for i in range(len(plan)):
                     if self.stop_requested:
                         break
-                        
-                    if not point.enabled:
-                        continue
                     
                     # Get position with randomization
-                    pos = point.get_click_position()
+                    pos = plan.position(i)
                     
-                    # Move and click
-                    self.mouse.position = pos
-                    time.sleep(0.05)  # Small delay before click
+                    settle = self.settle_time if self.settle_time is not None else cursor.settle_time()
+                    conditional = ((checks.monitor is not None and plan.conditions[i] is not None)
+                                   or (checks.idle is not None and plan.idles[i] is not None))
+                    searching = locator is not None and plan.templates[i] is not None
+                    if conditional:
+                        # Fire as soon as the screen says so; the deadline is
+                        # only the timeout. The cursor stays put while
+                        # polling so it can't disturb the pixels
+                        if not self._wait_screen(checks, plan, i):
+                            break
+                    elif not self._wait(settle + (locator.budget(i) if searching else 0)):
+                        # Otherwise move shortly before this click's deadline,
+                        # leaving time to find a template target first
+                        break
+                    grid = plan.grids[i]
+                    if grid is not None and scanners is not None:
+                        if i == 0 or plan.grids[i - 1] is not grid:
+                            # One capture decides which slots of this drop get clicked
+                            occupied = scanners[grid].scan()
+                        if not occupied[plan.slots[i]]:
+                            # Empty: deliberately no _advance here, so the
+                            # next slot takes over this one's deadline and the
+                            # skipped slot's delay collapses (slots_saved_ns)
+                            self.slots_skipped += 1
+                            self.slots_saved_ns += int(plan.delays[i] * NS_PER_SECOND)
+                            continue
+                    if searching:
+                        target = self._locate(locator, plan, i)
+                        if target is None:
+                            # Not on screen: skip the click, keep the timeline
+                            self._advance(plan, i)
+                            continue
+                        # Keep the randomization offset around the found target
+                        pos = (pos[0] + target[0] - plan.xs[i], pos[1] + target[1] - plan.ys[i])
+                    # With no settle the move goes out together with the
+                    # click (one flush on XTest), so there is nothing to verify
+                    batched = settle <= 0
+                    if not batched:
+                        cursor.move(*pos)
+                    if conditional:
+                        if not batched:
+                            scheduler.sleep(settle)
+                    elif not self._wait():
+                        # Let the cursor settle until the deadline itself
+                        break
                     
-                    # Verify position before clicking (prevents drift)
-                    if self.verify_position:
-                        actual_pos = self.mouse.position
+                    # Verify position before clicking (prevents drift); this
+                    # only queries the display if foreign motion was seen
+                    actual_pos = pos
+                    if self.verify_position and not batched:
+                        verify_start = clock()
+                        actual_pos = cursor.get_position()
                         if actual_pos != pos:
                             if self.debug_mode:
-                                print(f"[DEBUG] Position drift detected: intended {pos}, actual {actual_pos}")
-                            self.mouse.position = pos
-                            time.sleep(0.01)
+                                self.events.publish(DebugEvent(
+                                    clock(), f"Position drift detected: intended {pos}, actual {actual_pos}"))
+                            cursor.move(*pos)
+                            scheduler.sleep(cursor.settle_time())
+                        timing.verify.record(clock() - verify_start)
                     
-                    self.mouse.click(Button.left)
+                    deadline = scheduler.deadline_ns
+                    click_start = clock()
+                    if batched:
+                        cursor.click_at(*pos)
+                    else:
+                        self.backend.click()
+                    click_end = clock()
                     self.click_count += 1
+                    timing.lateness.record(click_start - deadline)
+                    timing.backend.record(click_end - click_start)
                     
+                    self.events.publish(ClickEvent(click_start, plan.indices[i], pos[0], pos[1], self.click_count,
+                                                   self.current_loop, scheduler.drift_ns))
+                    timing.callback.record(clock() - click_end)
                     if self.debug_mode:
-                        final_pos = self.mouse.position
-                        print(f"[DEBUG] Click #{self.click_count} at {final_pos} (target: {pos})")
-                    
-                    if self.on_click:
-                        self.on_click(i, pos, self.click_count)
+                        final_pos = cursor.get_position()
+                        self.events.publish(DebugEvent(
+                            clock(), f"Click #{self.click_count} at {final_pos} (target: {pos}, "
+                                     f"drift {scheduler.drift_ns / 1e6:+.1f}ms)"))
                     
-                    # Wait for the specified delay before next click
-                    if not self.stop_requested:
-                        # Add small randomization to delay (±5%)
-                        delay_variation = point.delay * 0.05
-                        actual_delay = point.delay + random.uniform(-delay_variation, delay_variation)
-                        time.sleep(max(0.1, actual_delay))
+                    # Schedule the next click relative to this click's deadline,
+                    # not to now, so the overhead above is subtracted from the wait
+                    self._advance(plan, i)
+                    if trace is not None:
+                        trace.record(click_start, plan.indices[i], self.current_loop, pos[0], pos[1], actual_pos[0], actual_pos[1],
+                                     actual_pos != pos, scheduler.deadline_ns - deadline, click_start - deadline)
                 
-                if self.on_loop_complete:
-                    self.on_loop_complete(self.current_loop)
+                # Garbage is collected here (if GC control is on), between
+                # sequences rather than in the middle of one
+                profile.between_loops()
+                plan.next_pass()
+                self.events.publish(LoopEvent(clock(), self.current_loop, self._loop_saved_ns))
                     
         except Exception as e:
-            if self.on_status_change:
-                self.on_status_change(f"Error: {str(e)}")
+            self._status(f"Error: {str(e)}")
         finally:
+            scheduler.strategy.close()
+            if trace is not None:
+                trace.close()
+            self._close_vision(checks)
+            profile.restore()
+            cursor.stop()
             self.running = False
-            if self.on_status_change:
-                self.on_status_change("Stopped")
+            self.paused = False
+            if self.stop_requested:
+                self.stop_latency_ns = time.monotonic_ns() - self._stop_requested_ns
+            self._status("Stopped")
                 
     def save_config(self, filepath, name="", description=""):
         """Save configuration to JSON file with name and description"""
         config = {
             'name': name,
             'description': description,
-            'start_delay': self.start_delay,
-            'loop_count': self.loop_count,
-            'click_points': [p.to_dict() for p in self.click_points],
+            **self.get_config(),
             'saved_at': datetime.now().isoformat()
         }
         with open(filepath, 'w') as f:
             json.dump(config, f, indent=2)
             
+    def get_config(self):
+        """Get the current configuration as a dict (the inverse of apply_config)"""
+        return {
+            'start_delay': self.start_delay,
+            'loop_count': self.loop_count,
+            'tick_mode': self.tick_mode,
+            'tick_lead_ms': self.tick_lead_ms,
+            'click_points': self.click_points.to_dicts(),
+        }
+            
     def load_config(self, filepath):
         """Load configuration from JSON file"""
         with open(filepath, 'r') as f:
             config = json.load(f)
+        self.apply_config(config)
+        return config
         
+    def apply_config(self, config):
+        """Apply a configuration dict (as saved by save_config)"""
         self.start_delay = config.get('start_delay', 3.0)
         self.loop_count = config.get('loop_count', 0)
-        self.click_points = [ClickPoint.from_dict(p) for p in config.get('click_points', [])]
+        self.tick_mode = config.get('tick_mode', False)
+        self.tick_lead_ms = config.get('tick_lead_ms', 50.0)
+        self.click_points = PointTable.from_dicts(config.get('click_points', []))
+        
+    def reload_config(self, filepath):
+        """
+        Load a configuration, applying it to a running engine at the next
+        loop boundary (the current loop finishes with the old points).
+        """
+        config = self.load_config(filepath)
+        self.request_reload()
         return config
+        
+    def request_reload(self):
+        """Recompile the click plan from click_points at the next loop boundary"""
+        self._reload_requested = self.running
@@ -0,0 +1,118 @@
+"""
+Cursor tracking module.
+
+This module contains the CursorTracker class which keeps a cheap model
+of the cursor position, so the engine only asks the display server where
+the cursor is when something other than the engine may have moved it.
+The adaptive settle time is derived from real display round trips
+(position queries), not from sending a move, which only queues it.
+"""
+
+import time
+
+ROUND_TRIPS = 3  # Position queries timed at start to seed the settle time
+
+
+class CursorTracker:
+    """Cached cursor position with foreign-motion detection"""
+    
+    def __init__(self, backend, min_settle=0.002, max_settle=0.05, clock=time.perf_counter_ns):
+        """
+        Initialize the tracker.
+        
+        Args:
+            backend: InputBackend used for moves and real position queries
+            min_settle: Shortest adaptive settle time in seconds
+            max_settle: Longest adaptive settle time in seconds
+            clock: Function returning a high-resolution time in nanoseconds
+        """
+        self.backend = backend
+        self.min_settle = min_settle
+        self.max_settle = max_settle
+        self.clock = clock
+        self.position = None  # Last known position, None = unknown
+        self.listening = False  # True while a passive motion listener feeds us
+        self.foreign_motion = True  # Something else may have moved the cursor
+        self.ack_ns = 0.0  # Smoothed display round-trip latency (position queries)
+        self.queries = 0
+        self.skipped_queries = 0
+        self.foreign_events = 0
+        self._expected = None
+        
+    def start(self):
+        """Start passive motion tracking if the backend supports it and time the display"""
+        self.position = None
+        self.foreign_motion = True
+        self.listening = self.backend.watch_motion(self._on_motion)
+        # A query has to wait for the server to answer, after every request
+        # sent before it, so it times a real round trip
+        try:
+            for _ in range(ROUND_TRIPS):
+                self._query()
+        except Exception:
+            self.position = None  # Left to the first real query (or the minimum settle)
+        
+    def stop(self):
+        """Stop passive motion tracking"""
+        if self.listening:
+            self.backend.unwatch_motion()
+            self.listening = False
+            
+    def move(self, x, y):
+        """Move the cursor and trust the new position without reading it back"""
+        # Set the expectation first - the listener may echo the move at once
+        self._expected = (x, y)
+        self.position = (x, y)
+        # Not timed: a move is only written to the request buffer, so its
+        # duration says nothing about when the server has processed it
+        self.backend.move(x, y)
+        
+    def click_at(self, x, y, button='left'):
+        """Move the cursor and click in one backend call (one batch where the backend supports it)"""
+        self._expected = (x, y)
+        self.position = (x, y)
+        self.backend.click_at(x, y, button)
+        
+    def get_position(self):
+        """Get the cursor position, querying the backend only when needed"""
+        if self.listening and not self.foreign_motion and self.position is not None:
+            self.skipped_queries += 1
+            return self.position
+        return self._query()
+        
+    def _query(self):
+        """Read the real position from the backend, timing the round trip"""
+        start = self.clock()
+        self.position = self.backend.get_position()
+        self._record_ack(self.clock() - start)
+        self.queries += 1
+        self.foreign_motion = False
+        return self.position
+        
+    def settle_time(self):
+        """Adaptive pre-click settle time in seconds: four display round trips, within the limits"""
+        settle = self.ack_ns * 4 / 1e9
+        return min(self.max_settle, max(self.min_settle, settle))
+        
+    def _record_ack(self, ns):
+        """Fold one backend round trip into the smoothed latency"""
+        if self.ack_ns:
+            self.ack_ns += (ns - self.ack_ns) * 0.1
+        else:
+            self.ack_ns = float(ns)
+            
+    def _on_motion(self, x, y):
+        """Passive listener callback (may run on another thread)"""
+        if (x, y) != self._expected:
+            self.foreign_events += 1
+            self.foreign_motion = True
+        self.position = (x, y)
+        
+    def get_stats(self):
+        """Get tracking statistics"""
+        return {
+            'cursor_queries': self.queries,
+            'cursor_queries_skipped': self.skipped_queries,
+            'foreign_motion_events': self.foreign_events,
+            'settle_ms': self.settle_time() * 1000,
+        }
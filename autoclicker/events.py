@@ -0,0 +1,279 @@
+"""
+Engine event bus module.
+
+The click engine publishes typed events into per-subscriber bounded
+queues and never waits on subscribers. Each subscriber drains its queue
+at its own rate; when it falls behind, its drop policy decides what is
+lost. Click timing is therefore independent of how many observers are
+attached or how slow they are.
+"""
+
+import os
+import threading
+import time
+from collections import deque, namedtuple
+
+StatusEvent = namedtuple('StatusEvent', 'timestamp_ns text')
+ClickEvent = namedtuple('ClickEvent', 'timestamp_ns index x y count loop drift_ns')
+# saved_ns: time screen checks cut from the loop's delays
+LoopEvent = namedtuple('LoopEvent', 'timestamp_ns loop saved_ns')
+DebugEvent = namedtuple('DebugEvent', 'timestamp_ns text')
+# scope: where a template target was found - 'local', 'global' or 'missed'
+SearchEvent = namedtuple('SearchEvent', 'timestamp_ns point x y score scope duration_ns')
+
+# Drop policies
+DROP_OLDEST = 'drop_oldest'  # Keep the most recent maxlen events
+DROP_NEWEST = 'drop_newest'  # Keep the first maxlen events, refuse new ones
+COALESCE = 'coalesce'  # Keep only the latest event of each type
+
+
+class Subscription:
+    """Bounded, non-blocking event queue for one subscriber"""
+    
+    def __init__(self, name, maxlen=1024, policy=DROP_OLDEST, types=None):
+        """
+        Initialize the subscription.
+        
+        Args:
+            name: Subscriber name (for stats)
+            maxlen: Queue capacity (ignored for COALESCE)
+            policy: DROP_OLDEST, DROP_NEWEST or COALESCE
+            types: Event types to receive (None = all)
+        """
+        if policy not in (DROP_OLDEST, DROP_NEWEST, COALESCE):
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.name = name
+        self.maxlen = maxlen
+        self.policy = policy
+        self.types = tuple(types) if types else None
+        self.dropped = 0
+        self.on_ready = None  # Called (on the publisher's thread) when events become available
+        self._queue = deque(maxlen=maxlen if policy == DROP_OLDEST else None)
+        self._latest = {}
+        self._ready = False
+        
+    def offer(self, event):
+        """Queue an event without ever blocking (called on the publisher's thread)"""
+        if self.types and not isinstance(event, self.types):
+            return
+        if self.policy == COALESCE:
+            # Replacing a dict entry is atomic under the GIL
+            if type(event) in self._latest:
+                self.dropped += 1
+            self._latest[type(event)] = event
+        elif self.policy == DROP_OLDEST:
+            if len(self._queue) >= self.maxlen:
+                self.dropped += 1
+            self._queue.append(event)  # deque drops the oldest itself
+        elif len(self._queue) >= self.maxlen:
+            self.dropped += 1
+        else:
+            self._queue.append(event)
+        # Notify once per batch: drain() clears the flag before taking events,
+        # so an event queued after that always triggers a fresh notification
+        if not self._ready:
+            self._ready = True
+            if self.on_ready:
+                self.on_ready()
+                
+    def drain(self):
+        """Take every queued event, oldest first"""
+        self._ready = False
+        if self.policy == COALESCE:
+            events = []
+            for event_type in list(self._latest):
+                event = self._latest.pop(event_type, None)
+                if event is not None:
+                    events.append(event)
+            events.sort(key=lambda e: e.timestamp_ns)
+            return events
+        events = []
+        popleft = self._queue.popleft
+        try:
+            while True:
+                events.append(popleft())
+        except IndexError:
+            return events
+            
+    def __len__(self):
+        return len(self._latest) if self.policy == COALESCE else len(self._queue)
+
+
+class EventBus:
+    """Fan-out of engine events to subscriptions"""
+    
+    def __init__(self):
+        # Replaced (never mutated) on subscribe/unsubscribe, so publish()
+        # can iterate it without a lock
+        self._subscriptions = ()
+        self._lock = threading.Lock()
+        
+    def subscribe(self, name, maxlen=1024, policy=DROP_OLDEST, types=None):
+        """Create and attach a subscription (see Subscription for arguments)"""
+        subscription = Subscription(name, maxlen, policy, types)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+        
+    def attach(self, sink):
+        """
+        Attach a synchronous sink: any object with name, dropped and a
+        non-blocking offer(event), called on the publisher's thread.
+        """
+        with self._lock:
+            self._subscriptions = self._subscriptions + (sink,)
+        return sink
+        
+    def unsubscribe(self, subscription):
+        """Detach a subscription"""
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+            
+    def publish(self, event):
+        """Offer an event to every subscription; never blocks"""
+        for subscription in self._subscriptions:
+            subscription.offer(event)
+            
+    def get_stats(self):
+        """Dropped-event counts per subscriber"""
+        return {s.name: s.dropped for s in self._subscriptions}
+
+
+class EventConsumer:
+    """Base class for subscribers that drain the bus on their own thread"""
+    
+    def __init__(self, bus, name, interval=1.0, maxlen=4096, policy=DROP_OLDEST, types=None):
+        """
+        Initialize the consumer.
+        
+        Args:
+            bus: EventBus to subscribe to
+            name: Subscriber name
+            interval: Seconds between drains
+            maxlen, policy, types: Subscription settings
+        """
+        self.bus = bus
+        self.interval = interval
+        self.subscription = bus.subscribe(name, maxlen, policy, types)
+        self.thread = None
+        self._stop = threading.Event()
+        
+    def start(self):
+        """Start draining in a daemon thread"""
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+        
+    def stop(self):
+        """Drain once more, stop the thread and unsubscribe"""
+        self._stop.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        self.bus.unsubscribe(self.subscription)
+        
+    def _run(self):
+        """Drain loop"""
+        while not self._stop.wait(self.interval):
+            self.handle(self.subscription.drain())
+        self.handle(self.subscription.drain())
+        self.close()
+        
+    def handle(self, events):
+        """Process a batch of events (may be empty)"""
+        raise NotImplementedError
+        
+    def close(self):
+        """Release resources after the last batch"""
+        pass
+
+
+def format_event(event):
+    """Format an event as a single log line"""
+    if isinstance(event, ClickEvent):
+        return (f"Click #{event.count} at ({event.x}, {event.y}) point {event.index + 1} "
+                f"loop {event.loop} drift {event.drift_ns / 1e6:+.1f}ms")
+    if isinstance(event, LoopEvent):
+        if event.saved_ns:
+            return f"Loop {event.loop} complete ({event.saved_ns / 1e9:.1f}s saved by screen checks)"
+        return f"Loop {event.loop} complete"
+    if isinstance(event, SearchEvent):
+        return (f"Point {event.point + 1} target {event.scope} at ({event.x}, {event.y}) "
+                f"score {event.score:.2f} in {event.duration_ns / 1e6:.1f}ms")
+    if isinstance(event, DebugEvent):
+        return f"[DEBUG] {event.text}"
+    return event.text
+
+
+class ConsoleLogger(EventConsumer):
+    """Prints events to stdout"""
+    
+    def __init__(self, bus, types=(StatusEvent, DebugEvent), interval=0.1, prefix=""):
+        super().__init__(bus, 'console', interval, types=types)
+        self.prefix = prefix
+        
+    def handle(self, events):
+        """Print each event"""
+        if events:
+            print('\n'.join(self.prefix + format_event(e) for e in events), flush=True)
+            if self.subscription.dropped:
+                print(f"{self.prefix}({self.subscription.dropped} events dropped so far)", flush=True)
+
+
+class FileLogger(EventConsumer):
+    """Appends every event to a log file, one line each"""
+    
+    def __init__(self, bus, path, interval=1.0, maxlen=65536):
+        super().__init__(bus, 'file', interval, maxlen)
+        self.file = open(path, 'a')
+        self.wall_offset = time.time() - time.monotonic_ns() / 1e9
+        
+    def handle(self, events):
+        """Write a batch of events"""
+        for event in events:
+            stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.wall_offset + event.timestamp_ns / 1e9))
+            self.file.write(f"{stamp} {format_event(event)}\n")
+        if events:
+            self.file.flush()
+            
+    def close(self):
+        """Close the log file"""
+        self.file.close()
+
+
+class MetricsExporter(EventConsumer):
+    """Keeps running totals and writes them as a Prometheus text file"""
+    
+    def __init__(self, bus, path, interval=5.0):
+        super().__init__(bus, 'metrics', interval, maxlen=65536)
+        self.path = path
+        self.clicks = 0
+        self.loops = 0
+        self.drift_ms = 0.0
+        self.max_drift_ms = 0.0
+        self.saved_s = 0.0
+        
+    def handle(self, events):
+        """Fold a batch into the totals and rewrite the metrics file"""
+        for event in events:
+            if isinstance(event, ClickEvent):
+                self.clicks = event.count
+                self.drift_ms = event.drift_ns / 1e6
+                self.max_drift_ms = max(self.max_drift_ms, self.drift_ms)
+            elif isinstance(event, LoopEvent):
+                self.loops = event.loop
+                self.saved_s += event.saved_ns / 1e9
+        lines = [
+            f"autoclicker_clicks_total {self.clicks}",
+            f"autoclicker_loops_total {self.loops}",
+            f"autoclicker_drift_ms {self.drift_ms:.3f}",
+            f"autoclicker_max_drift_ms {self.max_drift_ms:.3f}",
+            f"autoclicker_saved_seconds_total {self.saved_s:.3f}",
+        ]
+        lines += [f'autoclicker_events_dropped_total{{subscriber="{name}"}} {dropped}'
+                  for name, dropped in self.bus.get_stats().items()]
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
@@ -1,9 +1,20 @@
 """
 GUI package for the OSRS AutoClicker.
 
-Contains all UI components and the main application window.
+Contains all UI components and the main application window. The window
+is imported on first access, so the GUI's Tk-only helpers (such as the
+status model) can be used without loading pynput.
 """
 
-from .main_window import AutoClickerGUI
+import importlib
 
 __all__ = ['AutoClickerGUI']
+
+
+def __getattr__(name):
+    """Import the main window on first access"""
+    if name != 'AutoClickerGUI':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module('.main_window', __name__).AutoClickerGUI
+    globals()[name] = value
+    return value
@@ -10,13 +10,14 @@ import tkinter as tk
 from datetime import datetime
 from tkinter import messagebox, ttk
 
-from ..utils import get_configs_dir
+from ..catalog import ConfigCatalog
+from ..watcher import ConfigWatcher
 
 
 class ConfigPanel:
     """Panel for managing saved configurations"""
     
-    def __init__(self, parent, autoclicker, on_config_loaded):
+    def __init__(self, parent, autoclicker, on_config_loaded, on_status_change=None):
         """
         Initialize the config panel.
         
@@ -24,12 +25,18 @@ class ConfigPanel:
             parent: Parent tkinter widget (frame)
             autoclicker: AutoClicker instance
             on_config_loaded: Callback when config is loaded (receives config dict)
+            on_status_change: Callback for status updates
         """
         self.autoclicker = autoclicker
         self.on_config_loaded = on_config_loaded
         self.config_tree = None
         self.current_config_path = None
         self.current_config_name = None
+        self.on_status_change = on_status_change
+        self.catalog = None  # Created on first refresh
+        self.watcher = None
+        self.hot_reload_var = None
+        self.error_label = None
         
         self._build_panel(parent)
         
@@ -66,9 +73,15 @@ class ConfigPanel:
         self.config_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         config_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        # Invalid config files are shown in red, with the error as description
+        self.config_tree.tag_configure('invalid', foreground='#cc0000')
+        
         # Bind double-click to load
         self.config_tree.bind('<Double-1>', self._on_double_click)
         
+        self.error_label = ttk.Label(config_frame, text="", foreground='#cc0000')
+        self.error_label.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+        
         # Config buttons
         config_btn_frame = ttk.Frame(config_frame)
         config_btn_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E))
@@ -79,6 +92,10 @@ class ConfigPanel:
         ttk.Button(config_btn_frame, text="🗑️ Delete Selected", command=self.delete_selected).pack(side=tk.LEFT)
         ttk.Button(config_btn_frame, text="🔄 Refresh", command=self.refresh).pack(side=tk.RIGHT)
         
+        self.hot_reload_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(config_btn_frame, text="Hot-reload loaded config while running",
+                       variable=self.hot_reload_var).pack(side=tk.RIGHT, padx=(0, 10))
+                       
     def _show_save_dialog_callback(self):
         """Trigger the save dialog callback"""
         if self.on_config_loaded:
@@ -90,39 +107,100 @@ class ConfigPanel:
         self.load_selected()
         
     def refresh(self):
-        """Refresh the list of saved configurations"""
-        # Clear existing
-        for item in self.config_tree.get_children():
-            self.config_tree.delete(item)
+        """Refresh the list of saved configurations, re-reading only changed files"""
+        if self.catalog is None:
+            self.catalog = ConfigCatalog()
+        self.catalog.scan()
+        self._sync_tree()
+        
+    def start_watching(self):
+        """Watch the configs directory and apply changes as they happen"""
+        if self.catalog is None:
+            self.catalog = ConfigCatalog()
+        self.watcher = ConfigWatcher(self.catalog.configs_dir, self._on_files_changed)
+        self.watcher.start()
         
-        configs_dir = get_configs_dir()
-        if not os.path.exists(configs_dir):
+    def stop_watching(self):
+        """Stop the directory watcher"""
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+            
+    def _on_files_changed(self, filenames):
+        """Watcher callback (runs on the watcher thread) - hand over to Tk"""
+        self.config_tree.after(0, lambda: self._apply_file_changes(filenames))
+        
+    def _apply_file_changes(self, filenames):
+        """Update only the changed configs, hot-reloading the loaded one if asked to"""
+        changes = self.catalog.scan(filenames)
+        if not changes:
             return
+        self._sync_tree()
+        
+        if not self.current_config_path or not self.autoclicker.running:
+            return
+        current = os.path.basename(self.current_config_path)
+        if current not in changes.updated:
+            return
+        if not self.hot_reload_var.get():
+            self._status(f"'{self.current_config_name}' changed on disk - enable hot-reload to apply it")
+            return
+        try:
+            config = self.autoclicker.reload_config(self.current_config_path)
+        except Exception as e:
+            self._status(f"Hot-reload failed: {str(e)}")
+            return
+        self.current_config_name = config.get('name', 'Unnamed')
+        if self.on_config_loaded:
+            self.on_config_loaded(config)
+        self._status(f"Hot-reloaded '{self.current_config_name}' - applies from the next loop")
+        
+    def _status(self, text):
+        """Report a status message if a status callback was given"""
+        if self.on_status_change:
+            self.on_status_change(text)
+            
+    def _sync_tree(self):
+        """Add, update and remove treeview rows to match the catalog"""
+        entries = self.catalog.sorted_entries()
+        wanted = {self.catalog.path(filename) for filename, _ in entries}
+        
+        # Remove rows for configs that no longer exist
+        stale = [item for item in self.config_tree.get_children() if item not in wanted]
+        if stale:
+            self.config_tree.delete(*stale)
+            
+        # Rows are keyed by file path (the item id) and kept in filename order
+        for index, (filename, entry) in enumerate(entries):
+            filepath = self.catalog.path(filename)
+            values, tags = self._row_for(filename, entry)
+            if not self.config_tree.exists(filepath):
+                self.config_tree.insert('', index, iid=filepath, values=values, tags=tags)
+            elif tuple(map(str, self.config_tree.item(filepath, 'values'))) != tuple(map(str, values)):
+                self.config_tree.item(filepath, values=values, tags=tags)
+                
+        invalid = self.catalog.invalid()
+        if invalid:
+            names = ', '.join(filename for filename, _ in invalid)
+            self.error_label.configure(text=f"⚠ {len(invalid)} invalid config file(s): {names}")
+        else:
+            self.error_label.configure(text="")
+            
+    def _row_for(self, filename, entry):
+        """Treeview values and tags for one catalog entry"""
+        if entry['error']:
+            return (filename, f"Invalid config: {entry['error']}", '-', 'Invalid'), ('invalid',)
+            
+        saved_at = entry['saved_at']
+        # Format date for display
+        if saved_at != 'Unknown':
+            try:
+                dt = datetime.fromisoformat(saved_at)
+                saved_at = dt.strftime('%Y-%m-%d %H:%M')
+            except (TypeError, ValueError):
+                pass
+        return (entry['name'], entry['description'], entry['points'], saved_at), ()
         
-        # Load each config file and add to tree
-        for filename in sorted(os.listdir(configs_dir)):
-            if filename.endswith('.json'):
-                filepath = os.path.join(configs_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        config = json.load(f)
-                    
-                    name = config.get('name', filename)
-                    description = config.get('description', '')
-                    points = len(config.get('click_points', []))
-                    saved_at = config.get('saved_at', 'Unknown')
-                    # Format date for display
-                    if saved_at != 'Unknown':
-                        try:
-                            dt = datetime.fromisoformat(saved_at)
-                            saved_at = dt.strftime('%Y-%m-%d %H:%M')
-                        except:
-                            pass
-                    
-                    self.config_tree.insert('', tk.END, values=(name, description, points, saved_at), tags=(filepath,))
-                except:
-                    pass  # Skip invalid config files
-                    
     def load_selected(self):
         """Load the selected configuration"""
         selection = self.config_tree.selection()
@@ -130,7 +208,7 @@ class ConfigPanel:
             messagebox.showinfo("Info", "Please select a configuration to load")
             return
         
-        filepath = self.config_tree.item(selection[0], 'tags')[0]
+        filepath = selection[0]
         
         try:
             config = self.autoclicker.load_config(filepath)
@@ -182,7 +260,7 @@ class ConfigPanel:
             messagebox.showinfo("Info", "Please select a configuration to delete")
             return
         
-        filepath = self.config_tree.item(selection[0], 'tags')[0]
+        filepath = selection[0]
         name = self.config_tree.item(selection[0], 'values')[0]
         
         if messagebox.askyesno("Confirm", f"Delete configuration '{name}'?"):
@@ -9,6 +9,7 @@ import tkinter as tk
 from datetime import datetime
 from tkinter import messagebox, ttk
 
+from ..models import ClickPoint, IdleWait, InventoryGrid, PixelCondition, TemplateTarget
 from ..utils import get_configs_dir
 
 
@@ -29,7 +30,7 @@ class EditPointDialog:
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Edit Click Point")
-        self.dialog.geometry("300x280")
+        self.dialog.geometry("340x760")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
@@ -69,14 +70,182 @@ class EditPointDialog:
         self.enabled_var = tk.BooleanVar(value=self.point.enabled)
         ttk.Checkbutton(frame, text="Enabled", variable=self.enabled_var).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
         
+        # Pixel condition (the first pixel; more can be added in the config file)
+        condition = self.point.condition
+        px, py, color = condition.pixels[0] if condition else (self.point.x, self.point.y, (0, 0, 0))
+        self.condition_var = tk.BooleanVar(value=condition is not None)
+        ttk.Checkbutton(frame, text="Wait for pixel colour", variable=self.condition_var).grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        ttk.Label(frame, text="Fires as soon as it matches; the previous delay is the timeout", foreground='gray', wraplength=300).grid(row=7, column=0, columnspan=2, sticky=tk.W)
+        
+        ttk.Label(frame, text="Pixel X:").grid(row=8, column=0, sticky=tk.W)
+        self.pixel_x_var = tk.IntVar(value=px)
+        ttk.Spinbox(frame, from_=0, to=9999, textvariable=self.pixel_x_var, width=10).grid(row=8, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Pixel Y:").grid(row=9, column=0, sticky=tk.W)
+        self.pixel_y_var = tk.IntVar(value=py)
+        ttk.Spinbox(frame, from_=0, to=9999, textvariable=self.pixel_y_var, width=10).grid(row=9, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Colour:").grid(row=10, column=0, sticky=tk.W)
+        self.color_var = tk.StringVar(value='#%02x%02x%02x' % color)
+        color_frame = ttk.Frame(frame)
+        color_frame.grid(row=10, column=1, sticky=tk.W, pady=2)
+        ttk.Entry(color_frame, textvariable=self.color_var, width=10).pack(side=tk.LEFT)
+        ttk.Button(color_frame, text="Sample", command=self._sample_color).pack(side=tk.LEFT, padx=(5, 0))
+        
+        ttk.Label(frame, text="Tolerance:").grid(row=11, column=0, sticky=tk.W)
+        self.tolerance_var = tk.IntVar(value=condition.tolerance if condition else 10)
+        ttk.Spinbox(frame, from_=0, to=255, textvariable=self.tolerance_var, width=10).grid(row=11, column=1, sticky=tk.W, pady=2)
+        
+        if condition is not None and len(condition.pixels) > 1:
+            ttk.Label(frame, text=f"+ {len(condition.pixels) - 1} more pixel(s) from the config file", foreground='gray').grid(row=12, column=0, columnspan=2, sticky=tk.W)
+            
+        # Template target (captured in rapid add mode or with the Capture button)
+        template = self.point.template
+        self.captured = template
+        self.template_var = tk.BooleanVar(value=template is not None)
+        template_frame = ttk.Frame(frame)
+        template_frame.grid(row=13, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        ttk.Checkbutton(template_frame, text="Find target by image", variable=self.template_var).pack(side=tk.LEFT)
+        ttk.Button(template_frame, text="Capture", command=self._capture_template).pack(side=tk.LEFT, padx=(5, 0))
+        self.template_info = ttk.Label(frame, foreground='gray', wraplength=300)
+        self.template_info.grid(row=14, column=0, columnspan=2, sticky=tk.W)
+        self._show_template()
+        
+        ttk.Label(frame, text="Match threshold:").grid(row=15, column=0, sticky=tk.W)
+        self.threshold_var = tk.DoubleVar(value=template.threshold if template else 0.8)
+        ttk.Spinbox(frame, from_=0.1, to=1.0, increment=0.05, textvariable=self.threshold_var, width=10).grid(row=15, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Search radius:").grid(row=16, column=0, sticky=tk.W)
+        self.radius_var = tk.IntVar(value=template.search_radius if template else 64)
+        ttk.Spinbox(frame, from_=0, to=2000, increment=8, textvariable=self.radius_var, width=10).grid(row=16, column=1, sticky=tk.W, pady=2)
+        
+        # Idle wait (a region around the point until one is set)
+        idle = self.point.idle
+        region = idle.region() if idle else (self.point.x - 50, self.point.y - 50, 100, 100)
+        self.idle_var = tk.BooleanVar(value=idle is not None)
+        ttk.Checkbutton(frame, text="Wait until the screen settles", variable=self.idle_var).grid(row=17, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        ttk.Label(frame, text="Watches the region from the previous click; the previous delay is the timeout", foreground='gray', wraplength=300).grid(row=18, column=0, columnspan=2, sticky=tk.W)
+        
+        ttk.Label(frame, text="Region X, Y:").grid(row=19, column=0, sticky=tk.W)
+        self.idle_region_vars = [tk.IntVar(value=v) for v in region]
+        origin_frame = ttk.Frame(frame)
+        origin_frame.grid(row=19, column=1, sticky=tk.W, pady=2)
+        ttk.Label(frame, text="Width, height:").grid(row=20, column=0, sticky=tk.W)
+        size_frame = ttk.Frame(frame)
+        size_frame.grid(row=20, column=1, sticky=tk.W, pady=2)
+        for parent_frame, var in zip((origin_frame, origin_frame, size_frame, size_frame), self.idle_region_vars):
+            ttk.Spinbox(parent_frame, from_=0, to=9999, textvariable=var, width=5).pack(side=tk.LEFT, padx=(0, 5))
+            
+        ttk.Label(frame, text="Until:").grid(row=21, column=0, sticky=tk.W)
+        self.idle_mode_var = tk.StringVar(value=idle.mode if idle else 'idle')
+        ttk.Combobox(frame, textvariable=self.idle_mode_var, values=IdleWait.MODES, state='readonly', width=10).grid(row=21, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Still frames:").grid(row=22, column=0, sticky=tk.W)
+        self.idle_frames_var = tk.IntVar(value=idle.frames if idle else 5)
+        ttk.Spinbox(frame, from_=1, to=100, textvariable=self.idle_frames_var, width=10).grid(row=22, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Motion threshold:").grid(row=23, column=0, sticky=tk.W)
+        self.idle_threshold_var = tk.DoubleVar(value=idle.threshold if idle else 3.0)
+        ttk.Spinbox(frame, from_=0.5, to=100.0, increment=0.5, textvariable=self.idle_threshold_var, width=10).grid(row=23, column=1, sticky=tk.W, pady=2)
+        
         # Buttons
         btn_frame = ttk.Frame(self.dialog)
         btn_frame.pack(pady=10)
         ttk.Button(btn_frame, text="Save", command=self._save).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(btn_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT)
         
+    def _sample_color(self):
+        """Fill in the colour the screen shows at the pixel right now"""
+        try:
+            from ..vision import create_source
+            source = create_source()
+            try:
+                frame = source.grab((self.pixel_x_var.get(), self.pixel_y_var.get(), 1, 1))
+                b, g, r = (int(v) for v in frame.pixels[0, 0, :3])
+            finally:
+                source.close()
+        except Exception as e:
+            messagebox.showerror("Error", f"Cannot read the screen: {str(e)}", parent=self.dialog)
+            return
+        self.color_var.set('#%02x%02x%02x' % (r, g, b))
+        self.condition_var.set(True)
+        
+    def _show_template(self):
+        """Describe the captured template under its checkbox"""
+        if self.captured is None:
+            self.template_info.config(text="No image yet - Capture grabs the patch around X, Y")
+        else:
+            self.template_info.config(text=f"{self.captured.width}x{self.captured.height} patch; clicks where it is found, skips the click when it isn't")
+            
+    def _capture_template(self):
+        """Capture the patch the screen shows around X, Y right now"""
+        try:
+            from ..vision import create_source
+            from ..vision.template import capture_template
+            source = create_source()
+            try:
+                self.captured = capture_template(source, self.x_var.get(), self.y_var.get())
+            finally:
+                source.close()
+        except Exception as e:
+            messagebox.showerror("Error", f"Cannot capture the target: {str(e)}", parent=self.dialog)
+            return
+        self.template_var.set(True)
+        self._show_template()
+        
+    def _build_template(self):
+        """TemplateTarget from the form (None when unticked or nothing was captured)"""
+        if not self.template_var.get() or self.captured is None:
+            return None
+        t = self.captured
+        return TemplateTarget(t.width, t.height, t.pixels, t.anchor_x, t.anchor_y,
+                              self.threshold_var.get(), self.radius_var.get())
+                              
+    def _build_idle(self):
+        """IdleWait from the form (None when unticked)"""
+        if not self.idle_var.get():
+            return None
+        x, y, width, height = (var.get() for var in self.idle_region_vars)
+        return IdleWait(x, y, width, height, self.idle_mode_var.get(), self.idle_frames_var.get(),
+                        self.idle_threshold_var.get())
+                        
+    def _build_condition(self):
+        """PixelCondition from the form (None when unticked)"""
+        if not self.condition_var.get():
+            return None
+        value = self.color_var.get().strip().lstrip('#')
+        if len(value) != 6:
+            raise ValueError(f"Colour must look like #rrggbb, not {self.color_var.get()}")
+        color = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+        others = self.point.condition.pixels[1:] if self.point.condition else ()
+        match = self.point.condition.match if self.point.condition else 'all'
+        return PixelCondition([(self.pixel_x_var.get(), self.pixel_y_var.get(), color), *others],
+                              self.tolerance_var.get(), match)
+                              
     def _save(self):
         """Save changes and close dialog"""
+        try:
+            condition = self._build_condition()
+        except ValueError:
+            messagebox.showerror("Error", "Colour must be a hex value like #1a2b3c", parent=self.dialog)
+            return
+        try:
+            template = self._build_template()
+        except tk.TclError:
+            messagebox.showerror("Error", "Match threshold and search radius must be numbers", parent=self.dialog)
+            return
+        try:
+            idle = self._build_idle()
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Error", "The idle wait needs a non-empty region and numeric settings", parent=self.dialog)
+            return
+        if self.point.inventory is not None:
+            # Moving a drop point moves its whole grid
+            self.point.inventory = self.point.inventory.translate(self.x_var.get() - self.point.x,
+                                                                  self.y_var.get() - self.point.y)
+        self.point.condition = condition
+        self.point.template = template
+        self.point.idle = idle
         self.point.x = self.x_var.get()
         self.point.y = self.y_var.get()
         self.point.delay = self.delay_var.get()
@@ -87,6 +256,238 @@ class EditPointDialog:
         self.dialog.destroy()
 
 
+class TransformPointsDialog:
+    """Dialog for moving, scaling and re-timing all click points at once"""
+    
+    def __init__(self, parent, table, on_apply_callback):
+        """
+        Initialize the transform dialog.
+        
+        Args:
+            parent: Parent tkinter widget
+            table: PointTable to transform
+            on_apply_callback: Function to call after the transform is applied
+        """
+        self.table = table
+        self.on_apply = on_apply_callback
+        
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Transform Click Points")
+        self.dialog.geometry("320x260")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        
+        self._build_form()
+        
+    def _build_form(self):
+        """Build the form fields"""
+        frame = ttk.Frame(self.dialog, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Offset (e.g. after moving the game window)
+        ttk.Label(frame, text="Move X by:").grid(row=0, column=0, sticky=tk.W)
+        self.dx_var = tk.IntVar(value=0)
+        dx_spinbox = ttk.Spinbox(frame, from_=-9999, to=9999, textvariable=self.dx_var, width=10)
+        dx_spinbox.grid(row=0, column=1, sticky=tk.W, pady=2)
+        dx_spinbox.focus()
+        
+        ttk.Label(frame, text="Move Y by:").grid(row=1, column=0, sticky=tk.W)
+        self.dy_var = tk.IntVar(value=0)
+        ttk.Spinbox(frame, from_=-9999, to=9999, textvariable=self.dy_var, width=10).grid(row=1, column=1, sticky=tk.W, pady=2)
+        
+        # Scale (e.g. after resizing the game client)
+        ttk.Label(frame, text="Scale:").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
+        self.scale_var = tk.DoubleVar(value=1.0)
+        ttk.Spinbox(frame, from_=0.1, to=10.0, increment=0.05, textvariable=self.scale_var, width=10).grid(row=2, column=1, sticky=tk.W, pady=(10, 2))
+        
+        ttk.Label(frame, text="Scale origin X, Y:").grid(row=3, column=0, sticky=tk.W)
+        origin_frame = ttk.Frame(frame)
+        origin_frame.grid(row=3, column=1, sticky=tk.W, pady=2)
+        self.origin_x_var = tk.IntVar(value=min(self.table.xs, default=0))
+        self.origin_y_var = tk.IntVar(value=min(self.table.ys, default=0))
+        ttk.Spinbox(origin_frame, from_=0, to=9999, textvariable=self.origin_x_var, width=5).pack(side=tk.LEFT)
+        ttk.Spinbox(origin_frame, from_=0, to=9999, textvariable=self.origin_y_var, width=5).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Delay multiplier
+        ttk.Label(frame, text="Multiply delays by:").grid(row=4, column=0, sticky=tk.W, pady=(10, 0))
+        self.delay_factor_var = tk.DoubleVar(value=1.0)
+        ttk.Spinbox(frame, from_=0.1, to=10.0, increment=0.1, textvariable=self.delay_factor_var, width=10).grid(row=4, column=1, sticky=tk.W, pady=(10, 2))
+        
+        # Buttons
+        btn_frame = ttk.Frame(self.dialog)
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="Apply", command=self._apply).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(btn_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT)
+        
+    def _apply(self):
+        """Apply the transforms to every point and close dialog"""
+        try:
+            dx, dy = self.dx_var.get(), self.dy_var.get()
+            scale = self.scale_var.get()
+            delay_factor = self.delay_factor_var.get()
+            origin = (self.origin_x_var.get(), self.origin_y_var.get())
+        except tk.TclError as e:
+            messagebox.showerror("Error", f"Invalid value: {str(e)}")
+            return
+            
+        if scale != 1.0:
+            self.table.scale(scale, origin=origin)
+        if dx or dy:
+            self.table.translate(dx, dy)
+        if delay_factor != 1.0:
+            self.table.scale_delays(delay_factor)
+        self.on_apply()
+        self.dialog.destroy()
+
+
+class InventoryDropDialog:
+    """Dialog for calibrating an inventory grid and adding a drop point for it"""
+    
+    PICK_DELAY_MS = 3000  # Time to move the cursor onto a slot after pressing Pick
+    
+    def __init__(self, parent, autoclicker, on_add_callback):
+        """
+        Initialize the inventory dialog.
+        
+        Args:
+            parent: Parent tkinter widget
+            autoclicker: AutoClicker instance (its backend reads the cursor)
+            on_add_callback: Function to call after the point is added
+        """
+        self.autoclicker = autoclicker
+        self.on_add = on_add_callback
+        self.background = InventoryGrid(0, 0).background
+        
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Add Inventory Drop")
+        self.dialog.geometry("360x400")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        
+        self._build_form()
+        
+    def _build_form(self):
+        """Build the form fields"""
+        frame = ttk.Frame(self.dialog, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text="Clicks every occupied slot, skipping empty ones", foreground='gray').grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 10))
+        
+        # Slot centres (Pick reads the cursor after a countdown)
+        self.first_vars = (tk.IntVar(value=563), tk.IntVar(value=213))
+        self.last_vars = (tk.IntVar(value=689), tk.IntVar(value=429))
+        for row, (title, variables) in enumerate((("Top left slot:", self.first_vars), ("Bottom right slot:", self.last_vars)), start=1):
+            ttk.Label(frame, text=title).grid(row=row, column=0, sticky=tk.W)
+            slot_frame = ttk.Frame(frame)
+            slot_frame.grid(row=row, column=1, sticky=tk.W, pady=2)
+            for variable in variables:
+                ttk.Spinbox(slot_frame, from_=0, to=9999, textvariable=variable, width=5).pack(side=tk.LEFT, padx=(0, 5))
+            ttk.Button(slot_frame, text="Pick", width=5, command=lambda v=variables: self._pick(v)).pack(side=tk.LEFT)
+            
+        ttk.Label(frame, text="Columns x rows:").grid(row=3, column=0, sticky=tk.W)
+        size_frame = ttk.Frame(frame)
+        size_frame.grid(row=3, column=1, sticky=tk.W, pady=2)
+        self.columns_var = tk.IntVar(value=4)
+        self.rows_var = tk.IntVar(value=7)
+        ttk.Spinbox(size_frame, from_=1, to=20, textvariable=self.columns_var, width=5).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Spinbox(size_frame, from_=1, to=20, textvariable=self.rows_var, width=5).pack(side=tk.LEFT)
+        
+        ttk.Label(frame, text="Order:").grid(row=4, column=0, sticky=tk.W)
+        self.order_var = tk.StringVar(value='rows')
+        ttk.Combobox(frame, textvariable=self.order_var, values=InventoryGrid.ORDERS, state='readonly', width=10).grid(row=4, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Delay (s):").grid(row=5, column=0, sticky=tk.W)
+        self.delay_var = tk.DoubleVar(value=0.1)
+        ttk.Spinbox(frame, from_=0.1, to=10.0, increment=0.05, textvariable=self.delay_var, width=10).grid(row=5, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Random range:").grid(row=6, column=0, sticky=tk.W)
+        self.range_var = tk.IntVar(value=3)
+        ttk.Spinbox(frame, from_=0, to=20, textvariable=self.range_var, width=10).grid(row=6, column=1, sticky=tk.W, pady=2)
+        
+        # Empty-slot colour and a live check of the calibration
+        check_frame = ttk.Frame(frame)
+        check_frame.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        ttk.Button(check_frame, text="Sample empty colour", command=self._sample).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(check_frame, text="Check slots", command=self._check).pack(side=tk.LEFT)
+        self.info_label = ttk.Label(frame, text=self._background_text(), foreground='gray', wraplength=320, justify=tk.LEFT)
+        self.info_label.grid(row=8, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
+        # Buttons
+        btn_frame = ttk.Frame(self.dialog)
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="Add", command=self._add).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(btn_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT)
+        
+    def _background_text(self):
+        return "Empty slot colour: #%02x%02x%02x" % self.background
+        
+    def _pick(self, variables):
+        """Fill in the cursor position once the countdown ends"""
+        self.info_label.config(text="Move the cursor onto the middle of the slot...")
+        
+        def read():
+            x, y = self.autoclicker.backend.get_position()
+            variables[0].set(x)
+            variables[1].set(y)
+            self.info_label.config(text=f"Picked ({x}, {y}) - {self._background_text()}")
+            
+        self.dialog.after(self.PICK_DELAY_MS, read)
+        
+    def _build_grid(self):
+        """InventoryGrid from the form"""
+        first = (self.first_vars[0].get(), self.first_vars[1].get())
+        last = (self.last_vars[0].get(), self.last_vars[1].get())
+        return InventoryGrid.calibrate(first, last, self.columns_var.get(), self.rows_var.get(),
+                                       order=self.order_var.get(), background=self.background)
+                                       
+    def _scan(self):
+        """Capture the grid once; returns its SlotScanner and the captured pixels"""
+        from ..vision import create_source
+        from ..vision.inventory import SlotScanner
+        source = create_source()
+        try:
+            scanner = SlotScanner(self._build_grid(), source)
+            source.check_region(scanner.region)
+            return scanner, source.grab(scanner.region).pixels.copy()
+        finally:
+            source.close()
+            
+    def _sample(self):
+        """Measure the empty-slot colour (the inventory should be mostly empty)"""
+        try:
+            scanner, pixels = self._scan()
+        except Exception as e:
+            messagebox.showerror("Error", f"Cannot read the screen: {str(e)}", parent=self.dialog)
+            return
+        self.background = scanner.sample_background(pixels)
+        self.info_label.config(text=self._background_text())
+        
+    def _check(self):
+        """Show which slots currently look occupied"""
+        try:
+            scanner, pixels = self._scan()
+        except Exception as e:
+            messagebox.showerror("Error", f"Cannot read the screen: {str(e)}", parent=self.dialog)
+            return
+        grid = scanner.grid
+        occupied = scanner.occupied(pixels)
+        rows = [' '.join('■' if occupied[r * grid.columns + c] else '□' for c in range(grid.columns)) for r in range(grid.rows)]
+        self.info_label.config(text=f"{sum(occupied)} of {len(grid)} slots occupied\n" + '\n'.join(rows))
+        
+    def _add(self):
+        """Add the drop point and close dialog"""
+        try:
+            grid = self._build_grid()
+            point = ClickPoint(grid.x, grid.y, self.delay_var.get(), randomize=self.range_var.get() > 0,
+                               random_range=self.range_var.get(), inventory=grid)
+        except (tk.TclError, ValueError) as e:
+            messagebox.showerror("Error", f"Invalid value: {str(e)}", parent=self.dialog)
+            return
+        self.autoclicker.add_point(point)
+        self.on_add()
+        self.dialog.destroy()
+
+
 class SaveConfigDialog:
     """Dialog for saving a configuration"""
     
@@ -4,23 +4,34 @@ Main window module for the autoclicker GUI.
 Contains the AutoClickerGUI class which coordinates all UI components.
 """
 
+import os
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from pynput.mouse import Controller as MouseController
-
-from ..core import AutoClicker
+from ..backends import create_backend
+from ..events import COALESCE, ConsoleLogger, DebugEvent, StatusEvent
 from ..hotkeys import HotkeyListener
 from ..models import ClickPoint
+from ..perf import PerformanceProfile
+from ..process import ProcessAutoClicker
+from ..recorder import MacroRecorder
+from ..simulate import SAMPLE_LOOPS, format_summary, simulate
+from ..timing import calibrate
+from ..utils import get_traces_dir
 from .config_panel import ConfigPanel
 from .dialogs import SaveConfigDialog
 from .points_panel import PointsPanel
 from .sections import ControlsSection, HeaderSection, SettingsSection, StatusSection
+from .status_model import RenderLoop, StatusModel
 
 
 class AutoClickerGUI:
     """Main GUI application"""
     
+    MAX_FPS = 30  # Status repaint rate cap
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("OSRS AutoClicker")
@@ -31,10 +42,20 @@ class AutoClickerGUI:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
-        # Initialize autoclicker
-        self.autoclicker = AutoClicker()
-        self.autoclicker.on_status_change = self._on_status_change
-        self.autoclicker.on_click = self._on_click
+        # Initialize autoclicker (threaded until process mode is enabled)
+        self.autoclicker = ProcessAutoClicker(use_process=False)
+        self.backend_choice = 'auto'  # Backend setting the current backend was created from
+        
+        # Engine events: the GUI only needs the latest of each kind, drained
+        # by the render loop; debug output goes to the console on its own thread
+        self.engine_events = self.autoclicker.events.subscribe('gui', policy=COALESCE)
+        self.debug_logger = ConsoleLogger(self.autoclicker.events, types=(DebugEvent,)).start()
+        
+        # Repaint the status area only when an event or a GUI action changed
+        # something, at most MAX_FPS times a second
+        self.status_model = StatusModel()
+        self.render_loop = RenderLoop(self.root, self._render, self.MAX_FPS)
+        self.engine_events.on_ready = self.render_loop.request
         
         # Hotkey listener
         self.hotkey_listener = HotkeyListener()
@@ -43,12 +64,12 @@ class AutoClickerGUI:
         self.hotkey_listener.exit_capture_callback = self._on_exit_rapid_add
         self.hotkey_listener.start_callback = self._start_autoclicker
         self.hotkey_listener.stop_callback = self._stop_autoclicker
+        self.hotkey_listener.tick_sync_callback = self._on_tick_sync
+        self.hotkey_listener.pause_callback = self._toggle_pause
         
         # Rapid add mode state
         self.rapid_add_active = False
-        
-        # Mouse controller for capture
-        self.mouse = MouseController()
+        self.recorder = None  # MacroRecorder while recording clicks
         
         # Build GUI
         self._build_gui()
@@ -56,8 +77,9 @@ class AutoClickerGUI:
         # Start hotkey listener
         self.hotkey_listener.start()
         
-        # Update loop for status
-        self._schedule_updates()
+        # First paint of the status area
+        self.render_loop.request()
+        self.render_loop.start()
         
     def _build_gui(self):
         """Build the GUI components with scrollable container"""
@@ -101,15 +123,19 @@ class AutoClickerGUI:
         HeaderSection.build(self.scrollable_frame)
 
         self.settings = SettingsSection()
-        self.settings.build(self.scrollable_frame)
+        self.settings.build(self.scrollable_frame, self._calibrate_wait)
 
-        self.points_panel = PointsPanel(self.scrollable_frame, self.autoclicker, self._on_status_change)
+        self.points_panel = PointsPanel(self.scrollable_frame, self.autoclicker, self._on_status_change,
+                                        self._start_recording)
 
-        self.config_panel = ConfigPanel(self.scrollable_frame, self.autoclicker, self._on_config_action)
+        self.config_panel = ConfigPanel(self.scrollable_frame, self.autoclicker, self._on_config_action,
+                                        self._on_status_change)
         self.config_panel.refresh()  # Load saved configs list
+        self.config_panel.start_watching()
 
         self.controls = ControlsSection()
-        self.controls.build(self.scrollable_frame, self._start_autoclicker, self._stop_autoclicker)
+        self.controls.build(self.scrollable_frame, self._start_autoclicker, self._stop_autoclicker,
+                            self._toggle_pause, self._estimate)
 
         self.status = StatusSection()
         self.status.build(self.scrollable_frame)
@@ -150,6 +176,8 @@ class AutoClickerGUI:
             # Config was loaded - update settings
             self.settings.start_delay_var.set(self.autoclicker.start_delay)
             self.settings.loop_count_var.set(self.autoclicker.loop_count)
+            self.settings.tick_mode_var.set(self.autoclicker.tick_mode)
+            self.settings.tick_lead_var.set(self.autoclicker.tick_lead_ms)
             self.points_panel.refresh()
             self._update_status_with_config(config_data.get('name'))
             
@@ -163,7 +191,7 @@ class AutoClickerGUI:
         if not self.rapid_add_active:
             return
         
-        x, y = self.mouse.position
+        x, y = self.autoclicker.backend.get_position()
         
         # Create and add the point with the specified delay
         point = ClickPoint(
@@ -172,10 +200,48 @@ class AutoClickerGUI:
             randomize=False,
             random_range=0
         )
+        note = ""
+        if self.settings.template_var.get():
+            try:
+                point.template = self._capture_template(x, y)
+                note = " and target image"
+            except Exception as e:
+                note = f" (no target image: {str(e)})"
         self.autoclicker.add_point(point)
         self.points_panel.refresh()
-        self._on_status_change(f"Added point at ({x}, {y}) with {delay}s delay - Next: move mouse + number, or F9/ESC to exit")
+        self._on_status_change(f"Added point at ({x}, {y}) with {delay}s delay{note} - Next: move mouse + number, or F9/ESC to exit")
+        
+    def _capture_template(self, x, y):
+        """Capture the target image around a screen position"""
+        from ..vision import create_source
+        from ..vision.template import capture_template
+        source = create_source()
+        try:
+            return capture_template(source, x, y)
+        finally:
+            source.close()
     
+    def _start_recording(self):
+        """Record clicks with their real timing until ESC, then add them as click points"""
+        if self.autoclicker.running:
+            messagebox.showinfo("Info", "Stop the autoclicker before recording")
+            return
+        self.recorder = MacroRecorder()
+        # Called on the listener thread; the recording is added on the Tk thread
+        self.recorder.stop_callback = lambda macro: self.render_loop.call(lambda: self._on_recorded(macro))
+        self.recorder.start()
+        self.points_panel.set_recording(True)
+        self._on_status_change("RECORDING: perform the routine - every click and its timing is captured. Press ESC to stop")
+        
+    def _on_recorded(self, macro):
+        """Add a finished recording's clicks as click points"""
+        self.points_panel.set_recording(False)
+        points = macro.to_points()
+        for point in points:
+            self.autoclicker.add_point(point)
+        self.points_panel.refresh()
+        self._on_status_change(f"Recorded {len(points)} clicks over {macro.duration:.1f}s - added as click points")
+        
     def _on_exit_rapid_add(self):
         """Exit rapid add mode"""
         self.rapid_add_active = False
@@ -183,42 +249,181 @@ class AutoClickerGUI:
         
     def _start_autoclicker(self):
         """Start the autoclicker"""
+        if self.autoclicker.running:
+            return
         if not self.autoclicker.click_points:
             messagebox.showinfo("Info", "Please add at least one click point first (Press F6)")
             return
             
+        self._apply_settings()
+        self.autoclicker.trace_path = None
+        if self.settings.trace_var.get():
+            self.autoclicker.trace_path = os.path.join(get_traces_dir(),
+                                                       time.strftime('session-%Y%m%d-%H%M%S.trace'))
+        
+        # Compared with the setting last applied rather than the backend's
+        # name, so switching back to 'auto' takes effect too
+        backend_name = self.settings.backend_var.get()
+        if backend_name != self.backend_choice:
+            try:
+                self.autoclicker.set_backend(create_backend(backend_name))
+            except Exception as e:
+                messagebox.showerror("Error", f"Input backend '{backend_name}' unavailable: {str(e)}")
+                return
+            self.backend_choice = backend_name
+        
+        if not self.autoclicker.start():
+            messagebox.showerror("Error", "Nothing to run - enable at least one click point")
+            return
+        self.render_loop.request()
+        
+    def _apply_settings(self):
+        """Copy the Settings section's values to the autoclicker"""
         self.autoclicker.start_delay = self.settings.start_delay_var.get()
         self.autoclicker.loop_count = self.settings.loop_count_var.get()
         self.autoclicker.verify_position = self.settings.verify_pos_var.get()
         self.autoclicker.debug_mode = self.settings.debug_mode_var.get()
-        
-        if self.autoclicker.start():
-            self.controls.set_running(True)
-            
+        self.autoclicker.tick_mode = self.settings.tick_mode_var.get()
+        self.autoclicker.tick_lead_ms = self.settings.tick_lead_var.get()
+        settle_ms = self.settings.settle_var.get()
+        if settle_ms < 0:
+            self.autoclicker.settle_time = 0.0  # Move and click in one batch
+        else:
+            self.autoclicker.settle_time = settle_ms / 1000 if settle_ms > 0 else None
+        self.autoclicker.use_process = self.settings.process_var.get()
+        self.autoclicker.wait_strategy = self.settings.wait_var.get()
+        self.autoclicker.wait_margin_ms = self.settings.margin_var.get()
+        cpu = self.settings.cpu_var.get()
+        self.autoclicker.performance = PerformanceProfile(cpu=cpu if cpu >= 0 else None,
+                                                          priority=self.settings.priority_var.get(),
+                                                          gc_control=self.settings.gc_control_var.get())
+        self.autoclicker.condition_poll_ms = self.settings.poll_var.get()
+                                                          
     def _stop_autoclicker(self):
         """Stop the autoclicker"""
         self.autoclicker.stop()
-        self.controls.set_running(False)
+        self.render_loop.request()
         
-    def _on_status_change(self, status):
-        """Handle status updates"""
-        self.root.after(0, lambda: self.status.update_status(status))
+    def _toggle_pause(self):
+        """Pause or resume the autoclicker"""
+        self.autoclicker.toggle_pause()
+        self.render_loop.request()
+        
+    def _estimate(self):
+        """Simulate the current points and settings in the background and show the projection"""
+        if not self.autoclicker.click_points:
+            messagebox.showinfo("Info", "Please add at least one click point first (Press F6)")
+            return
+        if not self.autoclicker.running:
+            self._apply_settings()  # While running, estimate the settings in use
+        config = self.autoclicker.get_config()
+        settle_time = self.autoclicker.settle_time
+        self.controls.estimate_btn.configure(state='disabled')
+        self.status_model.set(estimating=True)
+        self._on_status_change("Estimating...")
+        
+        def work():
+            # The simulation stops once the loop mean converges (tens of
+            # ms); longer sessions are extrapolated from it
+            try:
+                text = "Estimate: " + format_summary(simulate(config, max_loops=SAMPLE_LOOPS,
+                                                              settle_time=settle_time))
+            except Exception as e:
+                text = f"Estimate failed: {str(e)}"
+            # Through the model, so this thread never calls into Tk
+            self.status_model.set(status=text, estimating=False)
+            self.render_loop.request()
+            
+        threading.Thread(target=work, daemon=True).start()
+        
+    def _calibrate_wait(self):
+        """Measure sleep wake-up error in the background and set the wait margin"""
+        self.settings.calibrate_btn.configure(state='disabled')
+        self._on_status_change("Calibrating wait margin...")
+        
+        def work():
+            result = calibrate()
+            self.render_loop.call(lambda: self._on_calibrated(result))
+            
+        threading.Thread(target=work, daemon=True).start()
         
-    def _on_click(self, point_index, position, total_clicks):
-        """Handle click event"""
-        self.root.after(0, lambda: self.status.update_stats(
-            self.autoclicker.current_loop, total_clicks
-        ))
+    def _on_calibrated(self, result):
+        """Apply a calibration result"""
+        self.settings.margin_var.set(result.margin_ms)
+        self.settings.calibrate_btn.configure(state='normal')
+        self._on_status_change(f"Sleep wakes up {result.p50_ms:.2f} ms late (p99 {result.p99_ms:.2f} ms) - "
+                               f"wait margin set to {result.margin_ms} ms")
         
-    def _schedule_updates(self):
-        """Schedule periodic UI updates"""
-        self._update_ui()
-        self.root.after(100, self._schedule_updates)
+    def _on_tick_sync(self):
+        """Re-sync the game tick phase - F10 was pressed on a tick"""
+        self.autoclicker.sync_ticks()
+        if not self.autoclicker.running:
+            self._on_status_change("Tick phase synced - Press F7 to start")
         
-    def _update_ui(self):
-        """Update UI elements"""
-        self.controls.set_running(self.autoclicker.running)
-        self.status.update_stats(self.autoclicker.current_loop, self.autoclicker.click_count)
+    def _on_status_change(self, status):
+        """Handle status updates (from any thread)"""
+        if self.status_model.set(status=status):
+            self.render_loop.request()
+            
+    def _render(self):
+        """Fold pending engine events into the status model and repaint what changed"""
+        model = self.status_model
+        for event in self.engine_events.drain():
+            if isinstance(event, StatusEvent):
+                model.set(status=event.text)
+        stats = self.autoclicker.get_run_stats()
+        model.set(running=self.autoclicker.running, paused=self.autoclicker.paused,
+                  loops=stats['loops'], clicks=stats['clicks'])
+        if stats['clicks']:
+            # Rounded as displayed, so sub-0.1 ms jitter doesn't count as a change
+            model.set(drift_ms=round(stats['drift_ms'], 1), max_drift_ms=round(stats['max_drift_ms'], 1))
+        else:
+            model.set(drift_ms=None, max_drift_ms=None)
+        if stats['clicks']:
+            timing = self.autoclicker.get_timing_stats()
+            searches = self.autoclicker.get_search_stats()
+            if searches:
+                timing['search'] = max(searches.values(), key=lambda s: s['p99_ms'])
+            model.set(timing={stage: (round(t['p50_ms'], 2), round(t['p99_ms'], 2), round(t['max_ms'], 2))
+                              for stage, t in timing.items() if t['count']})
+        else:
+            model.set(timing=None)
+        if self.autoclicker.performance.enabled and stats['clicks']:
+            model.set(preempted=stats['involuntary_switches'], gc_max_ms=round(stats['gc_max_pause_ms'], 1))
+        else:
+            model.set(preempted=None, gc_max_ms=None)
+        if stats['condition_hits'] or stats['condition_misses']:
+            model.set(conditions=(stats['condition_hits'], stats['condition_misses'],
+                                  round(stats['condition_saved_s'])))
+        else:
+            model.set(conditions=None)
+        if stats['idle_hits'] or stats['idle_misses']:
+            model.set(idle=(stats['idle_hits'], stats['idle_misses'], round(stats['idle_saved_s'])))
+        else:
+            model.set(idle=None)
+        if stats['slots_skipped']:
+            model.set(drops=(stats['slots_skipped'], round(stats['slots_saved_s'])))
+        else:
+            model.set(drops=None)
+        if not model.dirty:
+            return
+            
+        changes = model.take_changes()
+        if 'status' in changes:
+            self.status.update_status(changes['status'])
+        if 'running' in changes:
+            self.controls.set_running(changes['running'])
+        if 'paused' in changes:
+            self.controls.set_paused(changes['paused'])
+        if 'estimating' in changes:
+            self.controls.estimate_btn.configure(state='disabled' if changes['estimating'] else 'normal')
+        if changes.keys() & {'loops', 'clicks', 'drift_ms', 'max_drift_ms', 'preempted', 'gc_max_ms', 'conditions',
+                             'idle', 'drops'}:
+            self.status.update_stats(model.get('loops'), model.get('clicks'), model.get('drift_ms'),
+                                     model.get('max_drift_ms'), model.get('preempted'), model.get('gc_max_ms'),
+                                     model.get('conditions'), model.get('drops'), model.get('idle'))
+        if 'timing' in changes:
+            self.status.update_timing(changes['timing'])
         
     def _show_save_dialog(self):
         """Show dialog to save current config with name and description"""
@@ -234,14 +439,20 @@ class AutoClickerGUI:
     def _update_status_with_config(self, config_name):
         """Update status label to show currently loaded config"""
         if config_name:
-            self.status.update_status(f"Loaded: {config_name} - Press F6 to add click points")
+            self._on_status_change(f"Loaded: {config_name} - Press F6 to add click points")
         else:
-            self.status.update_status("Ready - Press F6 to add click points")
+            self._on_status_change("Ready - Press F6 to add click points")
             
     def run(self):
         """Start the GUI main loop"""
         try:
             self.root.mainloop()
         finally:
+            self.config_panel.stop_watching()
             self.hotkey_listener.stop()
+            if self.recorder is not None:
+                self.recorder.stop()
             self.autoclicker.stop()
+            self.autoclicker.close()
+            self.autoclicker.events.unsubscribe(self.engine_events)
+            self.debug_logger.stop()
@@ -7,14 +7,13 @@ Contains the PointsPanel class for managing click points treeview and actions.
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from ..models import ClickPoint
-from .dialogs import EditPointDialog
+from .dialogs import EditPointDialog, InventoryDropDialog, TransformPointsDialog
 
 
 class PointsPanel:
     """Panel for managing click points"""
     
-    def __init__(self, parent, autoclicker, on_status_change):
+    def __init__(self, parent, autoclicker, on_status_change, on_record=None):
         """
         Initialize the points panel.
         
@@ -22,10 +21,13 @@ class PointsPanel:
             parent: Parent tkinter widget (frame)
             autoclicker: AutoClicker instance
             on_status_change: Callback for status updates
+            on_record: Callback for the record button (None = no button)
         """
         self.autoclicker = autoclicker
         self.on_status_change = on_status_change
+        self.on_record = on_record
         self.tree = None
+        self.record_btn = None
         
         self._build_panel(parent)
         
@@ -42,7 +44,13 @@ class PointsPanel:
         
         ttk.Button(btn_frame, text="➕ Add Point (F6)", command=self._show_add_message).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(btn_frame, text="🗑️ Remove Selected", command=self.remove_selected).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(btn_frame, text="📋 Clear All", command=self.clear_all).pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="📋 Clear All", command=self.clear_all).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(btn_frame, text="↔ Transform...", command=self._show_transform_dialog).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(btn_frame, text="▦ Inventory...", command=self._show_inventory_dialog).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(btn_frame, text="✓ Toggle Selected", command=self.toggle_selected).pack(side=tk.LEFT)
+        if self.on_record:
+            self.record_btn = ttk.Button(btn_frame, text="⏺ Record", command=self.on_record)
+            self.record_btn.pack(side=tk.LEFT, padx=(5, 0))
         
         # Treeview for click points
         tree_frame = ttk.Frame(points_frame)
@@ -51,7 +59,7 @@ class PointsPanel:
         tree_frame.rowconfigure(0, weight=1)
         
         columns = ('#', 'X', 'Y', 'Delay', 'Random', 'Range', 'Enabled')
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=8)
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=8, selectmode='extended')
         
         self.tree.heading('#', text='#')
         self.tree.heading('X', text='X')
@@ -84,24 +92,47 @@ class PointsPanel:
         """Show message about how to add points"""
         messagebox.showinfo("Add Point", "Press F6 to enter Rapid Add Mode, then move your mouse and press 0-9 to set the delay.")
         
+    def set_recording(self, recording):
+        """Update the record button while a recording is in progress"""
+        if recording:
+            self.record_btn.configure(text="⏺ Recording (ESC)", state='disabled')
+        else:
+            self.record_btn.configure(text="⏺ Record", state='normal')
+            
     def refresh(self):
-        """Refresh the treeview with current click points"""
-        # Clear existing
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add points
-        for i, point in enumerate(self.autoclicker.click_points, 1):
-            self.tree.insert('', tk.END, values=(
-                i,
-                point.x,
-                point.y,
-                f"{point.delay:.1f}",
-                "Yes" if point.randomize else "No",
-                point.random_range if point.randomize else "-",
-                "✓" if point.enabled else "✗"
-            ))
+        """Refresh the treeview with current click points, touching only changed rows"""
+        table = self.autoclicker.click_points
+        items = self.tree.get_children()
+        
+        # Drop surplus rows
+        if len(items) > len(table):
+            self.tree.delete(*items[len(table):])
+            items = items[:len(table)]
             
+        # Update existing rows in place, append new ones
+        rows = zip(table.xs, table.ys, table.delays, table.randomize, table.ranges, table.enabled, table.conditions,
+                   table.templates, table.inventories, table.idles)
+        for i, (x, y, delay, randomize, random_range, enabled, condition, template, grid, idle) in enumerate(rows):
+            values = (
+                i + 1,
+                f"{x}" + (f" ▦{len(grid)}" if grid is not None else ""),
+                f"{y}" + (" ◎" if template is not None else ""),
+                f"{delay:.1f}" + (" ⧗" if condition is not None else "") + (" ⧖" if idle is not None else ""),
+                "Yes" if randomize else "No",
+                random_range if randomize else "-",
+                "✓" if enabled else "✗"
+            )
+            if i < len(items):
+                if self._row_values(items[i]) != tuple(map(str, values)):
+                    self.tree.item(items[i], values=values)
+            else:
+                self.tree.insert('', tk.END, values=values)
+                
+    def _row_values(self, item):
+        """Current values of a row, normalized to compare against new values"""
+        # Tk hands back numbers as ints/strings; compare their string forms
+        return tuple(str(v) for v in self.tree.item(item, 'values'))
+        
     def remove_selected(self):
         """Remove selected click point"""
         selection = self.tree.selection()
@@ -130,7 +161,38 @@ class PointsPanel:
         index = self.tree.index(selection[0])
         point = self.autoclicker.click_points[index]
         
-        EditPointDialog(self.tree.winfo_toplevel(), point, self.refresh)
+        def on_save():
+            # Points are stored column-wise; write the edited copy back
+            self.autoclicker.click_points[index] = point
+            self.refresh()
+            
+        EditPointDialog(self.tree.winfo_toplevel(), point, on_save)
+        
+    def toggle_selected(self):
+        """Enable/disable the selected click points"""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showinfo("Info", "Please select click points to toggle")
+            return
+            
+        table = self.autoclicker.click_points
+        mask = bytearray(table.enabled)
+        for item in selection:
+            index = self.tree.index(item)
+            mask[index] = not mask[index]
+        table.set_enabled(mask)
+        self.refresh()
+        
+    def _show_transform_dialog(self):
+        """Show dialog to move/scale all points at once"""
+        if not self.autoclicker.click_points:
+            messagebox.showinfo("Info", "No click points to transform")
+            return
+        TransformPointsDialog(self.tree.winfo_toplevel(), self.autoclicker.click_points, self.refresh)
+        
+    def _show_inventory_dialog(self):
+        """Show dialog to calibrate an inventory grid and add a drop point"""
+        InventoryDropDialog(self.tree.winfo_toplevel(), self.autoclicker, self.refresh)
         
     def get_selection(self):
         """Get current treeview selection"""
@@ -4,9 +4,14 @@ UI section builder module.
 Contains classes for building different sections of the main window.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk
 
+from ..backends import BACKEND_NAMES
+from ..perf import PRIORITY_NAMES
+from ..timing import STRATEGY_NAMES
+
 
 class HeaderSection:
     """Header section showing hotkey information"""
@@ -43,7 +48,15 @@ class HeaderSection:
         
         ttk.Label(header_frame, text="F8", font=('Arial', 10, 'bold'), 
                  foreground='#cc0000').grid(row=0, column=8, padx=(0, 5))
-        ttk.Label(header_frame, text="= Stop").grid(row=0, column=9, sticky=tk.W)
+        ttk.Label(header_frame, text="= Stop").grid(row=0, column=9, sticky=tk.W, padx=(0, 20))
+        
+        ttk.Label(header_frame, text="F10", font=('Arial', 10, 'bold'), 
+                 foreground='#996600').grid(row=0, column=10, padx=(0, 5))
+        ttk.Label(header_frame, text="= Tick Sync").grid(row=0, column=11, sticky=tk.W, padx=(0, 20))
+        
+        ttk.Label(header_frame, text="F11", font=('Arial', 10, 'bold'), 
+                 foreground='#666666').grid(row=0, column=12, padx=(0, 5))
+        ttk.Label(header_frame, text="= Pause").grid(row=0, column=13, sticky=tk.W)
         
         return header_frame
 
@@ -56,13 +69,28 @@ class SettingsSection:
         self.loop_count_var = None
         self.verify_pos_var = None
         self.debug_mode_var = None
+        self.tick_mode_var = None
+        self.tick_lead_var = None
+        self.backend_var = None
+        self.settle_var = None
+        self.process_var = None
+        self.wait_var = None
+        self.margin_var = None
+        self.calibrate_btn = None
+        self.cpu_var = None
+        self.priority_var = None
+        self.gc_control_var = None
+        self.trace_var = None
+        self.poll_var = None
+        self.template_var = None
         
-    def build(self, parent):
+    def build(self, parent, on_calibrate=None):
         """
         Build the settings section.
         
         Args:
             parent: Parent frame to build in
+            on_calibrate: Callback for the wait margin Calibrate button
             
         Returns:
             The created settings frame
@@ -94,7 +122,85 @@ class SettingsSection:
         self.debug_mode_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(settings_frame, text="Debug mode (show actual click coords in console)", 
                        variable=self.debug_mode_var).grid(row=3, column=0, columnspan=3, sticky=tk.W)
+                       
+        # Tick mode (phase-lock clicks to game ticks)
+        self.tick_mode_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="Tick mode (round delays to 0.6s game ticks, F10 to sync)", 
+                       variable=self.tick_mode_var).grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+                       
+        ttk.Label(settings_frame, text="Tick Lead (ms):").grid(row=5, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.tick_lead_var = tk.DoubleVar(value=50.0)
+        ttk.Spinbox(settings_frame, from_=0.0, to=500.0, increment=5.0, 
+                   textvariable=self.tick_lead_var, width=10).grid(row=5, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="Fire this long before each tick", foreground='gray').grid(row=5, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        # Input backend
+        ttk.Label(settings_frame, text="Input Backend:").grid(row=6, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.backend_var = tk.StringVar(value='auto')
+        ttk.Combobox(settings_frame, textvariable=self.backend_var, values=[n for n in BACKEND_NAMES if n != 'recording'],
+                    state='readonly', width=10).grid(row=6, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="auto = XTest on X11, else pynput", foreground='gray').grid(row=6, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        # Pre-click settle time
+        ttk.Label(settings_frame, text="Settle (ms):").grid(row=7, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.settle_var = tk.DoubleVar(value=0.0)
+        ttk.Spinbox(settings_frame, from_=-1.0, to=200.0, increment=5.0, 
+                   textvariable=self.settle_var, width=10).grid(row=7, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="Hover time before each click (0 = adaptive, -1 = none: move and click at once)", foreground='gray').grid(row=7, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
         
+        # Process isolation
+        self.process_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="Run click engine in a separate process (less timing jitter)", 
+                       variable=self.process_var).grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+                       
+        # Wait strategy
+        ttk.Label(settings_frame, text="Wait Strategy:").grid(row=9, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.wait_var = tk.StringVar(value='sleep')
+        ttk.Combobox(settings_frame, textvariable=self.wait_var, values=STRATEGY_NAMES,
+                    state='readonly', width=10).grid(row=9, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="timerfd/hybrid finish each wait precisely", foreground='gray').grid(row=9, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        ttk.Label(settings_frame, text="Wait Margin (ms):").grid(row=10, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.margin_var = tk.DoubleVar(value=2.0)
+        ttk.Spinbox(settings_frame, from_=0.0, to=20.0, increment=0.5, 
+                   textvariable=self.margin_var, width=10).grid(row=10, column=1, sticky=tk.W, pady=(5, 0))
+        self.calibrate_btn = ttk.Button(settings_frame, text="Calibrate", command=on_calibrate)
+        self.calibrate_btn.grid(row=10, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        # Performance profile for the click thread
+        ttk.Label(settings_frame, text="Pin to CPU:").grid(row=11, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.cpu_var = tk.IntVar(value=-1)
+        ttk.Spinbox(settings_frame, from_=-1, to=(os.cpu_count() or 1) - 1, increment=1, 
+                   textvariable=self.cpu_var, width=10).grid(row=11, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="Core for the click thread (-1 = any)", foreground='gray').grid(row=11, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        ttk.Label(settings_frame, text="Priority:").grid(row=12, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.priority_var = tk.StringVar(value='normal')
+        ttk.Combobox(settings_frame, textvariable=self.priority_var, values=PRIORITY_NAMES,
+                    state='readonly', width=10).grid(row=12, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="high = lower nice, realtime = SCHED_FIFO (when permitted)", foreground='gray').grid(row=12, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        self.gc_control_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="Hold garbage collection until the end of each loop", 
+                       variable=self.gc_control_var).grid(row=13, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+                       
+        # Session trace (binary click log for later analysis)
+        self.trace_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="Record session trace (traces folder, export with 'trace export')", 
+                       variable=self.trace_var).grid(row=14, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+                       
+        # Pixel condition polling
+        ttk.Label(settings_frame, text="Pixel Check (ms):").grid(row=15, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.poll_var = tk.DoubleVar(value=50.0)
+        ttk.Spinbox(settings_frame, from_=10.0, to=1000.0, increment=10.0, 
+                   textvariable=self.poll_var, width=10).grid(row=15, column=1, sticky=tk.W, pady=(5, 0))
+        ttk.Label(settings_frame, text="How often pixel conditions and idle waits are checked", foreground='gray').grid(row=15, column=2, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        # Template targets (found by image at run time)
+        self.template_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="Rapid add: capture the target image too (clicks follow it if it moves)", 
+                       variable=self.template_var).grid(row=16, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+                       
         return settings_frame
 
 
@@ -104,8 +210,10 @@ class ControlsSection:
     def __init__(self):
         self.start_btn = None
         self.stop_btn = None
+        self.pause_btn = None
+        self.estimate_btn = None
         
-    def build(self, parent, on_start, on_stop):
+    def build(self, parent, on_start, on_stop, on_pause=None, on_estimate=None):
         """
         Build the controls section.
         
@@ -113,6 +221,8 @@ class ControlsSection:
             parent: Parent frame to build in
             on_start: Callback for start button
             on_stop: Callback for stop button
+            on_pause: Callback for pause/resume button
+            on_estimate: Callback for the estimate button (None = no button)
             
         Returns:
             The created controls frame
@@ -134,8 +244,18 @@ class ControlsSection:
                                   bg='#dc3545', fg='white', font=('Arial', 11, 'bold'),
                                   activebackground='#c82333', activeforeground='white',
                                   width=15, height=2, state='disabled', cursor='hand2')
-        self.stop_btn.pack(side=tk.LEFT)
+        self.stop_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.pause_btn = tk.Button(btn_frame, text="⏸  PAUSE  (F11)", command=on_pause,
+                                   bg='#6c757d', fg='white', font=('Arial', 11, 'bold'),
+                                   activebackground='#5a6268', activeforeground='white',
+                                   width=15, height=2, state='disabled', cursor='hand2')
+        self.pause_btn.pack(side=tk.LEFT)
         
+        if on_estimate:
+            self.estimate_btn = ttk.Button(btn_frame, text="Estimate", command=on_estimate)
+            self.estimate_btn.pack(side=tk.LEFT, padx=(10, 0))
+            
         return control_frame
         
     def set_running(self, running):
@@ -143,19 +263,38 @@ class ControlsSection:
         if running:
             self.start_btn.configure(state='disabled')
             self.stop_btn.configure(state='normal')
+            self.pause_btn.configure(state='normal')
         else:
             self.start_btn.configure(state='normal')
             self.stop_btn.configure(state='disabled')
+            self.pause_btn.configure(state='disabled')
+            
+    def set_paused(self, paused):
+        """Update the pause button label based on paused status"""
+        if paused:
+            self.pause_btn.configure(text="▶  RESUME  (F11)")
+        else:
+            self.pause_btn.configure(text="⏸  PAUSE  (F11)")
 
 
 class StatusSection:
     """Status section showing current status and statistics"""
     
+    # Click timing stages shown in the timing table
+    TIMING_ROWS = (
+        ('lateness', "Click lateness"),
+        ('backend', "Input backend"),
+        ('verify', "Position check"),
+        ('callback', "Observers"),
+        ('search', "Image search"),  # Slowest template target
+    )
+    
     def __init__(self):
         self.status_label = None
         self.stats_label = None
         self.progress_var = None
         self.progress_bar = None
+        self.timing_labels = {}
         
     def build(self, parent):
         """
@@ -184,12 +323,58 @@ class StatusSection:
         self.progress_bar = ttk.Progressbar(status_frame, variable=self.progress_var, maximum=100)
         self.progress_bar.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         
+        # Click timing percentiles
+        timing_frame = ttk.Frame(status_frame)
+        timing_frame.grid(row=3, column=0, sticky=tk.W, pady=(5, 0))
+        for column, heading in enumerate(("p50", "p99", "max"), start=1):
+            ttk.Label(timing_frame, text=heading, font=('Arial', 9, 'bold'), 
+                     foreground='gray').grid(row=0, column=column, sticky=tk.E, padx=(10, 0))
+        for row, (stage, title) in enumerate(self.TIMING_ROWS, start=1):
+            ttk.Label(timing_frame, text=title, font=('Arial', 9), 
+                     foreground='gray').grid(row=row, column=0, sticky=tk.W)
+            labels = []
+            for column in range(1, 4):
+                label = ttk.Label(timing_frame, text="-", font=('Arial', 9), foreground='gray')
+                label.grid(row=row, column=column, sticky=tk.E, padx=(10, 0))
+                labels.append(label)
+            self.timing_labels[stage] = labels
+            
         return status_frame
         
     def update_status(self, text):
         """Update the status label text"""
         self.status_label.configure(text=text)
         
-    def update_stats(self, loops, clicks):
-        """Update the stats label"""
-        self.stats_label.configure(text=f"Loops: {loops} | Clicks: {clicks}")
+    def update_stats(self, loops, clicks, drift_ms=None, max_drift_ms=None, preempted=None, gc_max_ms=None,
+                     conditions=None, drops=None, idle=None):
+        """
+        Update the stats label; conditions is (matched, timed out, seconds
+        saved), drops is (empty slots skipped, seconds saved), idle is
+        (settled, timed out, seconds saved)
+        """
+        text = f"Loops: {loops} | Clicks: {clicks}"
+        if drift_ms is not None:
+            text += f" | Drift: {drift_ms:+.1f} ms (max {max_drift_ms:.1f} ms)"
+        if preempted is not None:
+            text += f" | Preempted: {preempted}x | GC max {gc_max_ms:.1f} ms"
+        if conditions is not None:
+            text += f" | Pixel waits: {conditions[0]} matched, {conditions[1]} timed out, {conditions[2]:.0f}s saved"
+        if idle is not None:
+            text += f" | Idle waits: {idle[0]} settled, {idle[1]} timed out, {idle[2]:.0f}s saved"
+        if drops is not None:
+            text += f" | Drops: {drops[0]} empty slots skipped, {drops[1]:.0f}s saved"
+        self.stats_label.configure(text=text)
+        
+    def update_timing(self, timing):
+        """
+        Update the timing table.
+        
+        Args:
+            timing: Dict of stage name to (p50, p99, max) in ms, or None to clear
+        """
+        for stage, labels in self.timing_labels.items():
+            values = timing.get(stage) if timing else None
+            for i, label in enumerate(labels):
+                text = f"{values[i]:.2f} ms" if values else "-"
+                if label.cget('text') != text:
+                    label.configure(text=text)
@@ -0,0 +1,160 @@
+"""
+Status model module for the autoclicker GUI.
+
+Contains the StatusModel class, which holds the values shown in the
+status and controls sections and tracks which of them changed, and the
+RenderLoop class, which repaints from the model at a capped frame rate
+only when a frame was requested. The first request after a frame writes
+one byte to a pipe that Tk watches, and the Tk thread then arms a single
+frame, so other threads (the engine, the hotkey listener) never call
+into Tk and the loop schedules nothing while idle. Work that must touch
+widgets from another thread is queued with RenderLoop.call and runs at
+the start of the next frame.
+"""
+
+import os
+import threading
+import time
+import tkinter
+from collections import deque
+
+_MISSING = object()
+
+
+class StatusModel:
+    """Latest displayed values with change tracking"""
+    
+    def __init__(self):
+        self._values = {}
+        self._changed = set()
+        self._lock = threading.Lock()
+        
+    def set(self, **values):
+        """
+        Update values, marking only those that really changed as dirty.
+        
+        Returns:
+            True if anything changed
+        """
+        changed = False
+        with self._lock:
+            for key, value in values.items():
+                if self._values.get(key, _MISSING) != value:
+                    self._values[key] = value
+                    self._changed.add(key)
+                    changed = True
+        return changed
+        
+    def get(self, key, default=None):
+        """Get the current value of key"""
+        return self._values.get(key, default)
+        
+    @property
+    def dirty(self):
+        """True if any value changed since the last take_changes()"""
+        return bool(self._changed)
+        
+    def take_changes(self):
+        """Return the changed values as a dict and mark the model clean"""
+        with self._lock:
+            changes = {key: self._values[key] for key in self._changed}
+            self._changed.clear()
+        return changes
+
+
+class RenderLoop:
+    """Runs a render function on the Tk thread, at most max_fps times a second"""
+    
+    def __init__(self, root, render, max_fps=30):
+        """
+        Initialize the render loop.
+        
+        Args:
+            root: Tk root used to schedule frames
+            render: Function called on the Tk thread to repaint
+            max_fps: Maximum frames per second
+        """
+        self.root = root
+        self.render = render
+        self.interval_ms = max(1, int(1000 / max_fps))
+        self.frames = 0
+        self._pending = False
+        self._job = None
+        self._last_frame = None  # time.monotonic() of the last frame
+        self._started = False
+        self._wake_fd = None  # Write end of the wake-up pipe
+        self._calls = deque()
+        
+    def start(self):
+        """Start handling frame requests (Tk thread)"""
+        if self._started:
+            return
+        self._started = True
+        if hasattr(self.root.tk, 'createfilehandler'):
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            os.set_blocking(write_fd, False)
+            self.root.tk.createfilehandler(read_fd, tkinter.READABLE, self._on_wake)
+            self._wake_fd = write_fd
+        else:
+            # Tk has no file handlers on Windows; requests post a virtual event
+            self.root.bind('<<RenderRequest>>', lambda event: self._schedule())
+        if self._pending:
+            self._schedule()
+            
+    def request(self):
+        """Ask for a frame; safe to call from any thread, repeated calls are merged"""
+        if self._pending:
+            return
+        self._pending = True
+        if self._wake_fd is not None:
+            # A pipe write never waits on Tk, so the caller may be the click
+            # thread (and the main loop may already have exited)
+            try:
+                os.write(self._wake_fd, b'\0')
+            except OSError:
+                pass  # Pipe full: a wake-up is already queued
+        elif self._started:
+            try:
+                self.root.event_generate('<<RenderRequest>>', when='tail')
+            except (RuntimeError, tkinter.TclError):
+                pass  # The main loop has exited
+                
+    def call(self, func):
+        """
+        Run func on the Tk thread before the next frame; safe to call from any thread.
+        
+        Args:
+            func: Function called with no arguments
+        """
+        self._calls.append(func)
+        self.request()
+        
+    def _on_wake(self, fd, mask):
+        """Arm a frame for the requests that woke the Tk thread"""
+        try:
+            os.read(fd, 4096)
+        except OSError:
+            pass
+        if self._pending:
+            self._schedule()
+            
+    def _schedule(self):
+        """Arm one frame, no sooner than a frame interval after the last (Tk thread)"""
+        if self._job is not None:
+            return
+        delay = 0
+        if self._last_frame is not None:
+            delay = max(0, self.interval_ms - int((time.monotonic() - self._last_frame) * 1000))
+        self._job = self.root.after(delay, self._frame)
+        
+    def _frame(self):
+        """Render one frame; the next is only armed by a new request"""
+        self._job = None
+        # Cleared first, so a request made while rendering gets its own frame
+        self._pending = False
+        self._last_frame = time.monotonic()
+        self.frames += 1
+        while self._calls:
+            self._calls.popleft()()
+        self.render()
@@ -19,6 +19,8 @@ class HotkeyListener:
         self.stop_callback = None     # F8 - stop
         self.number_callback = None   # 0-9 in rapid add mode
         self.exit_capture_callback = None  # F9/ESC - exit rapid add mode
+        self.tick_sync_callback = None  # F10 - re-sync game tick phase
+        self.pause_callback = None  # F11 - pause/resume
         self.capturing = False
         self.rapid_add_mode = False
         
@@ -49,6 +51,18 @@ class HotkeyListener:
                         if self.number_callback:
                             self.number_callback(3)
                 return
+                
+            # F10 - A game tick just happened (re-sync tick phase)
+            if key == Key.f10:
+                if self.tick_sync_callback:
+                    self.tick_sync_callback()
+                return
+                
+            # F11 - Pause/resume autoclicker
+            if key == Key.f11:
+                if self.pause_callback:
+                    self.pause_callback()
+                return
             
             # F9 or ESC - Exit rapid add mode
             if key == Key.f9 or key == Key.esc:
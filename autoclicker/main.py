@@ -5,11 +5,11 @@ This module provides the main entry point to run the autoclicker GUI.
 It can be run directly or imported as a module.
 """
 
-from .gui import AutoClickerGUI
-
 
 def main():
     """Main entry point"""
+    from .gui import AutoClickerGUI
+    
     print("=" * 50)
     print("OSRS AutoClicker")
     print("=" * 50)
@@ -19,6 +19,8 @@ def main():
     print("  F9/ESC - Exit Rapid Add Mode")
     print("  F7     - Start autoclicker")
     print("  F8     - Stop autoclicker")
+    print("  F10    - Sync game tick phase (tick mode)")
+    print("  F11    - Pause/resume autoclicker")
     print("=" * 50)
     print("Rapid Add Mode: F6 -> move mouse -> press number -> repeat -> F9")
     print("=" * 50)
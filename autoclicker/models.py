@@ -2,26 +2,398 @@
 Data models for the autoclicker package.
 
 This module contains the ClickPoint class which represents a single
-click location with its associated settings.
+click location with its associated settings, the PixelCondition class
+that can hold a click back until the screen shows given colours, the
+IdleWait class that holds it back until part of the screen settles, the
+TemplateTarget class that lets a point find its target on screen, the
+InventoryGrid class describing the inventory slots a drop point clicks,
+and the PointTable class which stores a whole sequence of points column
+by column.
 """
 
+import base64
 import random
+from array import array
+from itertools import compress
+
+from .utils import optional_numpy
+
+
+class PixelCondition:
+    """
+    Screen pixels that must show given colours before a click point fires.
+    
+    Conditions are immutable; the transform methods return new ones.
+    """
+    
+    __slots__ = ('pixels', 'tolerance', 'match')
+    
+    MATCH_MODES = ('all', 'any')
+    
+    def __init__(self, pixels, tolerance=10, match='all'):
+        """
+        Initialize the condition.
+        
+        Args:
+            pixels: (x, y, (r, g, b)) tuples - screen pixels and the colour
+                each should show
+            tolerance: Allowed difference per colour channel (0-255)
+            match: 'all' - every pixel must match, 'any' - one is enough
+        """
+        if not pixels:
+            raise ValueError("A pixel condition needs at least one pixel")
+        if match not in self.MATCH_MODES:
+            raise ValueError(f"Unknown pixel match mode: {match}")
+        self.pixels = tuple((int(x), int(y), tuple(int(c) for c in color)) for x, y, color in pixels)
+        self.tolerance = int(tolerance)
+        self.match = match
+        
+    def region(self):
+        """Smallest (x, y, width, height) screen rectangle holding every pixel"""
+        xs = [x for x, _, _ in self.pixels]
+        ys = [y for _, y, _ in self.pixels]
+        return (min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+        
+    def translate(self, dx, dy):
+        """The condition moved by (dx, dy) pixels"""
+        return PixelCondition([(x + dx, y + dy, color) for x, y, color in self.pixels], self.tolerance, self.match)
+        
+    def scale(self, sx, sy, origin=(0, 0)):
+        """The condition scaled around origin"""
+        ox, oy = origin
+        return PixelCondition([(round(ox + (x - ox) * sx), round(oy + (y - oy) * sy), color)
+                               for x, y, color in self.pixels], self.tolerance, self.match)
+                               
+    def to_dict(self):
+        """Convert the condition to a dictionary (colours as '#rrggbb')"""
+        return {
+            'pixels': [[x, y, '#%02x%02x%02x' % color] for x, y, color in self.pixels],
+            'tolerance': self.tolerance,
+            'match': self.match
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        """Create a PixelCondition from a dictionary (colours as '#rrggbb' or [r, g, b])"""
+        pixels = []
+        for x, y, color in data.get('pixels', []):
+            if isinstance(color, str):
+                value = color.lstrip('#')
+                color = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+            pixels.append((x, y, color))
+        return cls(pixels, data.get('tolerance', 10), data.get('match', 'all'))
+        
+    def __eq__(self, other):
+        return (isinstance(other, PixelCondition) and self.pixels == other.pixels
+                and self.tolerance == other.tolerance and self.match == other.match)
+                
+    def __hash__(self):
+        return hash((self.pixels, self.tolerance, self.match))
+
+
+class IdleWait:
+    """
+    Screen region that must settle (or change) before a click point fires.
+    
+    Idle waits are immutable; the transform methods return new ones.
+    """
+    
+    __slots__ = ('x', 'y', 'width', 'height', 'mode', 'frames', 'threshold')
+    
+    # 'idle' - the region moved after the previous click and has since been
+    # still for `frames` captures; 'change' - it differs from how it looked
+    # at the previous click
+    MODES = ('idle', 'change')
+    
+    def __init__(self, x, y, width, height, mode='idle', frames=5, threshold=3.0):
+        """
+        Initialize the idle wait.
+        
+        Args:
+            x, y, width, height: Screen region to watch (e.g. the player or
+                the inventory)
+            mode: 'idle' or 'change' (see MODES)
+            frames: Still captures in a row that count as idle
+            threshold: Mean brightness difference (0-255) between captures
+                that counts as movement
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("An idle wait needs a non-empty region")
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown idle wait mode: {mode}")
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.height = int(height)
+        self.mode = mode
+        self.frames = max(1, int(frames))
+        self.threshold = float(threshold)
+        
+    def region(self):
+        """(x, y, width, height) screen rectangle watched"""
+        return (self.x, self.y, self.width, self.height)
+        
+    def translate(self, dx, dy):
+        """The idle wait moved by (dx, dy) pixels"""
+        return IdleWait(self.x + dx, self.y + dy, self.width, self.height, self.mode, self.frames, self.threshold)
+        
+    def scale(self, sx, sy, origin=(0, 0)):
+        """The idle wait scaled around origin"""
+        ox, oy = origin
+        return IdleWait(round(ox + (self.x - ox) * sx), round(oy + (self.y - oy) * sy), max(1, round(self.width * sx)),
+                        max(1, round(self.height * sy)), self.mode, self.frames, self.threshold)
+                        
+    def to_dict(self):
+        """Convert the idle wait to a dictionary"""
+        return {
+            'region': [self.x, self.y, self.width, self.height],
+            'mode': self.mode,
+            'frames': self.frames,
+            'threshold': self.threshold
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        """Create an IdleWait from a dictionary"""
+        return cls(*data['region'], data.get('mode', 'idle'), data.get('frames', 5), data.get('threshold', 3.0))
+        
+    def _key(self):
+        return (self.x, self.y, self.width, self.height, self.mode, self.frames, self.threshold)
+        
+    def __eq__(self, other):
+        return isinstance(other, IdleWait) and self._key() == other._key()
+        
+    def __hash__(self):
+        return hash(self._key())
+
+
+class TemplateTarget:
+    """
+    Grayscale image patch a click point looks for on screen at run time.
+    
+    The point's x, y is where the target was last seen; the click goes to
+    the anchor pixel of wherever the patch is found.
+    """
+    
+    __slots__ = ('width', 'height', 'pixels', 'anchor_x', 'anchor_y', 'threshold', 'search_radius')
+    
+    def __init__(self, width, height, pixels, anchor_x=None, anchor_y=None, threshold=0.8, search_radius=64):
+        """
+        Initialize the target.
+        
+        Args:
+            width, height: Patch size
+            pixels: Grayscale bytes, row by row (width * height)
+            anchor_x, anchor_y: Click position within the patch (default:
+                its centre)
+            threshold: Minimum match score (normalized cross-correlation,
+                -1 to 1) to accept a location
+            search_radius: Pixels around the last location searched
+                before falling back to the whole screen
+        """
+        if len(pixels) != width * height:
+            raise ValueError(f"Template has {len(pixels)} pixels, expected {width}x{height}")
+        self.width = int(width)
+        self.height = int(height)
+        self.pixels = bytes(pixels)
+        self.anchor_x = int(anchor_x) if anchor_x is not None else self.width // 2
+        self.anchor_y = int(anchor_y) if anchor_y is not None else self.height // 2
+        self.threshold = float(threshold)
+        self.search_radius = int(search_radius)
+        
+    def to_dict(self):
+        """Convert the target to a dictionary (pixels base64-encoded)"""
+        return {
+            'width': self.width,
+            'height': self.height,
+            'pixels': base64.b64encode(self.pixels).decode('ascii'),
+            'anchor': [self.anchor_x, self.anchor_y],
+            'threshold': self.threshold,
+            'search_radius': self.search_radius
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        """Create a TemplateTarget from a dictionary"""
+        anchor = data.get('anchor') or (None, None)
+        return cls(data['width'], data['height'], base64.b64decode(data['pixels']), anchor[0], anchor[1],
+                   data.get('threshold', 0.8), data.get('search_radius', 64))
+                   
+    def _key(self):
+        return (self.width, self.height, self.pixels, self.anchor_x, self.anchor_y, self.threshold,
+                self.search_radius)
+                
+    def __eq__(self, other):
+        return isinstance(other, TemplateTarget) and self._key() == other._key()
+        
+    def __hash__(self):
+        return hash(self._key())
+
+
+class InventoryGrid:
+    """
+    Inventory slots laid out on a regular grid (the game's 4x7 by default).
+    
+    Slots are numbered row by row from the top left. A click point with a
+    grid drops the inventory: it clicks every occupied slot, in snake
+    order so each click is next to the previous one. Grids are immutable;
+    the transform methods return new ones.
+    """
+    
+    __slots__ = ('x', 'y', 'pitch_x', 'pitch_y', 'columns', 'rows', 'order', 'background', 'tolerance', 'min_fill')
+    
+    ORDERS = ('rows', 'columns')
+    
+    def __init__(self, x, y, pitch_x=42, pitch_y=36, columns=4, rows=7, order='rows', background=(62, 53, 41),
+                 tolerance=20, min_fill=0.08):
+        """
+        Initialize the grid.
+        
+        Args:
+            x, y: Centre of the top left slot
+            pitch_x, pitch_y: Distance between neighbouring slot centres
+            columns, rows: Grid size
+            order: 'rows' - along each row, alternating direction, or
+                'columns' - down and up the columns
+            background: (r, g, b) colour of an empty slot
+            tolerance: Allowed difference per colour channel for a pixel
+                to still count as background
+            min_fill: Fraction of non-background pixels (in the middle of
+                a slot) above which the slot counts as occupied
+        """
+        if columns < 1 or rows < 1:
+            raise ValueError("An inventory grid needs at least one row and column")
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown slot order: {order}")
+        self.x = int(x)
+        self.y = int(y)
+        self.pitch_x = float(pitch_x)
+        self.pitch_y = float(pitch_y)
+        self.columns = int(columns)
+        self.rows = int(rows)
+        self.order = order
+        self.background = tuple(int(c) for c in background)
+        self.tolerance = int(tolerance)
+        self.min_fill = float(min_fill)
+        
+    @classmethod
+    def calibrate(cls, first, last, columns=4, rows=7, **options):
+        """
+        Create a grid from the centres of its top left and bottom right slots.
+        
+        Args:
+            first, last: (x, y) centres of the first and last slot
+            columns, rows: Grid size
+            options: Other InventoryGrid arguments
+        """
+        pitch_x = (last[0] - first[0]) / (columns - 1) if columns > 1 else 0
+        pitch_y = (last[1] - first[1]) / (rows - 1) if rows > 1 else 0
+        return cls(first[0], first[1], pitch_x, pitch_y, columns, rows, **options)
+        
+    def __len__(self):
+        return self.columns * self.rows
+        
+    def center(self, slot):
+        """Screen position of a slot's centre"""
+        row, column = divmod(slot, self.columns)
+        return (round(self.x + column * self.pitch_x), round(self.y + row * self.pitch_y))
+        
+    def slot_order(self):
+        """Slot numbers in click order (snake, so consecutive slots are neighbours)"""
+        columns, rows = self.columns, self.rows
+        if self.order == 'rows':
+            return [r * columns + (c if r % 2 == 0 else columns - 1 - c) for r in range(rows) for c in range(columns)]
+        return [(r if c % 2 == 0 else rows - 1 - r) * columns + c for c in range(columns) for r in range(rows)]
+        
+    def window(self):
+        """(width, height) of the patch in the middle of each slot that is checked for an item"""
+        return (max(1, round(abs(self.pitch_x) * 0.6)), max(1, round(abs(self.pitch_y) * 0.6)))
+        
+    def region(self):
+        """Smallest (x, y, width, height) screen rectangle holding every slot's window"""
+        width, height = self.window()
+        xs = [self.center(slot)[0] for slot in (0, self.columns - 1)]
+        ys = [self.center(slot)[1] for slot in (0, len(self) - 1)]
+        return (min(xs) - width // 2, min(ys) - height // 2, max(xs) - min(xs) + width, max(ys) - min(ys) + height)
+        
+    def replace(self, **changes):
+        """Copy of the grid with some arguments changed"""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return InventoryGrid(**values)
+        
+    def translate(self, dx, dy):
+        """The grid moved by (dx, dy) pixels"""
+        return self.replace(x=self.x + dx, y=self.y + dy)
+        
+    def scale(self, sx, sy, origin=(0, 0)):
+        """The grid scaled around origin"""
+        ox, oy = origin
+        return self.replace(x=round(ox + (self.x - ox) * sx), y=round(oy + (self.y - oy) * sy),
+                             pitch_x=self.pitch_x * sx, pitch_y=self.pitch_y * sy)
+                             
+    def to_dict(self):
+        """Convert the grid to a dictionary (background as '#rrggbb')"""
+        return {
+            'first': [self.x, self.y],
+            'pitch': [self.pitch_x, self.pitch_y],
+            'columns': self.columns,
+            'rows': self.rows,
+            'order': self.order,
+            'background': '#%02x%02x%02x' % self.background,
+            'tolerance': self.tolerance,
+            'min_fill': self.min_fill
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        """Create an InventoryGrid from a dictionary"""
+        background = data.get('background', '#3e3529')
+        if isinstance(background, str):
+            value = background.lstrip('#')
+            background = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+        x, y = data['first']
+        pitch_x, pitch_y = data.get('pitch', (42, 36))
+        return cls(x, y, pitch_x, pitch_y, data.get('columns', 4), data.get('rows', 7), data.get('order', 'rows'),
+                   background, data.get('tolerance', 20), data.get('min_fill', 0.08))
+                   
+    def _key(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+        
+    def __eq__(self, other):
+        return isinstance(other, InventoryGrid) and self._key() == other._key()
+        
+    def __hash__(self):
+        return hash(self._key())
 
 
 class ClickPoint:
     """Represents a single click location with its settings"""
     
-    def __init__(self, x=0, y=0, delay=8.0, randomize=False, random_range=0):
+    __slots__ = ('x', 'y', 'delay', 'randomize', 'random_range', 'enabled', 'condition', 'template', 'inventory',
+                 'idle')
+    
+    def __init__(self, x=0, y=0, delay=8.0, randomize=False, random_range=0, condition=None, template=None,
+                 inventory=None, idle=None):
         self.x = x
         self.y = y
         self.delay = delay  # Delay AFTER this click (before next click)
         self.randomize = randomize
         self.random_range = random_range  # Random offset range in pixels
         self.enabled = True
+        # PixelCondition: fire as soon as it matches instead of waiting out
+        # the previous delay, which becomes the timeout
+        self.condition = condition
+        # TemplateTarget: click wherever this image is found instead of at x, y
+        self.template = template
+        # InventoryGrid: click every occupied slot (delay apart) instead of x, y
+        self.inventory = inventory
+        # IdleWait: like a condition, fire once a screen region settles
+        self.idle = idle
     
     def to_dict(self):
         """Convert ClickPoint to dictionary for serialization."""
-        return {
+        data = {
             'x': self.x,
             'y': self.y,
             'delay': self.delay,
@@ -29,6 +401,15 @@ class ClickPoint:
             'random_range': self.random_range,
             'enabled': self.enabled
         }
+        if self.condition is not None:
+            data['condition'] = self.condition.to_dict()
+        if self.template is not None:
+            data['template'] = self.template.to_dict()
+        if self.inventory is not None:
+            data['inventory'] = self.inventory.to_dict()
+        if self.idle is not None:
+            data['idle'] = self.idle.to_dict()
+        return data
     
     @classmethod
     def from_dict(cls, data):
@@ -38,7 +419,11 @@ class ClickPoint:
             y=data.get('y', 0),
             delay=data.get('delay', 8.0),
             randomize=data.get('randomize', False),
-            random_range=data.get('random_range', 0)
+            random_range=data.get('random_range', 0),
+            condition=PixelCondition.from_dict(data['condition']) if data.get('condition') else None,
+            template=TemplateTarget.from_dict(data['template']) if data.get('template') else None,
+            inventory=InventoryGrid.from_dict(data['inventory']) if data.get('inventory') else None,
+            idle=IdleWait.from_dict(data['idle']) if data.get('idle') else None
         )
         cp.enabled = data.get('enabled', True)
         return cp
@@ -50,3 +435,209 @@ class ClickPoint:
             offset_y = random.randint(-self.random_range, self.random_range)
             return (self.x + offset_x, self.y + offset_y)
         return (self.x, self.y)
+
+
+class PointTable:
+    """
+    Sequence of click points stored as contiguous columns.
+    
+    Behaves like a list of ClickPoints (indexing returns a ClickPoint copy;
+    assign it back to store changes) and adds bulk transforms that work on
+    whole columns at once.
+    """
+    
+    def __init__(self, points=()):
+        self.xs = array('i')
+        self.ys = array('i')
+        self.delays = array('d')
+        self.randomize = bytearray()
+        self.ranges = array('i')
+        self.enabled = bytearray()
+        self.conditions = []  # PixelCondition or None per point
+        self.templates = []  # TemplateTarget or None per point
+        self.inventories = []  # InventoryGrid or None per point
+        self.idles = []  # IdleWait or None per point
+        self._used_regions = None  # Region columns holding any object (None = recount)
+        for point in points:
+            self.append(point)
+    
+    def __len__(self):
+        return len(self.xs)
+    
+    def __getitem__(self, index):
+        """Get a ClickPoint copy of the row at index"""
+        point = ClickPoint(self.xs[index], self.ys[index], self.delays[index],
+                           bool(self.randomize[index]), self.ranges[index], self.conditions[index],
+                           self.templates[index], self.inventories[index], self.idles[index])
+        point.enabled = bool(self.enabled[index])
+        return point
+    
+    def __setitem__(self, index, point):
+        """Store a ClickPoint into the row at index"""
+        self.xs[index] = int(point.x)
+        self.ys[index] = int(point.y)
+        self.delays[index] = float(point.delay)
+        self.randomize[index] = bool(point.randomize)
+        self.ranges[index] = int(point.random_range)
+        self.enabled[index] = bool(point.enabled)
+        self.conditions[index] = point.condition
+        self.templates[index] = point.template
+        self.inventories[index] = point.inventory
+        self.idles[index] = point.idle
+        self._used_regions = None
+    
+    def __delitem__(self, index):
+        for column in self._columns():
+            del column[index]
+        self._used_regions = None
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def _columns(self):
+        """All column arrays, in a fixed order"""
+        return (self.xs, self.ys, self.delays, self.randomize, self.ranges, self.enabled, self.conditions,
+                self.templates, self.inventories, self.idles)
+    
+    def append(self, point):
+        """Append a ClickPoint"""
+        self.xs.append(int(point.x))
+        self.ys.append(int(point.y))
+        self.delays.append(float(point.delay))
+        self.randomize.append(bool(point.randomize))
+        self.ranges.append(int(point.random_range))
+        self.enabled.append(bool(point.enabled))
+        self.conditions.append(point.condition)
+        self.templates.append(point.template)
+        self.inventories.append(point.inventory)
+        self.idles.append(point.idle)
+        self._used_regions = None
+    
+    def insert(self, index, point):
+        """Insert a ClickPoint before index"""
+        self.xs.insert(index, int(point.x))
+        self.ys.insert(index, int(point.y))
+        self.delays.insert(index, float(point.delay))
+        self.randomize.insert(index, bool(point.randomize))
+        self.ranges.insert(index, int(point.random_range))
+        self.enabled.insert(index, bool(point.enabled))
+        self.conditions.insert(index, point.condition)
+        self.templates.insert(index, point.template)
+        self.inventories.insert(index, point.inventory)
+        self.idles.insert(index, point.idle)
+        self._used_regions = None
+    
+    def clear(self):
+        """Remove all points"""
+        for column in self._columns():
+            del column[:]
+        self._used_regions = None
+        
+    def _region_columns(self):
+        """
+        Names of the columns of screen regions that move with their points
+        (conditions, inventory grids, idle waits) holding any object.
+        
+        Counted once after each edit (list.count runs in C), so repeated
+        transforms of points without regions stay array-only.
+        """
+        if self._used_regions is None:
+            self._used_regions = [name for name in ('conditions', 'inventories', 'idles')
+                                  if getattr(self, name).count(None) != len(self)]
+        return self._used_regions
+    
+    def translate(self, dx, dy):
+        """Move every point (and its screen regions) by (dx, dy) pixels"""
+        for name in self._region_columns():
+            setattr(self, name, [r and r.translate(dx, dy) for r in getattr(self, name)])
+        np = optional_numpy()
+        if np is not None:
+            # In-place on the column buffers - no per-point Python work
+            np.frombuffer(self.xs, dtype=np.intc)[:] += int(dx)
+            np.frombuffer(self.ys, dtype=np.intc)[:] += int(dy)
+            return
+        if dx:
+            self.xs = array('i', map(int(dx).__add__, self.xs))
+        if dy:
+            self.ys = array('i', map(int(dy).__add__, self.ys))
+    
+    def scale(self, sx, sy=None, origin=(0, 0)):
+        """Scale every point around origin, e.g. for a resized game client"""
+        if sy is None:
+            sy = sx
+        ox, oy = origin
+        for name in self._region_columns():
+            setattr(self, name, [r and r.scale(sx, sy, origin) for r in getattr(self, name)])
+        np = optional_numpy()
+        if np is not None:
+            xs = np.frombuffer(self.xs, dtype=np.intc)
+            ys = np.frombuffer(self.ys, dtype=np.intc)
+            xs[:] = np.rint(ox + (xs - ox) * sx)
+            ys[:] = np.rint(oy + (ys - oy) * sy)
+            return
+        self.xs = array('i', [round(ox + (x - ox) * sx) for x in self.xs])
+        self.ys = array('i', [round(oy + (y - oy) * sy) for y in self.ys])
+    
+    def scale_delays(self, factor):
+        """Multiply every delay by factor"""
+        np = optional_numpy()
+        if np is not None:
+            np.frombuffer(self.delays, dtype=np.double)[:] *= float(factor)
+            return
+        self.delays = array('d', map(float(factor).__mul__, self.delays))
+    
+    def set_enabled(self, mask):
+        """Enable or disable points: mask is a bool for all, or one bool per point"""
+        if isinstance(mask, bool):
+            self.enabled = bytearray([mask]) * len(self)
+        else:
+            mask = bytearray(map(bool, mask))
+            if len(mask) != len(self):
+                raise ValueError(f"Mask has {len(mask)} entries for {len(self)} points")
+            self.enabled = mask
+    
+    def enabled_indices(self):
+        """Indices of the enabled points"""
+        return list(compress(range(len(self)), self.enabled))
+    
+    def to_dicts(self):
+        """Serialize every point straight from the columns"""
+        dicts = [
+            {
+                'x': x,
+                'y': y,
+                'delay': delay,
+                'randomize': bool(randomize),
+                'random_range': random_range,
+                'enabled': bool(enabled)
+            }
+            for x, y, delay, randomize, random_range, enabled in zip(*self._columns()[:6])
+        ]
+        for data, condition, template, inventory, idle in zip(dicts, self.conditions, self.templates, self.inventories,
+                                                              self.idles):
+            if condition is not None:
+                data['condition'] = condition.to_dict()
+            if template is not None:
+                data['template'] = template.to_dict()
+            if inventory is not None:
+                data['inventory'] = inventory.to_dict()
+            if idle is not None:
+                data['idle'] = idle.to_dict()
+        return dicts
+    
+    @classmethod
+    def from_dicts(cls, data):
+        """Create a PointTable from a list of point dictionaries"""
+        table = cls()
+        table.xs = array('i', [int(d.get('x', 0)) for d in data])
+        table.ys = array('i', [int(d.get('y', 0)) for d in data])
+        table.delays = array('d', [float(d.get('delay', 8.0)) for d in data])
+        table.randomize = bytearray([bool(d.get('randomize', False)) for d in data])
+        table.ranges = array('i', [int(d.get('random_range', 0)) for d in data])
+        table.enabled = bytearray([bool(d.get('enabled', True)) for d in data])
+        table.conditions = [PixelCondition.from_dict(d['condition']) if d.get('condition') else None for d in data]
+        table.templates = [TemplateTarget.from_dict(d['template']) if d.get('template') else None for d in data]
+        table.inventories = [InventoryGrid.from_dict(d['inventory']) if d.get('inventory') else None for d in data]
+        table.idles = [IdleWait.from_dict(d['idle']) if d.get('idle') else None for d in data]
+        return table
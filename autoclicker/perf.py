@@ -0,0 +1,213 @@
+"""
+Performance profile module.
+
+Contains the PerformanceProfile class, which tunes the thread running the
+click loop for the duration of a run: CPU pinning, scheduling priority
+and garbage collector control. Each option degrades gracefully when the
+platform or the process's permissions don't allow it, and what was
+actually applied is reported in the run statistics.
+"""
+
+import gc
+import os
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PRIORITY_NAMES = ('normal', 'high', 'realtime')
+
+POLICY_NAMES = ('default', 'nice', 'fifo')  # Indexed by applied_policy
+
+# Bits of PerformanceProfile.failures
+PIN_FAILED = 1
+FIFO_DENIED = 2
+NICE_DENIED = 4
+
+FAILURE_NOTES = {
+    PIN_FAILED: "CPU pinning failed",
+    FIFO_DENIED: "SCHED_FIFO not permitted",
+    NICE_DENIED: "nice not permitted",
+}
+
+# Raw results, in the order counters() returns them
+COUNTER_FIELDS = ('applied_cpu', 'applied_policy', 'applied_nice', 'failures', 'gc_collections',
+                  'gc_pause_ns', 'gc_max_pause_ns', 'involuntary_switches')
+
+
+class PerformanceProfile:
+    """Thread tuning applied to the click thread during a run"""
+    
+    def __init__(self, cpu=None, priority='normal', gc_control=False, nice=-10, rt_priority=10):
+        """
+        Initialize the profile.
+        
+        Args:
+            cpu: Core to pin the click thread to (None = no pinning)
+            priority: 'normal', 'high' (lower nice value) or 'realtime'
+                (SCHED_FIFO, falling back to 'high' when not permitted)
+            gc_control: Freeze and disable the garbage collector during a
+                run, collecting only between loops
+            nice: Nice value used for 'high'
+            rt_priority: SCHED_FIFO priority used for 'realtime'
+        """
+        if priority not in PRIORITY_NAMES:
+            raise ValueError(f"Unknown priority: {priority}")
+        self.cpu = cpu
+        self.priority = priority
+        self.gc_control = gc_control
+        self.nice = nice
+        self.rt_priority = rt_priority
+        self._saved = {}
+        self._tid = None
+        self._gc_was_enabled = True
+        self._switches_at_start = 0
+        self._reset_counters()
+        
+    def _reset_counters(self):
+        """Clear the results of the last run"""
+        self.applied_cpu = -1
+        self.applied_policy = 0
+        self.applied_nice = 0
+        self.failures = 0
+        self.gc_collections = 0
+        self.gc_pause_ns = 0
+        self.gc_max_pause_ns = 0
+        self.involuntary_switches = 0
+        
+    @property
+    def enabled(self):
+        """True if any option is switched on"""
+        return self.cpu is not None or self.priority != 'normal' or self.gc_control
+        
+    def to_dict(self):
+        """Settings as a dict (for handing to another process)"""
+        return {
+            'cpu': self.cpu,
+            'priority': self.priority,
+            'gc_control': self.gc_control,
+            'nice': self.nice,
+            'rt_priority': self.rt_priority,
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        """Create a profile from to_dict() output"""
+        return cls(**data)
+        
+    def apply(self):
+        """Apply the profile to the calling thread (call from the click thread)"""
+        self._reset_counters()
+        self._saved = {}
+        self._tid = threading.get_native_id()
+        if self.cpu is not None:
+            self._pin()
+        if self.priority == 'realtime':
+            if not self._set_fifo():
+                self._set_nice()
+        elif self.priority == 'high':
+            self._set_nice()
+        if self.gc_control:
+            # Everything allocated so far (modules, the plan, the GUI) is
+            # moved out of the collector's reach; the loop itself allocates
+            # little, so collecting only between loops is enough
+            self._gc_was_enabled = gc.isenabled()
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+        self._switches_at_start = self._involuntary_switches()
+        
+    def _pin(self):
+        """Pin the thread to self.cpu"""
+        try:
+            self._saved['affinity'] = os.sched_getaffinity(self._tid)
+            os.sched_setaffinity(self._tid, {self.cpu})
+            self.applied_cpu = self.cpu
+        except (AttributeError, OSError, ValueError):
+            self._saved.pop('affinity', None)
+            self.failures |= PIN_FAILED
+            
+    def _set_fifo(self):
+        """Switch the thread to SCHED_FIFO, returning False if not permitted"""
+        try:
+            self._saved['policy'] = (os.sched_getscheduler(self._tid), os.sched_getparam(self._tid))
+            os.sched_setscheduler(self._tid, os.SCHED_FIFO, os.sched_param(self.rt_priority))
+            self.applied_policy = POLICY_NAMES.index('fifo')
+            return True
+        except (AttributeError, OSError):
+            self._saved.pop('policy', None)
+            self.failures |= FIFO_DENIED
+            return False
+            
+    def _set_nice(self):
+        """Lower the thread's nice value (Linux applies it per thread id)"""
+        try:
+            current = os.getpriority(os.PRIO_PROCESS, self._tid)
+            os.setpriority(os.PRIO_PROCESS, self._tid, self.nice)
+            self._saved['nice'] = current
+            self.applied_policy = POLICY_NAMES.index('nice')
+            self.applied_nice = self.nice
+        except (AttributeError, OSError):
+            self.failures |= NICE_DENIED
+            
+    def _involuntary_switches(self):
+        """Times the calling thread was preempted so far (0 where unsupported)"""
+        if resource is None or not hasattr(resource, 'RUSAGE_THREAD'):
+            return 0
+        return resource.getrusage(resource.RUSAGE_THREAD).ru_nivcsw
+        
+    def between_loops(self):
+        """Collect garbage at a loop boundary and update the counters (click thread)"""
+        if self.gc_control:
+            start = time.perf_counter_ns()
+            gc.collect()
+            pause = time.perf_counter_ns() - start
+            self.gc_collections += 1
+            self.gc_pause_ns += pause
+            if pause > self.gc_max_pause_ns:
+                self.gc_max_pause_ns = pause
+        self.involuntary_switches = self._involuntary_switches() - self._switches_at_start
+        
+    def restore(self):
+        """Undo apply() (call from the same thread)"""
+        self.involuntary_switches = self._involuntary_switches() - self._switches_at_start
+        if self.gc_control:
+            gc.unfreeze()
+            if self._gc_was_enabled:
+                gc.enable()
+        try:
+            if 'nice' in self._saved:
+                os.setpriority(os.PRIO_PROCESS, self._tid, self._saved['nice'])
+            if 'policy' in self._saved:
+                policy, param = self._saved['policy']
+                os.sched_setscheduler(self._tid, policy, param)
+            if 'affinity' in self._saved:
+                os.sched_setaffinity(self._tid, self._saved['affinity'])
+        except OSError:
+            pass  # The thread is about to exit anyway
+        self._saved = {}
+        
+    def counters(self):
+        """Raw results as a tuple of ints (see COUNTER_FIELDS)"""
+        return tuple(getattr(self, name) for name in COUNTER_FIELDS)
+        
+    def load_counters(self, values):
+        """Set the raw results, e.g. from another process's counters()"""
+        for name, value in zip(COUNTER_FIELDS, values):
+            setattr(self, name, value)
+            
+    def get_stats(self):
+        """Get what was applied and what it achieved"""
+        return {
+            'perf_cpu': self.applied_cpu if self.applied_cpu >= 0 else None,
+            'perf_policy': POLICY_NAMES[self.applied_policy],
+            'perf_nice': self.applied_nice,
+            'perf_notes': [note for bit, note in FAILURE_NOTES.items() if self.failures & bit],
+            'gc_collections': self.gc_collections,
+            'gc_pause_ms': self.gc_pause_ns / 1e6,
+            'gc_max_pause_ms': self.gc_max_pause_ns / 1e6,
+            'involuntary_switches': self.involuntary_switches,
+        }
@@ -0,0 +1,209 @@
+"""
+Compiled click plan module.
+
+This module contains the ClickPlan class, an array-backed snapshot of
+the enabled click points. Randomized click positions and delays are
+drawn for many passes over the plan at once (one vectorized draw when
+NumPy is installed), so the click loop only indexes arrays instead of
+walking ClickPoint objects or drawing random numbers.
+"""
+
+import random
+from array import array
+from itertools import compress
+
+from .utils import optional_numpy
+
+DELAY_VARIATION = 0.05  # ±5% randomization applied to every delay
+MIN_DELAY = 0.1  # Randomized delays never go below this
+BLOCK_SIZE = 4096  # Entries drawn at once (whole passes, at least one)
+
+
+def draw_block(xs, ys, spreads, delays, passes):
+    """
+    Draw randomized positions and delays for several passes over a plan.
+    
+    Args:
+        xs, ys, spreads, delays: The plan's columns
+        passes: Number of passes to draw
+        
+    Returns:
+        (xs, ys, delays) arrays of len(xs) * passes entries, pass after
+        pass: positions offset by a uniform integer in [-spread, spread],
+        delays varied by ±DELAY_VARIATION and at least MIN_DELAY
+    """
+    np = optional_numpy()
+    if np is not None:
+        rng = np.random.default_rng()
+        spread = np.tile(np.frombuffer(spreads, dtype=np.int32), passes)
+        span = 2 * spread + 1
+        px = np.tile(np.frombuffer(xs, dtype=np.int32), passes) + rng.integers(0, span) - spread
+        py = np.tile(np.frombuffer(ys, dtype=np.int32), passes) + rng.integers(0, span) - spread
+        base = np.tile(np.frombuffer(delays, dtype=np.float64), passes)
+        varied = np.maximum(base + base * DELAY_VARIATION * (2 * rng.random(len(base)) - 1), MIN_DELAY)
+        columns = []
+        for values, typecode, dtype in ((px, 'i', np.int32), (py, 'i', np.int32), (varied, 'd', np.float64)):
+            column = array(typecode)
+            column.frombytes(values.astype(dtype).tobytes())
+            columns.append(column)
+        return tuple(columns)
+    randint = random.randint
+    rand = random.random
+    px, py, varied = array('i'), array('i'), array('d')
+    for _ in range(passes):
+        for x, y, spread, delay in zip(xs, ys, spreads, delays):
+            if spread:
+                x += randint(-spread, spread)
+                y += randint(-spread, spread)
+            px.append(x)
+            py.append(y)
+            delay += delay * DELAY_VARIATION * (2 * rand() - 1)
+            varied.append(delay if delay > MIN_DELAY else MIN_DELAY)
+    return px, py, varied
+
+
+class ClickPlan:
+    """Struct-of-arrays snapshot of the enabled click points"""
+    
+    __slots__ = ('xs', 'ys', 'spreads', 'delays', 'indices', 'conditions', 'templates', 'grids', 'slots', 'idles',
+                 '_xs', '_ys', '_delays', '_base')
+    
+    def __init__(self, xs, ys, spreads, delays, indices, conditions=None, templates=None, grids=None, slots=None,
+                 idles=None):
+        """
+        Initialize the plan (use ClickPlan.compile to build one from points).
+        
+        Args:
+            xs, ys: Target coordinates ('i' arrays)
+            spreads: Randomization range per point, 0 = exact ('i' array)
+            delays: Delay after each click in seconds ('d' array)
+            indices: Index of each entry in the original point list ('i' array)
+            conditions: PixelCondition or None per entry (default: none)
+            templates: TemplateTarget or None per entry (default: none)
+            grids: InventoryGrid or None per entry (default: none)
+            slots: Inventory slot of each entry, -1 if it has no grid ('i' array)
+            idles: IdleWait or None per entry (default: none)
+        """
+        self.xs = xs
+        self.ys = ys
+        self.spreads = spreads
+        self.delays = delays
+        self.indices = indices
+        self.conditions = tuple(conditions) if conditions is not None else (None,) * len(xs)
+        self.templates = tuple(templates) if templates is not None else (None,) * len(xs)
+        self.grids = tuple(grids) if grids is not None else (None,) * len(xs)
+        self.slots = slots if slots is not None else array('i', [-1]) * len(xs)
+        self.idles = tuple(idles) if idles is not None else (None,) * len(xs)
+        # Randomized positions and delays of the current pass start at _base
+        # in the drawn columns; drawn before the run, so no click pays for it
+        self._xs = self._ys = self._delays = ()
+        self._base = 0
+        self._draw()
+        
+    @classmethod
+    def compile(cls, points):
+        """
+        Compile a PointTable or sequence of ClickPoints, keeping only enabled points.
+        
+        A point with an inventory grid becomes one entry per slot, in the
+        grid's click order, each with the point's delay; its pixel
+        condition and idle wait stay with the first slot.
+        """
+        if hasattr(points, 'enabled_indices'):
+            return cls.from_table(points)
+        xs, ys, spreads, delays, indices, slots = array('i'), array('i'), array('i'), array('d'), array('i'), array('i')
+        conditions = []
+        templates = []
+        grids = []
+        idles = []
+        for i, point in enumerate(points):
+            if not point.enabled:
+                continue
+            grid = point.inventory
+            if grid is not None:
+                for n, slot in enumerate(grid.slot_order()):
+                    x, y = grid.center(slot)
+                    xs.append(x)
+                    ys.append(y)
+                    spreads.append(int(point.random_range) if point.randomize else 0)
+                    delays.append(float(point.delay))
+                    indices.append(i)
+                    conditions.append(point.condition if n == 0 else None)
+                    idles.append(point.idle if n == 0 else None)
+                    templates.append(None)
+                    grids.append(grid)
+                    slots.append(slot)
+                continue
+            xs.append(int(point.x))
+            ys.append(int(point.y))
+            spreads.append(int(point.random_range) if point.randomize else 0)
+            delays.append(float(point.delay))
+            indices.append(i)
+            conditions.append(point.condition)
+            templates.append(point.template)
+            grids.append(None)
+            slots.append(-1)
+            idles.append(point.idle)
+        return cls(xs, ys, spreads, delays, indices, conditions, templates, grids, slots, idles)
+        
+    @classmethod
+    def from_table(cls, table):
+        """Compile straight from a PointTable's columns"""
+        if any(grid is not None for grid in table.inventories):
+            return cls.compile(iter(table))  # Grids expand into one entry per slot
+        mask = table.enabled
+        spreads = array('i', [r if on else 0 for r, on in zip(table.ranges, table.randomize)])
+        return cls(
+            array('i', compress(table.xs, mask)),
+            array('i', compress(table.ys, mask)),
+            array('i', compress(spreads, mask)),
+            array('d', compress(table.delays, mask)),
+            array('i', table.enabled_indices()),
+            compress(table.conditions, mask),
+            compress(table.templates, mask),
+            idles=compress(table.idles, mask),
+        )
+        
+    def __len__(self):
+        return len(self.xs)
+        
+    def has_conditions(self):
+        """True if any entry waits for a pixel condition"""
+        return any(c is not None for c in self.conditions)
+        
+    def has_templates(self):
+        """True if any entry looks for its target on screen"""
+        return any(t is not None for t in self.templates)
+        
+    def has_idles(self):
+        """True if any entry waits for part of the screen to settle"""
+        return any(w is not None for w in self.idles)
+        
+    def has_grids(self):
+        """True if any entry is an inventory slot"""
+        return any(g is not None for g in self.grids)
+        
+    def _draw(self):
+        """Draw randomized positions and delays for the next passes"""
+        count = len(self.xs)
+        if count:
+            self._xs, self._ys, self._delays = draw_block(self.xs, self.ys, self.spreads, self.delays,
+                                                          max(1, BLOCK_SIZE // count))
+        self._base = 0
+        
+    def next_pass(self):
+        """Move on to the next pass's randomization (call after each loop)"""
+        base = self._base + len(self.xs)
+        if base >= len(self._xs):
+            self._draw()  # Between loops, so the draw never delays a click
+        else:
+            self._base = base
+            
+    def position(self, j):
+        """Click position for entry j in the current pass, with randomization if enabled"""
+        j += self._base
+        return (self._xs[j], self._ys[j])
+        
+    def delay(self, j):
+        """Delay after entry j in the current pass, with ±5% randomization (never below 0.1s)"""
+        return self._delays[self._base + j]
@@ -0,0 +1,412 @@
+"""
+Process-isolated engine module.
+
+Contains the ProcessAutoClicker class, which runs the click loop in a
+separate process so it never competes for a GIL with the Tk GUI or the
+hotkey listener. Commands go to the engine process over a pipe; live
+counters come back through a shared-memory block guarded by a sequence
+lock, so neither side ever blocks on the other to read or write them.
+Engine events are forwarded over the pipe in batches and republished on
+the local event bus, so GUI and loggers work unchanged.
+"""
+
+import multiprocessing
+import struct
+import threading
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+from .backends import create_backend
+from .core import AutoClicker
+from .events import ClickEvent, EventConsumer
+from .perf import COUNTER_FIELDS, PerformanceProfile
+from .scheduler import NS_PER_SECOND
+from .telemetry import ClickTelemetry
+
+# Sequence counter followed by the telemetry body; the counter is odd
+# while the engine process is writing the body
+_SEQ = struct.Struct('<Q')
+_BODY = struct.Struct(f'<BB6x{23 + len(COUNTER_FIELDS)}q')
+TELEMETRY_SIZE = _SEQ.size + _BODY.size
+
+# The click timing histograms follow the counters; they are only ever
+# incremented, so torn reads are off by at most one click
+SHARED_SIZE = TELEMETRY_SIZE + ClickTelemetry.NBYTES
+
+# Clicks publish at most one snapshot per GUI frame; other events always do
+WRITE_INTERVAL_NS = NS_PER_SECOND // 60
+
+# A reader that keeps meeting a write in progress gives up after this many
+# attempts and returns its last consistent snapshot
+MAX_READ_RETRIES = 100
+
+Telemetry = namedtuple('Telemetry', 'running paused current_loop click_count last_click_ns drift_ns '
+                                    'max_drift_ns total_drift_ns waits origin_ns scheduled_ns '
+                                    'pause_latency_ns stop_latency_ns cursor_queries '
+                                    'cursor_queries_skipped foreign_motion_events settle_ns '
+                                    'condition_hits condition_misses condition_saved_ns slots_skipped '
+                                    'slots_saved_ns idle_hits idle_misses idle_saved_ns '
+                                    + ' '.join(COUNTER_FIELDS))
+
+
+class TelemetryWriter:
+    """Event bus sink that mirrors engine counters into shared memory"""
+    
+    name = 'telemetry'
+    dropped = 0
+    
+    def __init__(self, buf, engine):
+        """
+        Initialize the writer.
+        
+        Args:
+            buf: Shared memory buffer of at least TELEMETRY_SIZE bytes
+            engine: AutoClicker whose counters are published
+        """
+        self.buf = buf
+        self.engine = engine
+        self.seq = 0
+        self.last_click_ns = 0
+        self.written_ns = -WRITE_INTERVAL_NS
+        
+    def offer(self, event):
+        """Publish a fresh snapshot for an engine event (called on the engine thread)"""
+        if isinstance(event, ClickEvent):
+            self.last_click_ns = event.timestamp_ns
+            if event.timestamp_ns - self.written_ns < WRITE_INTERVAL_NS:
+                return
+            self.written_ns = event.timestamp_ns
+        self.write()
+        
+    def write(self):
+        """Write a snapshot of the engine's counters"""
+        engine = self.engine
+        scheduler = engine.scheduler
+        cursor = engine.cursor
+        body = (engine.running, engine.paused, engine.current_loop, engine.click_count, self.last_click_ns,
+                scheduler.drift_ns, scheduler.max_drift_ns, scheduler.total_drift_ns, scheduler.waits,
+                scheduler.origin_ns, scheduler.scheduled_ns, engine.pause_latency_ns, engine.stop_latency_ns,
+                cursor.queries, cursor.skipped_queries, cursor.foreign_events, int(cursor.settle_time() * 1e9),
+                engine.condition_hits, engine.condition_misses, engine.condition_saved_ns, engine.slots_skipped,
+                engine.slots_saved_ns, engine.idle_hits, engine.idle_misses, engine.idle_saved_ns,
+                *engine.performance.counters())
+        # Readers retry while the counter is odd or changed under them
+        self.seq += 1
+        _SEQ.pack_into(self.buf, 0, self.seq)
+        _BODY.pack_into(self.buf, _SEQ.size, *body)
+        self.seq += 1
+        _SEQ.pack_into(self.buf, 0, self.seq)
+
+
+class TelemetryReader:
+    """Lock-free reader for a TelemetryWriter's shared memory"""
+    
+    def __init__(self, buf):
+        self.buf = buf
+        self.last = Telemetry(*[0] * len(Telemetry._fields))
+        
+    def read(self):
+        """
+        Read a consistent snapshot as a Telemetry tuple.
+        
+        Returns:
+            The current snapshot, or the last consistent one if the writer
+            stayed mid-write for MAX_READ_RETRIES attempts
+        """
+        for _ in range(MAX_READ_RETRIES):
+            seq = _SEQ.unpack_from(self.buf, 0)[0]
+            if not seq & 1:
+                body = _BODY.unpack_from(self.buf, _SEQ.size)
+                if _SEQ.unpack_from(self.buf, 0)[0] == seq:
+                    self.last = Telemetry(*body)
+                    return self.last
+            # Let the writer's thread or process finish
+            time.sleep(0)
+        return self.last
+
+
+class EventForwarder(EventConsumer):
+    """Sends engine events to the parent process in batches"""
+    
+    def __init__(self, bus, conn, interval=0.02):
+        super().__init__(bus, 'forwarder', interval, maxlen=65536)
+        self.conn = conn
+        
+    def handle(self, events):
+        """Send a batch over the pipe"""
+        if events:
+            try:
+                self.conn.send(events)
+            except OSError:
+                pass  # Parent went away; the command loop will notice
+
+
+def _engine_main(conn, shm_name, backend_name):
+    """Entry point of the engine process: serve commands until told to quit"""
+    # Spawned children share the parent's resource tracker, so attaching
+    # here doesn't make this process responsible for unlinking the block
+    shm = shared_memory.SharedMemory(name=shm_name)
+    engine = AutoClicker(backend=create_backend(backend_name))
+    engine.timing = ClickTelemetry(shm.buf[TELEMETRY_SIZE:])
+    writer = engine.events.attach(TelemetryWriter(shm.buf, engine))
+    forwarder = EventForwarder(engine.events, conn).start()
+    writer.write()
+    try:
+        while True:
+            try:
+                command, arg = conn.recv()
+            except EOFError:
+                break
+            if command == 'start':
+                if arg['backend'] != engine.backend.name:
+                    try:
+                        engine.set_backend(create_backend(arg['backend']))
+                    except Exception as e:
+                        engine._status(f"Error: input backend '{arg['backend']}' unavailable: {str(e)}")
+                        continue
+                engine.apply_config(arg['config'])
+                engine.verify_position = arg['verify_position']
+                engine.debug_mode = arg['debug_mode']
+                engine.settle_time = arg['settle_time']
+                engine.wait_strategy = arg['wait_strategy']
+                engine.wait_margin_ms = arg['wait_margin_ms']
+                engine.performance = PerformanceProfile.from_dict(arg['performance'])
+                engine.trace_path = arg['trace_path']
+                engine.condition_poll_ms = arg['condition_poll_ms']
+                engine.sync_ticks(arg['tick_phase_ns'])
+                if not engine.start():
+                    # Forwarded, so the parent mirrors the stopped state
+                    engine._status("Nothing to run - no enabled click points")
+                writer.write()
+            elif command == 'stop':
+                engine.stop()
+            elif command == 'pause':
+                engine.pause()
+                writer.write()
+            elif command == 'resume':
+                engine.resume()
+                writer.write()
+            elif command == 'sync_ticks':
+                engine.sync_ticks(arg)
+            elif command == 'reload':
+                engine.apply_config(arg)
+                engine.request_reload()
+            elif command == 'quit':
+                break
+    finally:
+        engine.stop()
+        if engine.thread:
+            engine.thread.join()
+        forwarder.stop()
+        engine.events.unsubscribe(writer)
+        engine.backend.close()
+        engine.timing.release()
+        writer.buf = None
+        shm.close()
+
+
+class ProcessAutoClicker(AutoClicker):
+    """
+    AutoClicker that can run its click loop in a separate process.
+    
+    Points and settings are edited locally as usual; start() hands a copy
+    to the engine process. With use_process False it behaves exactly like
+    AutoClicker.
+    """
+    
+    def __init__(self, backend=None, use_process=True):
+        """
+        Initialize the autoclicker.
+        
+        Args:
+            backend: InputBackend used locally (e.g. for rapid add); the
+                engine process creates its own backend of the same name
+            use_process: Run the click loop in a separate process
+        """
+        super().__init__(backend)
+        self.use_process = use_process
+        self.process = None
+        self._remote = False  # The current (or last) run is in the engine process
+        self._conn = None
+        self._shm = None
+        self._telemetry = None
+        self._timing = None
+        self._receiver = None
+        
+    def _ensure_process(self):
+        """Spawn the engine process unless it is already running"""
+        if self.process is not None and self.process.is_alive():
+            return
+        self.close()
+        # spawn, not fork: this process has GUI and listener threads
+        context = multiprocessing.get_context('spawn')
+        self._shm = shared_memory.SharedMemory(create=True, size=SHARED_SIZE)
+        self._telemetry = TelemetryReader(self._shm.buf)
+        self._timing = ClickTelemetry(self._shm.buf[TELEMETRY_SIZE:])
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_engine_main, args=(child_conn, self._shm.name, self.backend.name),
+                                       name='autoclicker-engine', daemon=True)
+        self.process.start()
+        child_conn.close()
+        self._receiver = threading.Thread(target=self._receive, args=(self._conn,), daemon=True)
+        self._receiver.start()
+        
+    def _receive(self, conn):
+        """Republish forwarded events locally and mirror the engine state"""
+        while True:
+            try:
+                events = conn.recv()
+            except (EOFError, OSError):
+                break
+            if self._remote:
+                telemetry = self._telemetry.read()
+                self.running = bool(telemetry.running)
+                self.paused = bool(telemetry.paused)
+                self.current_loop = telemetry.current_loop
+                self.click_count = telemetry.click_count
+            for event in events:
+                self.events.publish(event)
+        if self._remote:
+            self.running = False
+            self.paused = False
+            
+    def _send(self, command, arg=None):
+        """Send a command to the engine process, if there is one"""
+        if self._conn is None:
+            return False
+        try:
+            self._conn.send((command, arg))
+            return True
+        except OSError:
+            return False
+            
+    def start(self):
+        """Start the autoclicker, in the engine process if use_process is set"""
+        self._remote = self.use_process
+        if not self._remote:
+            return super().start()
+        if self.running or not any(self.click_points.enabled):
+            return False
+        self._ensure_process()
+        self.running = True
+        self.paused = False
+        self.current_loop = 0
+        self.click_count = 0
+        self.search_timing.reset()  # Fed by the forwarded search events
+        return self._send('start', {
+            'config': self.get_config(),
+            'verify_position': self.verify_position,
+            'debug_mode': self.debug_mode,
+            'settle_time': self.settle_time,
+            'wait_strategy': self.wait_strategy,
+            'wait_margin_ms': self.wait_margin_ms,
+            'performance': self.performance.to_dict(),
+            'trace_path': self.trace_path,
+            'condition_poll_ms': self.condition_poll_ms,
+            'tick_phase_ns': self.tick_clock.phase_ns,
+            'backend': self.backend.name,
+        })
+        
+    def stop(self):
+        """Stop the autoclicker"""
+        super().stop()
+        self._send('stop')
+        
+    def pause(self):
+        """Pause the autoclicker, keeping its place in the sequence"""
+        if not self._remote:
+            return super().pause()
+        if self.running and not self.paused:
+            self.paused = True
+            self._send('pause')
+            
+    def resume(self):
+        """Resume a paused autoclicker"""
+        if not self._remote:
+            return super().resume()
+        self.paused = False
+        self._send('resume')
+        
+    def sync_ticks(self, timestamp_ns=None):
+        """Re-sync the tick phase here and in the engine process"""
+        # CLOCK_MONOTONIC is system-wide, so timestamps mean the same in both
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        super().sync_ticks(timestamp_ns)
+        self._send('sync_ticks', timestamp_ns)
+        
+    def request_reload(self):
+        """Hand the current points to the engine at its next loop boundary"""
+        if not self._remote:
+            return super().request_reload()
+        if self.running:
+            self._send('reload', self.get_config())
+            
+    def get_run_stats(self):
+        """Get statistics for the current (or last) run from shared memory"""
+        if not self._remote or self._telemetry is None:
+            return super().get_run_stats()
+        t = self._telemetry.read()
+        stats = {
+            'loops': t.current_loop,
+            'clicks': t.click_count,
+            'elapsed': (time.monotonic_ns() - t.origin_ns) / NS_PER_SECOND if t.origin_ns else 0.0,
+            'scheduled': t.scheduled_ns / NS_PER_SECOND,
+            'drift_ms': t.drift_ns / 1e6,
+            'max_drift_ms': t.max_drift_ns / 1e6,
+            'mean_drift_ms': t.total_drift_ns / t.waits / 1e6 if t.waits else 0.0,
+            'cursor_queries': t.cursor_queries,
+            'cursor_queries_skipped': t.cursor_queries_skipped,
+            'foreign_motion_events': t.foreign_motion_events,
+            'settle_ms': t.settle_ns / 1e6,
+            'paused': bool(t.paused),
+            'pause_latency_ms': t.pause_latency_ns / 1e6,
+            'stop_latency_ms': t.stop_latency_ns / 1e6,
+            'condition_hits': t.condition_hits,
+            'condition_misses': t.condition_misses,
+            'condition_saved_s': t.condition_saved_ns / 1e9,
+            'slots_skipped': t.slots_skipped,
+            'slots_saved_s': t.slots_saved_ns / 1e9,
+            'idle_hits': t.idle_hits,
+            'idle_misses': t.idle_misses,
+            'idle_saved_s': t.idle_saved_ns / 1e9,
+            'last_click_ns': t.last_click_ns,
+            'engine_pid': self.process.pid,
+        }
+        self.performance.load_counters(t[-len(COUNTER_FIELDS):])
+        stats.update(self.performance.get_stats())
+        if self.tick_mode:
+            stats['tick_syncs'] = self.tick_clock.syncs
+            stats['tick_phase_ms'] = self.tick_clock.phase_ms()
+        return stats
+        
+    def get_timing_stats(self):
+        """Get per-click latency percentiles, read in place from shared memory"""
+        if not self._remote or self._timing is None:
+            return super().get_timing_stats()
+        return self._timing.get_stats()
+        
+    def close(self):
+        """Shut down the engine process and release the shared memory"""
+        if self.process is not None:
+            self._send('quit')
+            self.process.join(2.0)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+            self.process = None
+        if self._receiver is not None:
+            # The engine process closing its end ends the receiver with EOF
+            self._receiver.join(1.0)
+            self._receiver = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._shm is not None:
+            self._telemetry = None
+            self._timing.release()
+            self._timing = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -0,0 +1,286 @@
+"""
+Input macro recorder module.
+
+Contains the MacroRecorder class, which captures mouse clicks and key
+presses with pynput listeners into preallocated ring buffers, the Macro
+class holding a finished recording, and replay() to play one back at
+any speed. Capturing an event is a handful of stores into fixed arrays,
+so the listeners keep up with the full input event rate; pointer motion
+is not captured at all. pynput (which needs a display) is only imported
+to record, replay key presses or decode saved keys, so macros can be
+loaded and converted anywhere.
+"""
+
+import threading
+import time
+from array import array
+from collections import namedtuple
+
+from .models import ClickPoint
+from .scheduler import DeadlineScheduler
+from .timing import NS_PER_SECOND
+
+DEFAULT_CAPACITY = 65536  # Events kept per ring before the oldest are overwritten
+
+BUTTON_NAMES = ('left', 'right', 'middle')
+
+MacroEvent = namedtuple('MacroEvent', 'time_ns kind x y button key')  # kind is 'click' or 'key'
+
+
+class EventRing:
+    """Preallocated single-writer ring of timestamped input events"""
+    
+    __slots__ = ('capacity', 'times', 'xs', 'ys', 'codes', 'refs', 'written')
+    
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.times = array('q', bytes(8 * capacity))
+        self.xs = array('i', bytes(4 * capacity))
+        self.ys = array('i', bytes(4 * capacity))
+        self.codes = array('i', bytes(4 * capacity))
+        self.refs = [None] * capacity  # Key objects (stored by reference)
+        self.written = 0
+        
+    def push(self, timestamp_ns, x=0, y=0, code=0, ref=None):
+        """Store one event, overwriting the oldest once full (listener thread)"""
+        i = self.written % self.capacity
+        self.times[i] = timestamp_ns
+        self.xs[i] = x
+        self.ys[i] = y
+        self.codes[i] = code
+        self.refs[i] = ref
+        self.written += 1
+        
+    @property
+    def dropped(self):
+        """Events overwritten because the ring was full"""
+        return max(0, self.written - self.capacity)
+        
+    def __iter__(self):
+        """(timestamp_ns, x, y, code, ref) tuples, oldest first"""
+        count = min(self.written, self.capacity)
+        start = self.written - count
+        for n in range(start, self.written):
+            i = n % self.capacity
+            yield (self.times[i], self.xs[i], self.ys[i], self.codes[i], self.refs[i])
+
+
+def _pynput():
+    """Import pynput's keyboard and mouse modules"""
+    from pynput import keyboard, mouse
+    return keyboard, mouse
+
+
+def encode_key(key):
+    """Key as a string: 'Key.enter' for special keys, the character, or '<vk>'"""
+    if not hasattr(key, 'vk'):
+        return str(key)  # A Key enum member (only key codes have a vk)
+    if key.char is not None:
+        return key.char
+    return f"<{key.vk}>"
+
+
+def decode_key(text):
+    """Inverse of encode_key"""
+    keyboard = _pynput()[0]
+    if text.startswith('Key.'):
+        return keyboard.Key[text[4:]]
+    if len(text) > 2 and text.startswith('<') and text.endswith('>'):
+        return keyboard.KeyCode.from_vk(int(text[1:-1]))
+    return keyboard.KeyCode.from_char(text)
+
+
+class Macro:
+    """A finished recording: clicks and key presses relative to its start"""
+    
+    def __init__(self, events, duration_ns, dropped=0):
+        """
+        Initialize the macro.
+        
+        Args:
+            events: MacroEvent list, oldest first, times relative to the
+                start of the recording
+            duration_ns: Length of the recording
+            dropped: Events lost because a ring was full
+        """
+        self.events = events
+        self.duration_ns = duration_ns
+        self.dropped = dropped
+        
+    @property
+    def clicks(self):
+        """Click events only"""
+        return [e for e in self.events if e.kind == 'click']
+        
+    @property
+    def duration(self):
+        """Length of the recording in seconds"""
+        return self.duration_ns / NS_PER_SECOND
+        
+    def to_points(self, speed=1.0):
+        """
+        Convert the left clicks to click points with their measured delays.
+        
+        Each point's delay is the time until the next click; the last
+        one's is the time until the recording was stopped, so a looped
+        sequence keeps the recorded rhythm. Click points only left-click,
+        so key presses and other buttons are skipped.
+        
+        Args:
+            speed: Playback speed multiplier (2.0 = delays halved)
+            
+        Returns:
+            List of ClickPoint
+        """
+        clicks = [c for c in self.clicks if c.button == 'left']
+        ends = [c.time_ns for c in clicks[1:]] + [max(self.duration_ns, clicks[-1].time_ns if clicks else 0)]
+        return [ClickPoint(x=c.x, y=c.y, delay=round((end - c.time_ns) / NS_PER_SECOND / speed, 3))
+                for c, end in zip(clicks, ends)]
+                
+    def to_dict(self):
+        """Macro as a JSON-compatible dict (times in milliseconds)"""
+        return {
+            'duration_ms': self.duration_ns / 1e6,
+            'events': [[round(e.time_ns / 1e6, 3), e.kind, e.x, e.y, e.button] if e.kind == 'click'
+                       else [round(e.time_ns / 1e6, 3), e.kind, encode_key(e.key)] for e in self.events],
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        """Create a macro from to_dict() output"""
+        events = []
+        for item in data.get('events', []):
+            time_ns = int(item[0] * 1e6)
+            if item[1] == 'click':
+                events.append(MacroEvent(time_ns, 'click', item[2], item[3], item[4], None))
+            else:
+                events.append(MacroEvent(time_ns, 'key', 0, 0, None, decode_key(item[2])))
+        return cls(events, int(data.get('duration_ms', 0) * 1e6))
+
+
+class MacroRecorder:
+    """Records clicks and key presses until the stop key is pressed"""
+    
+    def __init__(self, stop_key=None, capacity=DEFAULT_CAPACITY, clock=time.monotonic_ns):
+        """
+        Initialize the recorder.
+        
+        Args:
+            stop_key: pynput key that ends the recording (not recorded;
+                default: Esc)
+            capacity: Events kept per ring (clicks and keys separately)
+            clock: Function returning monotonic time in nanoseconds
+        """
+        keyboard, mouse = self._modules = _pynput()
+        self.stop_key = keyboard.Key.esc if stop_key is None else stop_key
+        self._button_codes = {mouse.Button.left: 0, mouse.Button.right: 1, mouse.Button.middle: 2}
+        self.capacity = capacity
+        self.clock = clock
+        self.stop_callback = None  # Called with the Macro when recording ends (listener thread)
+        self.recording = False
+        self.macro = None
+        self._clicks = None
+        self._keys = None
+        self._mouse_listener = None
+        self._keyboard_listener = None
+        self._started_ns = 0
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        
+    def start(self):
+        """Start recording"""
+        self._clicks = EventRing(self.capacity)
+        self._keys = EventRing(self.capacity)
+        self.macro = None
+        self._stopped.clear()
+        self._started_ns = self.clock()
+        self.recording = True
+        # Each listener has its own thread and writes only its own ring,
+        # so capture needs no lock
+        keyboard, mouse = self._modules
+        self._mouse_listener = mouse.Listener(on_click=self._on_click)
+        self._keyboard_listener = keyboard.Listener(on_press=self._on_press)
+        self._mouse_listener.start()
+        self._keyboard_listener.start()
+        
+    def stop(self):
+        """Stop recording and build the macro (safe to call more than once, from any thread)"""
+        with self._lock:
+            if not self.recording:
+                return self.macro
+            stopped_ns = self.clock()
+            self.recording = False
+            self._mouse_listener.stop()
+            self._keyboard_listener.stop()
+            self.macro = self._build(stopped_ns)
+            self._stopped.set()
+        if self.stop_callback:
+            self.stop_callback(self.macro)
+        return self.macro
+        
+    def wait(self, timeout=None):
+        """Block until the recording is stopped; returns the macro (or None on timeout)"""
+        self._stopped.wait(timeout)
+        return self.macro
+        
+    def _on_click(self, x, y, button, pressed):
+        """Mouse listener callback"""
+        if pressed and self.recording:
+            self._clicks.push(self.clock(), int(x), int(y), self._button_codes.get(button, 0))
+            
+    def _on_press(self, key):
+        """Keyboard listener callback"""
+        if not self.recording:
+            return False
+        if key == self.stop_key:
+            self.stop()
+            return False
+        self._keys.push(self.clock(), ref=key)
+        
+    def _build(self, stopped_ns):
+        """Merge both rings into a Macro"""
+        start = self._started_ns
+        events = [MacroEvent(t - start, 'click', x, y, BUTTON_NAMES[code], None)
+                  for t, x, y, code, _ in self._clicks]
+        events += [MacroEvent(t - start, 'key', 0, 0, None, key) for t, _, _, _, key in self._keys]
+        events.sort(key=lambda e: e.time_ns)
+        return Macro(events, stopped_ns - start, self._clicks.dropped + self._keys.dropped)
+
+
+def replay(macro, backend, speed=1.0, stop_event=None, controller=None):
+    """
+    Play a macro back with its recorded timing.
+    
+    Events are scheduled against absolute deadlines from the start, so
+    the time spent sending them doesn't accumulate.
+    
+    Args:
+        macro: Macro to play
+        backend: InputBackend used to move and click
+        speed: Speed multiplier (2.0 = twice as fast)
+        stop_event: threading.Event that aborts playback when set
+        controller: pynput keyboard Controller for key presses (default:
+            created if the macro has any)
+            
+    Returns:
+        Number of events played
+    """
+    if speed <= 0:
+        raise ValueError("Replay speed must be positive")
+    if controller is None and any(e.kind == 'key' for e in macro.events):
+        controller = _pynput()[0].Controller()
+    scheduler = DeadlineScheduler(sleep=stop_event.wait if stop_event is not None else time.sleep)
+    scheduler.start()
+    played = 0
+    for event in macro.events:
+        scheduler.advance_to(scheduler.origin_ns + int(event.time_ns / speed))
+        if scheduler.wait() is None:
+            break
+        if event.kind == 'click':
+            backend.move(event.x, event.y)
+            backend.click(event.button)
+        else:
+            controller.press(event.key)
+            controller.release(event.key)
+        played += 1
+    return played
@@ -0,0 +1,116 @@
+"""
+Click scheduling module.
+
+This module contains the DeadlineScheduler class which times clicks
+against absolute deadlines measured from the session start, so time
+spent moving the mouse or running callbacks never adds up over a run.
+"""
+
+import time
+
+from .timing import NS_PER_SECOND, SleepStrategy
+
+
+class DeadlineScheduler:
+    """Absolute-deadline scheduler for click timing"""
+    
+    def __init__(self, clock=time.monotonic_ns, sleep=time.sleep, strategy=None):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            clock: Function returning monotonic time in nanoseconds
+            sleep: Function sleeping for a number of seconds; it may return
+                early, and should return True when it was interrupted
+            strategy: Wait strategy used to reach deadlines (default: plain
+                sleep, see the timing module)
+        """
+        self.clock = clock
+        self.sleep = sleep
+        self.strategy = strategy if strategy is not None else SleepStrategy()
+        self.origin_ns = 0
+        self.deadline_ns = 0
+        self.scheduled_ns = 0  # Sum of all delays scheduled since start
+        self.waits = 0
+        self.drift_ns = 0  # Elapsed time minus scheduled time at the last deadline
+        self.max_drift_ns = 0
+        self.total_drift_ns = 0
+        
+    def start(self, delay=0.0):
+        """Begin a new session, with the first deadline delay seconds from now"""
+        self.origin_ns = self.clock()
+        self.deadline_ns = self.origin_ns
+        self.scheduled_ns = 0
+        self.waits = 0
+        self.drift_ns = 0
+        self.max_drift_ns = 0
+        self.total_drift_ns = 0
+        self.advance(delay)
+        
+    def advance(self, seconds):
+        """Move the next deadline seconds past the previous deadline"""
+        step = int(seconds * NS_PER_SECOND)
+        self.deadline_ns += step
+        self.scheduled_ns += step
+        
+    def advance_to(self, deadline_ns):
+        """Set the next deadline to an absolute monotonic time"""
+        self.scheduled_ns += deadline_ns - self.deadline_ns
+        self.deadline_ns = deadline_ns
+        
+    def shift(self, ns):
+        """Push the session (origin and deadline) ns later, e.g. after a pause"""
+        self.origin_ns += ns
+        self.deadline_ns += ns
+        
+    def remaining(self):
+        """Seconds left until the current deadline (never negative)"""
+        return max(0, self.deadline_ns - self.clock()) / NS_PER_SECOND
+        
+    def wait_ahead(self, seconds):
+        """
+        Sleep until seconds before the current deadline (no drift is recorded).
+        
+        Returns:
+            False if the sleep was interrupted, True otherwise
+        """
+        return self._sleep_until(self.deadline_ns - int(seconds * NS_PER_SECOND))
+        
+    def wait(self):
+        """
+        Sleep until the current deadline and record the drift.
+        
+        Returns:
+            How late the deadline was reached in nanoseconds, or None if
+            the sleep was interrupted
+        """
+        if not self._sleep_until(self.deadline_ns):
+            return None
+        return self._record(self.clock())
+        
+    def _sleep_until(self, target_ns):
+        """Sleep until target_ns, returning False if interrupted"""
+        return self.strategy.sleep_until(target_ns, self.clock, self.sleep)
+        
+    def _record(self, now):
+        """Record drift for a deadline reached at time now"""
+        # deadline_ns == origin_ns + scheduled_ns, so this is also the
+        # cumulative error of the whole session up to this point
+        drift = now - self.deadline_ns
+        self.drift_ns = drift
+        self.waits += 1
+        self.total_drift_ns += drift
+        if drift > self.max_drift_ns:
+            self.max_drift_ns = drift
+        return drift
+        
+    def get_stats(self):
+        """Get drift statistics in milliseconds"""
+        mean = self.total_drift_ns / self.waits if self.waits else 0
+        return {
+            'elapsed': (self.clock() - self.origin_ns) / NS_PER_SECOND if self.origin_ns else 0.0,
+            'scheduled': self.scheduled_ns / NS_PER_SECOND,
+            'drift_ms': self.drift_ns / 1e6,
+            'max_drift_ms': self.max_drift_ns / 1e6,
+            'mean_drift_ms': mean / 1e6,
+        }
@@ -0,0 +1,229 @@
+"""
+Virtual-time simulation module.
+
+Runs a configuration through the real click engine on a VirtualClock
+with a recording backend, so waits take no real time. The simulation
+stops as soon as the mean loop duration is known to within
+CONVERGENCE, typically after MIN_LOOPS loops (about 20 ms for 28
+points), and longer sessions are extrapolated from it. The result
+projects the session's timeline - cycle time and its jitter, clicks per
+hour and, with a loop count, when the run ends.
+"""
+
+import statistics
+import time
+from collections import namedtuple
+
+from .backends import RecordingBackend
+from .core import AutoClicker
+from .events import ClickEvent
+from .timing import NS_PER_SECOND, VirtualClock
+
+MAX_LOOPS = 10000  # Longer sessions are extrapolated from this many loops
+SAMPLE_LOOPS = 1000  # Loops simulated for an infinite loop count
+MIN_LOOPS = 100  # Loops simulated before the mean may count as converged
+CONVERGENCE = 0.001  # Standard error of the mean loop duration, relative to it, that ends a simulation
+
+Estimate = namedtuple('Estimate', 'loops simulated_loops clicks_per_loop first_click_s duration_s loop_mean_s '
+                                  'loop_stdev_s loop_min_s loop_p50_s loop_p90_s loop_max_s loops_per_hour '
+                                  'clicks_per_hour extrapolated loop_starts_s')
+
+
+class _LoopMarks:
+    """
+    Event bus sink noting when each loop's first click and the last click
+    happened, which stops the engine once the mean loop duration has
+    converged.
+    """
+    
+    name = 'simulator'
+    dropped = 0
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.starts = []
+        self.last_click_ns = 0
+        self.loop = 0
+        self.clicks = 0
+        self.converged = False
+        # Running mean and sum of squared deviations of the loop durations
+        self._mean = 0.0
+        self._m2 = 0.0
+        
+    def offer(self, event):
+        """Note click times (called on the engine thread)"""
+        if not isinstance(event, ClickEvent) or self.converged:
+            return
+        if event.loop != self.loop:
+            self.loop = event.loop
+            if self.starts and self._add(event.timestamp_ns - self.starts[-1]):
+                # The loop that just began is left out: its first click
+                # closes the last complete one
+                self.converged = True
+                self.starts.append(event.timestamp_ns)
+                self.engine.stop()
+                return
+            self.starts.append(event.timestamp_ns)
+        self.last_click_ns = event.timestamp_ns
+        self.clicks += 1
+        
+    def _add(self, duration_ns):
+        """Fold a complete loop's duration in; True once the mean has converged"""
+        n = len(self.starts)
+        delta = duration_ns - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (duration_ns - self._mean)
+        if n < MIN_LOOPS:
+            return False
+        return (self._m2 / n) ** 0.5 / n ** 0.5 <= CONVERGENCE * self._mean
+
+
+def simulate(config, loops=None, max_loops=MAX_LOOPS, settle_time=None):
+    """
+    Simulate a session of a configuration in virtual time.
+    
+    Args:
+        config: Config dict (as saved by save_config / get_config)
+        loops: Override the config's loop count (0 = infinite)
+        max_loops: Simulate at most this many loops; longer sessions
+            are extrapolated from the mean loop duration
+        settle_time: Pre-click settle in seconds (None = adaptive)
+        
+    Returns:
+        Estimate tuple; times are seconds from pressing start, and
+        duration_s is None for an infinite loop count
+    """
+    clock = VirtualClock(0)
+    engine = AutoClicker(backend=RecordingBackend(clock=clock, max_events=1), clock=clock)
+    engine.apply_config(config)
+    if loops is not None:
+        engine.loop_count = loops
+    loop_count = engine.loop_count
+    simulated = min(loop_count, max_loops) if loop_count > 0 else min(SAMPLE_LOOPS, max_loops)
+    engine.loop_count = simulated
+    engine.settle_time = settle_time
+    engine.verify_position = False  # Nothing else moves the simulated cursor
+    marks = engine.events.attach(_LoopMarks(engine))
+    if not engine.start():
+        raise ValueError("The config has no enabled click points")
+    engine.thread.join()
+    if not marks.starts:
+        raise ValueError("The config has no enabled click points")
+        
+    # Each loop lasts from its first click to the next loop's first click;
+    # the last one until the deadline the engine scheduled after it
+    if marks.converged:
+        bounds = marks.starts
+        end_ns = marks.starts[-1]
+        simulated = len(bounds) - 1
+    else:
+        end_ns = engine.scheduler.deadline_ns
+        bounds = marks.starts + [end_ns]
+    durations = sorted((b - a) / NS_PER_SECOND for a, b in zip(bounds, bounds[1:]))
+    mean = statistics.fmean(durations)
+    first_click = marks.starts[0] / NS_PER_SECOND
+    tail = (end_ns - marks.last_click_ns) / NS_PER_SECOND
+    extrapolated = loop_count > simulated
+    if loop_count <= 0:
+        duration = None
+    elif extrapolated:
+        duration = first_click + loop_count * mean - tail
+    else:
+        duration = marks.last_click_ns / NS_PER_SECOND
+    clicks_per_loop = marks.clicks / simulated
+    return Estimate(
+        loops=loop_count,
+        simulated_loops=simulated,
+        clicks_per_loop=clicks_per_loop,
+        first_click_s=first_click,
+        duration_s=duration,
+        loop_mean_s=mean,
+        loop_stdev_s=statistics.pstdev(durations),
+        loop_min_s=durations[0],
+        loop_p50_s=durations[len(durations) // 2],
+        loop_p90_s=durations[min(len(durations) - 1, int(len(durations) * 0.9))],
+        loop_max_s=durations[-1],
+        loops_per_hour=3600 / mean if mean else 0.0,
+        clicks_per_hour=3600 / mean * clicks_per_loop if mean else 0.0,
+        extrapolated=extrapolated,
+        loop_starts_s=[start / NS_PER_SECOND for start in marks.starts],
+    )
+
+
+def format_duration(seconds):
+    """Format seconds as e.g. '2h 05m 09s', '5m 09s' or '9.4s'"""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {secs:02d}s"
+    return f"{minutes}m {secs:02d}s"
+
+
+def _clock_time(timestamp, now, seconds=True):
+    """Format a wall-clock time, with the weekday when it isn't today"""
+    fmt = '%H:%M:%S' if seconds else '%H:%M'
+    if time.localtime(timestamp)[:3] != time.localtime(now)[:3]:
+        fmt = '%a ' + fmt
+    return time.strftime(fmt, time.localtime(timestamp))
+
+
+def format_summary(estimate, now=None):
+    """
+    Format an estimate as a single status line.
+    
+    Args:
+        estimate: Estimate from simulate()
+        now: Wall-clock time start is pressed (default: now)
+    """
+    line = (f"{estimate.loop_mean_s:.2f}s/loop (±{estimate.loop_stdev_s:.2f}s) | "
+            f"{estimate.clicks_per_hour:,.0f} clicks/h")
+    if estimate.duration_s is None:
+        return line + " | runs until stopped"
+    now = time.time() if now is None else now
+    end = _clock_time(now + estimate.duration_s, now, seconds=False)
+    return (line + f" | {estimate.loops} loops end in {'~' if estimate.extrapolated else ''}"
+                   f"{format_duration(estimate.duration_s)} (at {end})")
+
+
+def format_estimate(estimate, now=None):
+    """
+    Format an estimate as a multi-line report with a projected timeline.
+    
+    Args:
+        estimate: Estimate from simulate()
+        now: Wall-clock time start is pressed (default: now)
+    """
+    now = time.time() if now is None else now
+    
+    def at(offset):
+        return _clock_time(now + offset, now)
+        
+    lines = [
+        f"Loop duration: mean {estimate.loop_mean_s:.3f}s | stdev {estimate.loop_stdev_s:.3f}s | "
+        f"min {estimate.loop_min_s:.3f}s | p50 {estimate.loop_p50_s:.3f}s | p90 {estimate.loop_p90_s:.3f}s | "
+        f"max {estimate.loop_max_s:.3f}s ({estimate.simulated_loops} loops simulated)",
+        f"Rate: {estimate.loops_per_hour:,.1f} loops/h | {estimate.clicks_per_hour:,.0f} clicks/h "
+        f"({estimate.clicks_per_loop:g} clicks per loop)",
+        f"Timeline: start {at(0)} | first click {at(estimate.first_click_s)} (+{estimate.first_click_s:.1f}s)",
+    ]
+    if estimate.duration_s is None:
+        lines.append("Loop count 0: runs until stopped")
+        return '\n'.join(lines)
+    starts = estimate.loop_starts_s
+    shown = {1}  # The first click starts loop 1
+    for fraction in (0.25, 0.5, 0.75):
+        loop = max(1, int(estimate.loops * fraction))
+        if loop in shown:
+            continue
+        shown.add(loop)
+        if loop <= len(starts):
+            offset = starts[loop - 1]
+        else:
+            offset = estimate.first_click_s + (loop - 1) * estimate.loop_mean_s
+        lines.append(f"          loop {loop} starts {at(offset)} (+{format_duration(offset)})")
+    lines.append(f"          last click {at(estimate.duration_s)} - {estimate.loops} loops take "
+                 f"{format_duration(estimate.duration_s)}"
+                 + (f" (extrapolated from {estimate.simulated_loops} loops)" if estimate.extrapolated else ""))
+    return '\n'.join(lines)
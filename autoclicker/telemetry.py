@@ -0,0 +1,222 @@
+"""
+Click timing telemetry module.
+
+Contains the LogHistogram class, an HDR-style histogram with
+logarithmic buckets and linear sub-buckets, so it records nanosecond
+latencies from 1 ns to minutes in constant memory with about 3%
+precision, the ClickTelemetry class, which keeps one histogram per
+stage of a click, and the SearchTelemetry class, which keeps template
+search latency per click point. Histograms can live in any writable
+buffer, e.g. shared memory, so another process can read them in place.
+"""
+
+from .events import SearchEvent
+
+SUB_BUCKET_BITS = 6  # 32 linear sub-buckets per power of two
+MAX_VALUE_BITS = 40  # Values are clamped to 2**40 ns (about 18 minutes)
+
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+BUCKETS = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 2) * _HALF
+MAX_VALUE = (1 << MAX_VALUE_BITS) - 1
+
+# Header slots before the bucket counts
+_COUNT, _TOTAL, _MIN, _MAX = range(4)
+_HEADER = 4
+
+STAGES = ('lateness', 'backend', 'verify', 'callback')
+
+
+def bucket_index(value):
+    """Bucket holding a non-negative integer value"""
+    if value < (1 << SUB_BUCKET_BITS):
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF + (value >> shift)
+
+
+def bucket_value(index):
+    """Midpoint of the values a bucket holds"""
+    if index < (1 << SUB_BUCKET_BITS):
+        return index
+    shift = index // _HALF - 1
+    low = (index - shift * _HALF) << shift
+    return low + (1 << shift) // 2
+
+
+class LogHistogram:
+    """Constant-memory latency histogram"""
+    
+    SLOTS = _HEADER + BUCKETS
+    NBYTES = SLOTS * 8
+    
+    def __init__(self, buffer=None):
+        """
+        Initialize the histogram.
+        
+        Args:
+            buffer: Writable buffer of at least NBYTES bytes to keep the
+                counts in (default: a private one)
+        """
+        if buffer is None:
+            buffer = bytearray(self.NBYTES)
+        self.slots = memoryview(buffer)[:self.NBYTES].cast('Q')
+        if not self.slots[_COUNT]:
+            self.slots[_MIN] = MAX_VALUE
+            
+    def record(self, value):
+        """Record one value in nanoseconds (negative values count as 0)"""
+        if value < 0:
+            value = 0
+        elif value > MAX_VALUE:
+            value = MAX_VALUE
+        slots = self.slots
+        slots[_HEADER + bucket_index(value)] += 1
+        slots[_COUNT] += 1
+        slots[_TOTAL] += value
+        if value < slots[_MIN]:
+            slots[_MIN] = value
+        if value > slots[_MAX]:
+            slots[_MAX] = value
+            
+    def reset(self):
+        """Forget every recorded value"""
+        slots = self.slots
+        for i in range(self.SLOTS):
+            slots[i] = 0
+        slots[_MIN] = MAX_VALUE
+        
+    @property
+    def count(self):
+        return self.slots[_COUNT]
+        
+    def percentiles(self, *fractions):
+        """
+        Values at the given fractions (e.g. 0.5, 0.99) in one pass.
+        
+        Returns:
+            List of nanosecond values, one per fraction (0 when empty)
+        """
+        slots = self.slots
+        count = slots[_COUNT]
+        if not count:
+            return [0] * len(fractions)
+        targets = sorted((max(1, int(count * f + 0.5)), i) for i, f in enumerate(fractions))
+        results = [0] * len(fractions)
+        seen = 0
+        t = 0
+        for index in range(BUCKETS):
+            seen += slots[_HEADER + index]
+            while t < len(targets) and seen >= targets[t][0]:
+                # Never report beyond the exact extremes
+                results[targets[t][1]] = min(max(bucket_value(index), slots[_MIN]), slots[_MAX])
+                t += 1
+            if t == len(targets):
+                break
+        return results
+        
+    def get_stats(self):
+        """Summary in milliseconds"""
+        slots = self.slots
+        count = slots[_COUNT]
+        p50, p90, p99 = self.percentiles(0.5, 0.9, 0.99)
+        return {
+            'count': count,
+            'mean_ms': slots[_TOTAL] / count / 1e6 if count else 0.0,
+            'min_ms': slots[_MIN] / 1e6 if count else 0.0,
+            'p50_ms': p50 / 1e6,
+            'p90_ms': p90 / 1e6,
+            'p99_ms': p99 / 1e6,
+            'max_ms': slots[_MAX] / 1e6,
+        }
+        
+    def release(self):
+        """Release the buffer (required before closing shared memory)"""
+        self.slots.release()
+
+
+class ClickTelemetry:
+    """Per-stage click timing histograms"""
+    
+    NBYTES = len(STAGES) * LogHistogram.NBYTES
+    
+    def __init__(self, buffer=None):
+        """
+        Initialize the telemetry.
+        
+        Args:
+            buffer: Writable buffer of at least NBYTES bytes (default: a
+                private one)
+        """
+        if buffer is None:
+            buffer = bytearray(self.NBYTES)
+        view = memoryview(buffer)
+        size = LogHistogram.NBYTES
+        # Scheduled deadline vs. the moment the click was sent
+        self.lateness = LogHistogram(view[0:size])
+        # Duration of the backend's click call
+        self.backend = LogHistogram(view[size:2 * size])
+        # Position check (and correction) before the click
+        self.verify = LogHistogram(view[2 * size:3 * size])
+        # Publishing the click event to observers
+        self.callback = LogHistogram(view[3 * size:4 * size])
+        view.release()
+        
+    def reset(self):
+        """Clear all histograms (at the start of a run)"""
+        for stage in STAGES:
+            getattr(self, stage).reset()
+            
+    def get_stats(self):
+        """Summary per stage, keyed by stage name"""
+        return {stage: getattr(self, stage).get_stats() for stage in STAGES}
+        
+    def release(self):
+        """Release the buffers (required before closing shared memory)"""
+        for stage in STAGES:
+            getattr(self, stage).release()
+
+
+class SearchTelemetry:
+    """
+    Event bus sink keeping template search latency and outcomes per point.
+    
+    Fed by SearchEvents, so it works the same whether the engine runs in
+    this process or publishes from another one.
+    """
+    
+    name = 'search'
+    dropped = 0
+    
+    def __init__(self):
+        self.points = {}  # Point index -> [LogHistogram, local, global, missed, last score]
+        
+    def offer(self, event):
+        """Record a search (called on the publisher's thread)"""
+        if not isinstance(event, SearchEvent):
+            return
+        entry = self.points.get(event.point)
+        if entry is None:
+            entry = self.points[event.point] = [LogHistogram(), 0, 0, 0, 0.0]
+        entry[0].record(event.duration_ns)
+        entry[('local', 'global', 'missed').index(event.scope) + 1] += 1
+        entry[4] = event.score
+        
+    def reset(self):
+        """Forget every point (at the start of a run)"""
+        self.points = {}
+        
+    def get_stats(self):
+        """
+        Summary per point index, sorted by point.
+        
+        Returns:
+            Dict of point index -> dict with count, local, global, missed,
+            score (of the last search) and the latency summary in ms
+        """
+        stats = {}
+        for point in sorted(self.points):
+            histogram, local, found_global, missed, score = self.points[point]
+            summary = histogram.get_stats()
+            summary.update({'local': local, 'global': found_global, 'missed': missed, 'score': score})
+            stats[point] = summary
+        return stats
@@ -0,0 +1,81 @@
+"""
+Game tick clock module.
+
+This module contains the TickClock class which keeps an estimate of the
+server's 600 ms tick phase so clicks can be fired just before a tick
+boundary instead of somewhere inside a tick.
+"""
+
+import time
+
+TICK_SECONDS = 0.6
+
+
+class TickClock:
+    """Phase estimate of the game's tick boundaries"""
+    
+    def __init__(self, tick_length=TICK_SECONDS, lead_ms=50.0, clock=time.monotonic_ns):
+        """
+        Initialize the tick clock.
+        
+        Args:
+            tick_length: Length of one game tick in seconds
+            lead_ms: How long before a tick boundary clicks should fire
+            clock: Function returning monotonic time in nanoseconds
+        """
+        self.clock = clock
+        self.tick_ns = int(tick_length * 1_000_000_000)
+        self.lead_ns = int(lead_ms * 1_000_000)
+        self.phase_ns = clock()  # Any known tick boundary
+        self.boundary_ns = 0  # Boundary targeted by the last scheduled click
+        self.syncs = 0
+        
+    @property
+    def lead_ms(self):
+        """Lead time before each tick boundary, in milliseconds"""
+        return self.lead_ns / 1e6
+        
+    @lead_ms.setter
+    def lead_ms(self, value):
+        self.lead_ns = int(value * 1_000_000)
+        
+    def sync(self, timestamp_ns=None):
+        """Re-sync the phase: a tick boundary happened at timestamp_ns (default now)"""
+        self.phase_ns = self.clock() if timestamp_ns is None else timestamp_ns
+        self.syncs += 1
+        
+    def ticks_for(self, delay):
+        """Convert a delay in seconds to a whole number of ticks (at least one)"""
+        return max(1, round(delay * 1_000_000_000 / self.tick_ns))
+        
+    def nearest_boundary(self, t_ns):
+        """Tick boundary closest to t_ns under the current phase estimate"""
+        return self.phase_ns + round((t_ns - self.phase_ns) / self.tick_ns) * self.tick_ns
+        
+    def next_boundary(self, after_ns):
+        """First tick boundary at or after after_ns"""
+        ticks = -((self.phase_ns - after_ns) // self.tick_ns)
+        return self.phase_ns + ticks * self.tick_ns
+        
+    def phase_ms(self, t_ns=None):
+        """How far into the current tick t_ns (default now) is, in milliseconds"""
+        if t_ns is None:
+            t_ns = self.clock()
+        return ((t_ns - self.phase_ns) % self.tick_ns) / 1e6
+        
+    def align(self, scheduler):
+        """Move the scheduler's deadline to the lead point of the next reachable tick"""
+        earliest = max(scheduler.deadline_ns, self.clock()) + self.lead_ns
+        self.boundary_ns = self.next_boundary(earliest)
+        scheduler.advance_to(self.boundary_ns - self.lead_ns)
+        
+    def advance(self, scheduler, delay):
+        """Schedule the next click delay (rounded to ticks) after the last targeted boundary"""
+        # Snapping to the current phase estimate lets a re-sync take effect
+        # on the very next click
+        boundary = self.nearest_boundary(self.boundary_ns + self.ticks_for(delay) * self.tick_ns)
+        if boundary - self.lead_ns <= self.clock():
+            # Too late for that tick - take the next one we can still make
+            boundary = self.next_boundary(self.clock() + self.lead_ns)
+        self.boundary_ns = boundary
+        scheduler.advance_to(boundary - self.lead_ns)
@@ -0,0 +1,250 @@
+"""
+Wait strategy module.
+
+Contains the strategies the DeadlineScheduler uses to sleep until a
+deadline. time.sleep wakes up whenever the kernel scheduler gets round to
+it, typically 0.1-2 ms late; the precise strategies sleep interruptibly
+until a small margin before the deadline and finish the wait with a
+timerfd or a busy spin. calibrate() measures the host's wake-up error and
+suggests that margin.
+"""
+
+import os
+import sys
+import time
+from collections import namedtuple
+
+NS_PER_SECOND = 1_000_000_000
+
+STRATEGY_NAMES = ('sleep', 'timerfd', 'hybrid')
+
+CLOCK_MONOTONIC = 1
+TFD_CLOEXEC = 0o2000000
+TFD_TIMER_ABSTIME = 1
+
+Calibration = namedtuple('Calibration', 'p50_ms p90_ms p99_ms max_ms margin_ms')
+
+
+class VirtualClock:
+    """Simulated monotonic clock whose sleeps return at once, advancing time"""
+    
+    def __init__(self, start_ns=None):
+        """
+        Initialize the clock.
+        
+        Args:
+            start_ns: Initial time in nanoseconds (default: the real
+                monotonic time, so timestamps look like real ones)
+        """
+        self.now_ns = time.monotonic_ns() if start_ns is None else start_ns
+        
+    def __call__(self):
+        """Current virtual time in nanoseconds (usable as a clock function)"""
+        return self.now_ns
+        
+    def sleep(self, seconds):
+        """
+        Advance time by seconds instead of sleeping.
+        
+        Returns:
+            False (a virtual sleep is never interrupted)
+        """
+        if seconds > 0:
+            # At least 1 ns, so a wait loop always reaches its target
+            self.now_ns += max(1, round(seconds * NS_PER_SECOND))
+        return False
+
+
+class SleepStrategy:
+    """Plain interruptible sleep (the scheduler's sleep function)"""
+    
+    name = 'sleep'
+    
+    def __init__(self, margin=0.0):
+        """
+        Initialize the strategy.
+        
+        Args:
+            margin: Seconds before the deadline where the precise phase
+                takes over (unused by plain sleep)
+        """
+        self.margin = margin
+        
+    def sleep_until(self, target_ns, clock, sleep):
+        """
+        Sleep until clock() reaches target_ns.
+        
+        Args:
+            target_ns: Deadline in the clock's nanoseconds
+            clock: Function returning monotonic time in nanoseconds
+            sleep: Interruptible sleep returning True when interrupted
+            
+        Returns:
+            False if the sleep was interrupted, True otherwise
+        """
+        remaining = target_ns - clock()
+        while remaining > 0:
+            if sleep(remaining / NS_PER_SECOND):
+                return False
+            remaining = target_ns - clock()
+        return True
+        
+    def close(self):
+        """Release any resources held by the strategy"""
+        pass
+
+
+class PreciseStrategy(SleepStrategy):
+    """Base for strategies that sleep to within the margin and then wait precisely"""
+    
+    def __init__(self, margin=0.002):
+        super().__init__(margin)
+        
+    def sleep_until(self, target_ns, clock, sleep):
+        """Sleep until target_ns (see SleepStrategy.sleep_until)"""
+        # Stop and pause requests are honoured during the coarse phase; the
+        # precise phase is at most margin seconds long
+        if not super().sleep_until(target_ns - int(self.margin * NS_PER_SECOND), clock, sleep):
+            return False
+        remaining = target_ns - clock()
+        if remaining > 0:
+            self._precise(remaining)
+        return True
+        
+    def _precise(self, remaining_ns):
+        """Wait out the last remaining_ns without interruption"""
+        raise NotImplementedError
+
+
+class HybridStrategy(PreciseStrategy):
+    """Sleep to within the margin, then spin on perf_counter_ns"""
+    
+    name = 'hybrid'
+    
+    def _precise(self, remaining_ns):
+        """Busy-wait; costs CPU for at most margin seconds per wait"""
+        end = time.perf_counter_ns() + remaining_ns
+        while time.perf_counter_ns() < end:
+            pass
+
+
+class TimerfdStrategy(PreciseStrategy):
+    """Sleep to within the margin, then block on an absolute CLOCK_MONOTONIC timerfd"""
+    
+    name = 'timerfd'
+    
+    def __init__(self, margin=0.002):
+        super().__init__(margin)
+        if not sys.platform.startswith('linux'):
+            raise RuntimeError("timerfd is only available on Linux")
+        # Imported here so the plain-sleep path never pays for ctypes
+        import ctypes
+        import ctypes.util
+        
+        class Timespec(ctypes.Structure):
+            _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+            
+        class Itimerspec(ctypes.Structure):
+            _fields_ = [('it_interval', Timespec), ('it_value', Timespec)]
+            
+        path = ctypes.util.find_library('c')
+        if not path:
+            raise RuntimeError("libc not found")
+        self._ctypes = ctypes
+        self._libc = ctypes.CDLL(path, use_errno=True)
+        self._libc.timerfd_settime.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(Itimerspec),
+                                               ctypes.c_void_p]
+        self.fd = self._libc.timerfd_create(CLOCK_MONOTONIC, TFD_CLOEXEC)
+        if self.fd < 0:
+            raise RuntimeError(f"timerfd_create failed: {os.strerror(ctypes.get_errno())}")
+        self._spec = Itimerspec()
+        
+    def _precise(self, remaining_ns):
+        """Arm the timer for an absolute deadline and block until it expires"""
+        # time.monotonic_ns() reads CLOCK_MONOTONIC, so the deadline can be
+        # re-expressed on the kernel's clock without any offset
+        deadline = time.monotonic_ns() + remaining_ns
+        self._spec.it_value.tv_sec, self._spec.it_value.tv_nsec = divmod(deadline, NS_PER_SECOND)
+        if self._libc.timerfd_settime(self.fd, TFD_TIMER_ABSTIME, self._ctypes.byref(self._spec), None) < 0:
+            raise OSError(self._ctypes.get_errno(), "timerfd_settime failed")
+        os.read(self.fd, 8)  # Expiration count; blocks until the deadline
+        
+    def close(self):
+        """Close the timer"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_strategy(name='sleep', margin=0.002):
+    """
+    Create a wait strategy by name.
+    
+    Args:
+        name: 'sleep', 'timerfd' or 'hybrid'
+        margin: Seconds before each deadline where the precise phase starts
+        
+    Returns:
+        A wait strategy instance
+    """
+    if name == 'sleep':
+        return SleepStrategy(margin)
+    if name == 'timerfd':
+        return TimerfdStrategy(margin)
+    if name == 'hybrid':
+        return HybridStrategy(margin)
+    raise ValueError(f"Unknown wait strategy: {name}")
+
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def measure(strategy, samples=200, interval=0.01):
+    """
+    Measure how late a strategy wakes up.
+    
+    Args:
+        strategy: Wait strategy to measure
+        samples: Number of waits
+        interval: Length of each wait in seconds
+        
+    Returns:
+        Sorted list of wake-up errors in nanoseconds
+    """
+    clock = time.monotonic_ns
+    step = int(interval * NS_PER_SECOND)
+    errors = []
+    for _ in range(samples):
+        target = clock() + step
+        strategy.sleep_until(target, clock, time.sleep)
+        errors.append(clock() - target)
+    errors.sort()
+    return errors
+
+
+def calibrate(samples=200, interval=0.01, safety=1.5):
+    """
+    Measure this host's time.sleep wake-up error and pick a margin.
+    
+    The margin covers the 99th percentile oversleep (times safety), so a
+    precise strategy almost always takes over before the deadline.
+    
+    Args:
+        samples: Number of sleeps to measure
+        interval: Length of each sleep in seconds
+        safety: Multiplier applied to the p99 error
+        
+    Returns:
+        Calibration tuple (error percentiles and suggested margin in ms)
+    """
+    errors = measure(SleepStrategy(), samples, interval)
+    p99 = _percentile(errors, 0.99)
+    return Calibration(
+        p50_ms=_percentile(errors, 0.50) / 1e6,
+        p90_ms=_percentile(errors, 0.90) / 1e6,
+        p99_ms=p99 / 1e6,
+        max_ms=errors[-1] / 1e6,
+        margin_ms=round(max(0.5, min(20.0, p99 * safety / 1e6)), 1),
+    )
@@ -0,0 +1,227 @@
+"""
+Session trace module.
+
+Contains the TraceRecorder class, which records every click of a session
+as a fixed-size binary record in a memory-mapped ring file, and exporters
+that turn a trace into Chrome trace_event JSON (chrome://tracing,
+Perfetto) or CSV. Recording a click packs the record straight into the
+mapping - no formatting, no write call, no per-click objects - and since
+the mapping is shared with the page cache, the trace survives the
+process being killed.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+MAGIC = b'ACTRACE1'
+VERSION = 1
+DEFAULT_CAPACITY = 1 << 18  # Records kept before the oldest are overwritten (~14 MB)
+
+# magic, version, record size, capacity, records written, wall clock minus
+# monotonic clock at the start of the session
+_HEADER = struct.Struct('<8sIIQQq24x')
+_WRITTEN = struct.Struct('<Q')
+_WRITTEN_OFFSET = 24
+
+_RECORD = struct.Struct('<qqqIIiiiiB7x')
+
+TraceRecord = namedtuple('TraceRecord', 'timestamp_ns delay_ns late_ns index loop x y actual_x actual_y drifted')
+Trace = namedtuple('Trace', 'capacity written wall_offset_ns records')
+
+
+class TraceRecorder:
+    """Click recorder writing to a memory-mapped ring file"""
+    
+    def __init__(self, path, capacity=DEFAULT_CAPACITY):
+        """
+        Create (or truncate) a trace file.
+        
+        Args:
+            path: Trace file path
+            capacity: Number of records kept; once full, the oldest
+                records are overwritten
+        """
+        if capacity < 1:
+            raise ValueError("Trace capacity must be at least 1")
+        self.path = path
+        self.capacity = capacity
+        self.written = 0
+        size = _HEADER.size + capacity * _RECORD.size
+        with open(path, 'w+b') as f:
+            f.truncate(size)  # Sparse until records reach the pages
+            self.map = mmap.mmap(f.fileno(), size)
+        wall_offset = time.time_ns() - time.monotonic_ns()
+        _HEADER.pack_into(self.map, 0, MAGIC, VERSION, _RECORD.size, capacity, 0, wall_offset)
+        
+    def record(self, timestamp_ns, index, loop, x, y, actual_x, actual_y, drifted, delay_ns, late_ns):
+        """
+        Record one click (called on the click thread).
+        
+        Args:
+            timestamp_ns: Monotonic time the click was sent
+            index: Row of the clicked point in the PointTable (the
+                click plan may skip or repeat rows)
+            loop: Loop number
+            x, y: Intended coordinates
+            actual_x, actual_y: Cursor position found before the click
+                (the intended position when verification is off)
+            drifted: True if the position had to be corrected
+            delay_ns: Delay scheduled from this click to the next
+            late_ns: How late the click was sent relative to its deadline
+        """
+        written = self.written
+        _RECORD.pack_into(self.map, _HEADER.size + (written % self.capacity) * _RECORD.size,
+                          timestamp_ns, delay_ns, late_ns, index, loop, x, y, actual_x, actual_y, drifted)
+        # The count is updated after the record, so a reader never sees a
+        # half-written newest record
+        self.written = written + 1
+        _WRITTEN.pack_into(self.map, _WRITTEN_OFFSET, self.written)
+        
+    def close(self):
+        """Flush and unmap the trace file"""
+        if self.map is not None:
+            self.map.flush()
+            self.map.close()
+            self.map = None
+
+
+def load(path):
+    """
+    Read a trace file.
+    
+    Args:
+        path: Trace file written by a TraceRecorder
+        
+    Returns:
+        Trace tuple; records are TraceRecord tuples, oldest first
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a trace file")
+    magic, version, record_size, capacity, written, wall_offset = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a trace file")
+    if version != VERSION or record_size != _RECORD.size:
+        raise ValueError(f"Unsupported trace version {version} in {path}")
+    body = memoryview(data)[_HEADER.size:_HEADER.size + capacity * record_size]
+    count = min(written, capacity)
+    # Once the ring has wrapped, the oldest record is the next one to be overwritten
+    start = written % capacity if written > capacity else 0
+    ordered = bytes(body[start * record_size:count * record_size]) + bytes(body[:start * record_size])
+    records = [TraceRecord(*values) for values in _RECORD.iter_unpack(ordered)]
+    return Trace(capacity, written, wall_offset, records)
+
+
+def wall_time(trace, timestamp_ns):
+    """Convert a record's monotonic timestamp to seconds since the epoch"""
+    return (trace.wall_offset_ns + timestamp_ns) / 1e9
+
+
+def export_chrome(trace, out):
+    """
+    Write a trace as Chrome trace_event JSON.
+    
+    Clicks appear as spans lasting until the next click on a "clicks"
+    track, loops as spans on a "loops" track, position corrections as
+    instant events and click lateness as a counter.
+    
+    Args:
+        trace: Trace from load()
+        out: Text file object to write to
+    """
+    records = trace.records
+    origin = records[0].timestamp_ns if records else 0
+    
+    def us(ns):
+        return (ns - origin) / 1000
+        
+    def emit(event):
+        out.write(',\n' + json.dumps(event))
+        
+    def emit_loop(loop, start_ns, end_ns):
+        emit({'name': f"loop {loop}", 'cat': 'loop', 'ph': 'X', 'pid': 1, 'tid': 2, 'ts': us(start_ns),
+              'dur': (end_ns - start_ns) / 1000})
+              
+    out.write('{"traceEvents":[\n')
+    out.write(json.dumps({'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'autoclicker'}}))
+    for tid, name in ((1, 'clicks'), (2, 'loops')):
+        emit({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': name}})
+    loop = None
+    loop_start = loop_end = 0
+    for r in records:
+        if r.loop != loop:
+            if loop is not None:
+                emit_loop(loop, loop_start, loop_end)
+            loop = r.loop
+            loop_start = r.timestamp_ns
+        loop_end = r.timestamp_ns + r.delay_ns
+        emit({
+            'name': f"point {r.index + 1}", 'cat': 'click', 'ph': 'X', 'pid': 1, 'tid': 1,
+            'ts': us(r.timestamp_ns), 'dur': max(0, r.delay_ns) / 1000,
+            'args': {'x': r.x, 'y': r.y, 'actual_x': r.actual_x, 'actual_y': r.actual_y, 'loop': r.loop,
+                     'delay_ms': r.delay_ns / 1e6, 'late_ms': r.late_ns / 1e6},
+        })
+        emit({'name': 'lateness', 'ph': 'C', 'pid': 1, 'ts': us(r.timestamp_ns), 'args': {'ms': r.late_ns / 1e6}})
+        if r.drifted:
+            emit({'name': 'position drift', 'cat': 'click', 'ph': 'i', 's': 't', 'pid': 1, 'tid': 1,
+                  'ts': us(r.timestamp_ns), 'args': {'intended': [r.x, r.y], 'actual': [r.actual_x, r.actual_y]}})
+    if loop is not None:
+        emit_loop(loop, loop_start, loop_end)
+    start = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_time(trace, origin))) if records else None
+    out.write('\n],"displayTimeUnit":"ms","otherData":' + json.dumps({
+        'session_start': start,
+        'clicks_recorded': trace.written,
+        'clicks_overwritten': max(0, trace.written - trace.capacity),
+    }) + '}\n')
+
+
+CSV_FIELDS = ('wall_time', 'timestamp_ns', 'loop', 'point', 'x', 'y', 'actual_x', 'actual_y', 'drifted',
+              'delay_ms', 'late_ms')
+
+
+def export_csv(trace, out):
+    """
+    Write a trace as CSV, one click per row (see CSV_FIELDS).
+    
+    Args:
+        trace: Trace from load()
+        out: Text file object to write to (opened with newline='')
+    """
+    # Imported here so recording never pays for the csv module
+    import csv
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    for r in trace.records:
+        wall = wall_time(trace, r.timestamp_ns)
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall)) + f".{int(wall * 1000) % 1000:03d}"
+        writer.writerow((stamp, r.timestamp_ns, r.loop, r.index + 1, r.x, r.y, r.actual_x, r.actual_y,
+                         int(r.drifted), f"{r.delay_ns / 1e6:.3f}", f"{r.late_ns / 1e6:.3f}"))
+
+
+EXPORTERS = {'chrome': (export_chrome, '.json'), 'csv': (export_csv, '.csv')}
+
+
+def export(path, fmt='chrome', out_path=None):
+    """
+    Export a trace file.
+    
+    Args:
+        path: Trace file path
+        fmt: 'chrome' or 'csv'
+        out_path: Output path (default: the trace path with .json/.csv)
+        
+    Returns:
+        (output path, number of records written)
+    """
+    exporter, suffix = EXPORTERS[fmt]
+    if out_path is None:
+        out_path = os.path.splitext(path)[0] + suffix
+    trace = load(path)
+    with open(out_path, 'w', newline='') as out:
+        exporter(trace, out)
+    return out_path, len(trace.records)
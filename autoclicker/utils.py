@@ -7,9 +7,33 @@ import os
 # Default configs directory
 CONFIGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "configs")
 
+# Session traces recorded from the GUI
+TRACES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "traces")
+
+_numpy = False  # Not imported yet
+
+
+def optional_numpy():
+    """Import NumPy on first use; returns None if it is not installed"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
 
 def get_configs_dir():
     """Get or create the configs directory"""
     if not os.path.exists(CONFIGS_DIR):
         os.makedirs(CONFIGS_DIR)
     return CONFIGS_DIR
+
+
+def get_traces_dir():
+    """Get or create the session traces directory"""
+    if not os.path.exists(TRACES_DIR):
+        os.makedirs(TRACES_DIR)
+    return TRACES_DIR
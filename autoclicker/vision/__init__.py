@@ -0,0 +1,50 @@
+"""
+Screen capture package.
+
+Frame sources grab screen rectangles as NumPy arrays: XShmSource reads
+the X11 screen through shared memory, ReplaySource plays back recorded
+frames. CaptureThread keeps the latest frames of a set of regions
+available without blocking the click loop. NumPy is only needed once a
+source is created.
+"""
+
+import os
+import sys
+
+from .base import Frame, FrameSource, Region
+from .capture import CaptureThread
+from .replay import ReplaySource, save_recording
+
+SOURCE_NAMES = ('auto', 'xshm')
+
+
+def create_source(name='auto'):
+    """
+    Create a screen frame source by name.
+    
+    Args:
+        name: 'xshm' or 'auto' (the best source for this platform)
+        
+    Returns:
+        A FrameSource instance
+    """
+    if name == 'auto':
+        if not (sys.platform.startswith('linux') and os.environ.get('DISPLAY')):
+            raise RuntimeError("Screen capture needs an X11 display")
+        return create_source('xshm')
+    if name == 'xshm':
+        from .xshm import XShmSource
+        return XShmSource()
+    raise ValueError(f"Unknown frame source: {name}")
+
+
+__all__ = [
+    'Frame',
+    'FrameSource',
+    'Region',
+    'CaptureThread',
+    'ReplaySource',
+    'save_recording',
+    'SOURCE_NAMES',
+    'create_source',
+]
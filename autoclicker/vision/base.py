@@ -0,0 +1,60 @@
+"""
+Frame source interface module.
+
+This module contains the Region and Frame tuples and the FrameSource
+base class which every screen capture backend implements. Pixels are
+NumPy arrays of shape (height, width, 4) holding blue, green, red and an
+unused byte per pixel - the X server's own 32-bit layout, so a grab
+needs no conversion.
+"""
+
+from collections import namedtuple
+
+from ..utils import optional_numpy
+
+Region = namedtuple('Region', 'x y width height')  # Screen rectangle
+Frame = namedtuple('Frame', 'timestamp_ns region pixels')  # pixels: (height, width, 4) uint8, BGRX
+
+
+def require_numpy():
+    """Import NumPy, raising RuntimeError if it is not installed"""
+    np = optional_numpy()
+    if np is None:
+        raise RuntimeError("NumPy not found - install it (pip install numpy) to use screen capture")
+    return np
+
+
+class FrameSource:
+    """Base class for screen capture backends"""
+    
+    name = 'base'
+    
+    def screen_size(self):
+        """Get the capturable area as a (width, height) tuple"""
+        raise NotImplementedError
+        
+    def grab(self, region, slot=0):
+        """
+        Capture a screen rectangle.
+        
+        Args:
+            region: Region in screen coordinates
+            slot: Buffer to capture into. A frame's pixels may be reused,
+                and stay valid until the same region is grabbed into the
+                same slot again
+                
+        Returns:
+            Frame
+        """
+        raise NotImplementedError
+        
+    def check_region(self, region):
+        """Raise ValueError unless region lies inside the capturable area"""
+        width, height = self.screen_size()
+        x, y, w, h = region
+        if w <= 0 or h <= 0 or x < 0 or y < 0 or x + w > width or y + h > height:
+            raise ValueError(f"Region {tuple(region)} is outside the {width}x{height} capture area")
+            
+    def close(self):
+        """Release any resources held by the source"""
+        pass
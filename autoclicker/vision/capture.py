@@ -0,0 +1,136 @@
+"""
+Background capture module.
+
+Contains the CaptureThread class, which grabs a set of regions from a
+frame source at a fixed rate on its own thread. Grabs alternate between
+two buffer slots: while one set of frames is being captured, the
+previous complete set is published for readers, so a reader never waits
+for a capture and never sees a half-written frame.
+"""
+
+import threading
+import time
+
+from ..scheduler import DeadlineScheduler
+from .base import Region
+
+
+class CaptureThread:
+    """Captures regions from a FrameSource in the background"""
+    
+    def __init__(self, source, regions, interval=0.05, clock=time.monotonic_ns):
+        """
+        Initialize the capture thread.
+        
+        Args:
+            source: FrameSource to grab from
+            regions: Regions (or (x, y, width, height) tuples) to capture
+            interval: Seconds between captures
+            clock: Function returning monotonic time in nanoseconds
+        """
+        if interval <= 0:
+            raise ValueError("Capture interval must be positive")
+        self.source = source
+        self.regions = [Region(*region) for region in regions]
+        self.interval = interval
+        self.clock = clock
+        self.frames = None  # Latest complete set: region -> Frame (replaced, never modified)
+        self.frame_count = 0
+        self.skipped = 0  # Captures skipped because a grab overran the interval
+        self.grab_ns = 0  # Duration of the last capture
+        self.error = None  # Exception that stopped the thread
+        self.on_frames = None  # Called with each new set of frames (on the capture thread)
+        self.thread = None
+        self._stop_event = threading.Event()
+        self._published = threading.Condition()
+        
+    def start(self):
+        """Start capturing"""
+        if self.thread and self.thread.is_alive():
+            return
+        for region in self.regions:
+            self.source.check_region(region)
+        self._stop_event.clear()
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name='capture', daemon=True)
+        self.thread.start()
+        
+    def stop(self):
+        """Stop capturing and wait for the thread"""
+        self._stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+        
+    def latest(self, region=None):
+        """
+        Get the latest captured frames without blocking.
+        
+        A frame's pixels stay valid for one more capture interval; copy
+        them to keep them longer.
+        
+        Args:
+            region: Region to return the frame of (default: all of them)
+            
+        Returns:
+            Frame, dict of region -> Frame, or None before the first capture
+        """
+        frames = self.frames
+        if frames is None or region is None:
+            return frames
+        return frames.get(Region(*region))
+        
+    def wait(self, after=None, timeout=None):
+        """
+        Block until a set of frames newer than capture number after is published.
+        
+        Args:
+            after: frame_count seen by the caller (default: the current one)
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Dict of region -> Frame, or None on timeout or when stopped
+        """
+        with self._published:
+            if after is None:
+                after = self.frame_count
+            if not self._published.wait_for(lambda: self.frame_count > after or not self.running, timeout):
+                return None
+            return self.frames if self.frame_count > after else None
+            
+    def _run(self):
+        """Capture loop (runs on the capture thread)"""
+        scheduler = DeadlineScheduler(clock=self.clock, sleep=self._stop_event.wait)
+        scheduler.start()
+        step = int(self.interval * 1e9)
+        slot = 0
+        try:
+            while not self._stop_event.is_set():
+                started = self.clock()
+                frames = {region: self.source.grab(region, slot) for region in self.regions}
+                self.grab_ns = self.clock() - started
+                # One reference swap publishes the whole set
+                with self._published:
+                    self.frames = frames
+                    self.frame_count += 1
+                    self._published.notify_all()
+                if self.on_frames:
+                    self.on_frames(frames)
+                slot ^= 1
+                scheduler.advance(self.interval)
+                behind = self.clock() - scheduler.deadline_ns
+                if behind > 0:
+                    # Drop the captures we missed instead of bursting to catch up
+                    missed = behind // step + 1
+                    self.skipped += missed
+                    scheduler.advance_to(scheduler.deadline_ns + missed * step)
+                if scheduler.wait() is None:
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._published:
+                self._published.notify_all()
@@ -0,0 +1,103 @@
+"""
+Pixel probe module.
+
+Contains the PixelProbe class, which checks a PixelCondition against a
+captured frame by sampling only the condition's own pixels, and the
+ConditionMonitor class, which keeps the regions of a click plan's
+conditions captured so the engine can check them at any moment.
+"""
+
+from .base import Region, require_numpy
+from .capture import CaptureThread
+
+
+class PixelProbe:
+    """Compiled check of one PixelCondition"""
+    
+    def __init__(self, condition):
+        """
+        Initialize the probe.
+        
+        Args:
+            condition: PixelCondition to check
+        """
+        np = self._np = require_numpy()
+        self.condition = condition
+        self.region = Region(*condition.region())
+        self._xs = np.array([x - self.region.x for x, _, _ in condition.pixels], dtype=np.intp)
+        self._ys = np.array([y - self.region.y for _, y, _ in condition.pixels], dtype=np.intp)
+        # Frames are BGRX, so the expected colours are stored as BGR
+        self._colors = np.array([(b, g, r) for _, _, (r, g, b) in condition.pixels], dtype=np.int16)
+        self._all = condition.match == 'all'
+        
+    def matches(self, pixels):
+        """
+        Check the condition against a frame of this probe's region.
+        
+        Args:
+            pixels: The region's (height, width, 4) frame array
+            
+        Returns:
+            True if the condition holds
+        """
+        sampled = pixels[self._ys, self._xs, :3].astype(self._np.int16)
+        close = (abs(sampled - self._colors).max(axis=1) <= self.condition.tolerance)
+        return bool(close.all() if self._all else close.any())
+
+
+class ConditionMonitor:
+    """Captures and checks the pixel conditions of a click plan"""
+    
+    def __init__(self, conditions, source, interval=0.05, background=True):
+        """
+        Initialize the monitor.
+        
+        Args:
+            conditions: PixelCondition or None per plan entry
+            source: FrameSource to capture from
+            interval: Seconds between captures
+            background: Capture on a CaptureThread; otherwise each check
+                grabs synchronously (e.g. for replayed frames on a
+                virtual clock)
+        """
+        self.source = source
+        # One probe per distinct condition, shared by the entries that use it
+        probes = {}
+        for c in conditions:
+            if c is not None and c not in probes:
+                probes[c] = PixelProbe(c)
+        self.probes = [None if c is None else probes[c] for c in conditions]
+        regions = list(dict.fromkeys(probe.region for probe in probes.values()))
+        self.capture = CaptureThread(source, regions, interval) if background else None
+        
+    def start(self):
+        """Start capturing"""
+        if self.capture is not None:
+            self.capture.start()
+            
+    def stop(self):
+        """Stop capturing"""
+        if self.capture is not None:
+            self.capture.stop()
+            
+    def check(self, index, since_ns=0):
+        """
+        Check the condition of a plan entry.
+        
+        Args:
+            index: Plan entry
+            since_ns: Ignore frames captured before this monotonic time
+            
+        Returns:
+            True if the newest frame satisfies the condition
+        """
+        probe = self.probes[index]
+        if self.capture is None:
+            frame = self.source.grab(probe.region)
+        else:
+            if self.capture.error is not None:
+                raise self.capture.error
+            frame = self.capture.latest(probe.region)
+        if frame is None or frame.timestamp_ns < since_ns:
+            return False
+        return probe.matches(frame.pixels)
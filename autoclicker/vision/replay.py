@@ -0,0 +1,110 @@
+"""
+Replay frame source module.
+
+Contains the ReplaySource class, which serves recorded frames instead of
+the screen, for offline testing and benchmarks of anything that looks at
+the game, and save_recording() to write a recording. A recording is an
+.npz file of full frames, their timestamps and the screen position of
+their top-left corner.
+"""
+
+import time
+
+from .base import Frame, FrameSource, require_numpy
+
+
+def save_recording(path, frames, timestamps_ns=None, origin=(0, 0)):
+    """
+    Write frames to a recording file.
+    
+    Args:
+        path: Output .npz path
+        frames: Sequence of (height, width, 4) BGRX arrays of one size
+        timestamps_ns: Capture time of each frame (any origin)
+        origin: Screen position of the frames' top-left corner
+    """
+    np = require_numpy()
+    frames = np.asarray(frames, dtype=np.uint8)
+    if timestamps_ns is None:
+        timestamps_ns = np.zeros(len(frames), dtype=np.int64)
+    np.savez_compressed(path, frames=frames, timestamps_ns=np.asarray(timestamps_ns, dtype=np.int64),
+                        origin=np.asarray(origin, dtype=np.int64))
+
+
+class ReplaySource(FrameSource):
+    """Frame source playing back recorded frames"""
+    
+    name = 'replay'
+    
+    def __init__(self, frames, timestamps_ns=None, origin=(0, 0), interval=0.1, loop=True,
+                 clock=time.monotonic_ns):
+        """
+        Initialize the source.
+        
+        Args:
+            frames: Sequence of (height, width, 4) BGRX or (height, width, 3)
+                BGR arrays of one size
+            timestamps_ns: Capture time of each frame (default: interval apart)
+            origin: Screen position of the frames' top-left corner
+            interval: Seconds between frames without timestamps, and the
+                time the last frame is shown
+            loop: Start over after the last frame (otherwise it stays)
+            clock: Function returning monotonic time in nanoseconds; frames
+                are shown at their recorded times from the first grab
+        """
+        np = require_numpy()
+        frames = np.asarray(frames, dtype=np.uint8)
+        if frames.ndim != 4 or not len(frames) or frames.shape[3] not in (3, 4):
+            raise ValueError("Frames must be a non-empty sequence of (height, width, 4) arrays")
+        if frames.shape[3] == 3:
+            frames = np.concatenate([frames, np.zeros(frames.shape[:3] + (1,), dtype=np.uint8)], axis=3)
+        self.frames = frames
+        step = int(interval * 1e9)
+        if timestamps_ns is None:
+            times = np.arange(len(frames), dtype=np.int64) * step
+        else:
+            times = np.asarray(timestamps_ns, dtype=np.int64)
+            if len(times) != len(frames):
+                raise ValueError("Need one timestamp per frame")
+            times = times - times[0]
+        self.timestamps_ns = times
+        last = int(times[-1] - times[-2]) if len(times) > 1 else step
+        self.duration_ns = int(times[-1]) + max(1, last)
+        self.origin = tuple(int(v) for v in origin)
+        self.loop = loop
+        self.clock = clock
+        self._start_ns = None
+        
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Create a source from a file written by save_recording"""
+        np = require_numpy()
+        with np.load(path) as data:
+            return cls(data['frames'], data['timestamps_ns'], tuple(data['origin']), **kwargs)
+            
+    def screen_size(self):
+        """The recorded area, extended to the screen origin"""
+        return (self.origin[0] + self.frames.shape[2], self.origin[1] + self.frames.shape[1])
+        
+    def rewind(self):
+        """Restart playback at the first frame on the next grab"""
+        self._start_ns = None
+        
+    def index_at(self, elapsed_ns):
+        """Index of the frame shown elapsed_ns after playback started"""
+        if self.loop:
+            elapsed_ns %= self.duration_ns
+        return max(0, int(self.timestamps_ns.searchsorted(elapsed_ns, 'right')) - 1)
+        
+    def grab(self, region, slot=0):
+        """Return the current frame's pixels in region (a view, never a copy)"""
+        now = self.clock()
+        if self._start_ns is None:
+            self._start_ns = now
+        self.check_region(region)
+        x = region[0] - self.origin[0]
+        y = region[1] - self.origin[1]
+        if x < 0 or y < 0:
+            raise ValueError(f"Region {tuple(region)} starts before the recording's origin {self.origin}")
+        frame = self.frames[self.index_at(now - self._start_ns)]
+        return Frame(now, region, frame[y:y + region[3], x:x + region[2]])
@@ -0,0 +1,229 @@
+"""
+Template matching module.
+
+Contains capture_template(), which cuts a grayscale patch around a
+screen position into a TemplateTarget, the TemplateMatcher class, which
+finds a template in an image by normalized cross-correlation computed
+with FFTs, and the TemplateLocator class, which finds a click plan's
+targets on screen - first near where each was last seen, then on the
+whole screen.
+
+The correlation of every placement at once is one FFT product. The
+template's spectrum depends only on the size of the searched image, so
+it is computed once per size and cached; the per-placement image
+statistics the normalization needs come from summed-area tables. Whole
+screen searches run at half resolution and are refined at full
+resolution around the best coarse placement.
+"""
+
+from ..models import TemplateTarget
+from .base import Region, require_numpy
+
+TEMPLATE_SIZE = 32  # Side of the patch captured around the cursor
+MIN_CONTRAST = 4.0  # Standard deviation below which a patch can't be matched
+MAX_BUDGET = 0.1  # Upper limit of the time reserved for a search before a click, in seconds
+COARSE_SCALE = 2  # Downscale factor of whole-screen searches
+
+
+def to_gray(pixels):
+    """Convert a BGRX frame to a float grayscale image"""
+    np = require_numpy()
+    bgr = pixels[..., :3].astype(np.float32)
+    return bgr[..., 0] * 0.114 + bgr[..., 1] * 0.587 + bgr[..., 2] * 0.299
+
+
+def downscale(gray, factor):
+    """Shrink a grayscale image by an integer factor, averaging blocks"""
+    rows, cols = gray.shape[0] // factor, gray.shape[1] // factor
+    return gray[:rows * factor, :cols * factor].reshape(rows, factor, cols, factor).mean(axis=(1, 3))
+
+
+def capture_template(source, x, y, size=TEMPLATE_SIZE, threshold=0.8, search_radius=64):
+    """
+    Capture the patch around a screen position as a template target.
+    
+    Near the screen edge the patch is shifted inwards and the anchor
+    moved with it, so it still points at (x, y).
+    
+    Args:
+        source: FrameSource to grab from
+        x, y: Screen position the click should land on
+        size: Patch width and height
+        threshold, search_radius: See TemplateTarget
+        
+    Returns:
+        TemplateTarget
+    """
+    np = require_numpy()
+    width, height = source.screen_size()
+    size = min(size, width, height)
+    left = min(max(0, x - size // 2), width - size)
+    top = min(max(0, y - size // 2), height - size)
+    frame = source.grab(Region(left, top, size, size))
+    gray = to_gray(frame.pixels)
+    if gray.std() < MIN_CONTRAST:
+        raise ValueError("The area around the cursor is a flat colour - pick a spot with more detail")
+    pixels = np.clip(np.rint(gray), 0, 255).astype(np.uint8)
+    return TemplateTarget(size, size, pixels.tobytes(), x - left, y - top, threshold, search_radius)
+
+
+class TemplateMatcher:
+    """Normalized cross-correlation search for one template"""
+    
+    def __init__(self, template, scale=1):
+        """
+        Initialize the matcher.
+        
+        Args:
+            template: TemplateTarget to look for
+            scale: Match in images downscaled by this factor
+        """
+        np = self._np = require_numpy()
+        self.template = template
+        self.scale = scale
+        patch = np.frombuffer(template.pixels, dtype=np.uint8).reshape(template.height, template.width)
+        patch = downscale(patch.astype(np.float64), scale) if scale > 1 else patch.astype(np.float64)
+        zero_mean = patch - patch.mean()
+        self._zero_mean = zero_mean
+        self._norm = float(np.sqrt((zero_mean * zero_mean).sum()))
+        self._spectra = {}  # Searched image shape -> conjugate spectrum of the padded template
+        self._coarse = None
+        
+    def coarse(self):
+        """Matcher for images downscaled by COARSE_SCALE (created on first use)"""
+        if self._coarse is None:
+            self._coarse = TemplateMatcher(self.template, COARSE_SCALE)
+        return self._coarse
+        
+    def spectrum(self, shape):
+        """The template's conjugate spectrum for images of a given shape (cached)"""
+        spectrum = self._spectra.get(shape)
+        if spectrum is None:
+            spectrum = self._spectra[shape] = self._np.conj(self._np.fft.rfft2(self._zero_mean, s=shape))
+        return spectrum
+        
+    def match(self, gray):
+        """
+        Find the best placement of the template in an image.
+        
+        Args:
+            gray: 2-D grayscale image at least as large as the template
+            
+        Returns:
+            (x, y, score): top-left of the best placement and its score
+            (-1 to 1), or None if the image is too small
+        """
+        np = self._np
+        h, w = self._zero_mean.shape
+        rows, cols = gray.shape
+        if rows < h or cols < w or not self._norm:
+            return None
+        image = gray.astype(np.float64)
+        # The template has zero mean, so the image's local mean drops out
+        # of the numerator and a plain correlation is enough
+        correlation = np.fft.irfft2(np.fft.rfft2(image) * self.spectrum(gray.shape), s=gray.shape)
+        correlation = correlation[:rows - h + 1, :cols - w + 1]
+        sums = np.zeros((rows + 1, cols + 1))
+        squares = np.zeros((rows + 1, cols + 1))
+        np.cumsum(np.cumsum(image, axis=0), axis=1, out=sums[1:, 1:])
+        np.cumsum(np.cumsum(image * image, axis=0), axis=1, out=squares[1:, 1:])
+        
+        def window(table):
+            return table[h:, w:] - table[:-h, w:] - table[h:, :-w] + table[:-h, :-w]
+            
+        local = window(sums)
+        variance = np.maximum(window(squares) - local * local / (h * w), 0.0)
+        denominator = np.sqrt(variance) * self._norm
+        # Flat areas can't be told apart from anything; score them 0
+        scores = np.divide(correlation, denominator, out=np.zeros_like(correlation),
+                           where=denominator > 1e-6 * self._norm)
+        best = int(scores.argmax())
+        y, x = divmod(best, scores.shape[1])
+        return (x, y, float(scores[y, x]))
+
+
+class TemplateLocator:
+    """Finds the template targets of a click plan on screen"""
+    
+    def __init__(self, templates, positions, source):
+        """
+        Initialize the locator.
+        
+        Args:
+            templates: TemplateTarget or None per plan entry
+            positions: (x, y) per plan entry where the target was last seen
+            source: FrameSource to grab from
+        """
+        self.source = source
+        # One matcher per distinct target, shared by the entries that use it
+        matchers = {}
+        for t in templates:
+            if t is not None and t not in matchers:
+                matchers[t] = TemplateMatcher(t)
+        self.matchers = [None if t is None else matchers[t] for t in templates]
+        self.positions = list(positions)
+        self.durations = [0.02] * len(self.matchers)  # Seconds the last search of each entry took
+        
+    def budget(self, index):
+        """Seconds to reserve for searching a plan entry's target before its click"""
+        return min(MAX_BUDGET, self.durations[index])
+        
+    def _search(self, matcher, gray, left, top):
+        """Match in a grayscale image whose top-left is at (left, top) on screen"""
+        found = matcher.match(gray)
+        if found is None:
+            return None
+        x, y, score = found
+        template = matcher.template
+        return (left + x + template.anchor_x, top + y + template.anchor_y, score)
+        
+    def _search_screen(self, matcher):
+        """Coarse whole-screen match, refined at full resolution around the best placement"""
+        width, height = self.source.screen_size()
+        gray = to_gray(self.source.grab(Region(0, 0, width, height)).pixels)
+        coarse = matcher.coarse().match(downscale(gray, COARSE_SCALE))
+        if coarse is None:
+            return None
+        template = matcher.template
+        margin = 2 * COARSE_SCALE
+        left = max(0, coarse[0] * COARSE_SCALE - margin)
+        top = max(0, coarse[1] * COARSE_SCALE - margin)
+        right = min(width, left + template.width + 2 * margin)
+        bottom = min(height, top + template.height + 2 * margin)
+        return self._search(matcher, gray[top:bottom, left:right], left, top)
+        
+    def locate(self, index):
+        """
+        Find a plan entry's target: first within its search radius of
+        where it was last seen, then anywhere on the screen.
+        
+        Args:
+            index: Plan entry
+            
+        Returns:
+            (x, y, score, scope): click position, match score and where it
+            was found - 'local', 'global' or 'missed' (x, y then keep the
+            last known position)
+        """
+        matcher = self.matchers[index]
+        template = matcher.template
+        width, height = self.source.screen_size()
+        last_x, last_y = self.positions[index]
+        radius = template.search_radius
+        left = max(0, last_x - template.anchor_x - radius)
+        top = max(0, last_y - template.anchor_y - radius)
+        right = min(width, last_x - template.anchor_x + template.width + radius)
+        bottom = min(height, last_y - template.anchor_y + template.height + radius)
+        best = None
+        if right - left >= template.width and bottom - top >= template.height:
+            frame = self.source.grab(Region(left, top, right - left, bottom - top))
+            best = self._search(matcher, to_gray(frame.pixels), left, top)
+            if best is not None and best[2] >= template.threshold:
+                self.positions[index] = best[:2]
+                return best + ('local',)
+        found = self._search_screen(matcher)
+        if found is not None and found[2] >= template.threshold:
+            self.positions[index] = found[:2]
+            return found + ('global',)
+        score = max(r[2] for r in (best, found) if r is not None) if (best or found) else -1.0
+        return (last_x, last_y, score, 'missed')
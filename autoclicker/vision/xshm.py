@@ -0,0 +1,199 @@
+"""
+X11 MIT-SHM frame source module.
+
+Grabs screen rectangles with the MIT-SHM extension through ctypes. The X
+server copies the pixels straight into a shared memory segment that a
+NumPy array views, so a grab is one request/reply with no copy on the
+client side. Each region (and buffer slot) gets its own segment, created
+on first use and reused for every later grab.
+"""
+
+import ctypes
+import threading
+import time
+from collections import namedtuple
+
+from ..backends.xtest import _load_library
+from .base import Frame, FrameSource, require_numpy
+
+ZPIXMAP = 2
+ALL_PLANES = ctypes.c_ulong(-1).value
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+_SHMAT_FAILED = ctypes.c_void_p(-1).value
+
+
+class XImage(ctypes.Structure):
+    """Leading fields of Xlib's XImage (only read through a pointer)"""
+    
+    _fields_ = [
+        ('width', ctypes.c_int),
+        ('height', ctypes.c_int),
+        ('xoffset', ctypes.c_int),
+        ('format', ctypes.c_int),
+        ('data', ctypes.c_void_p),
+        ('byte_order', ctypes.c_int),
+        ('bitmap_unit', ctypes.c_int),
+        ('bitmap_bit_order', ctypes.c_int),
+        ('bitmap_pad', ctypes.c_int),
+        ('depth', ctypes.c_int),
+        ('bytes_per_line', ctypes.c_int),
+        ('bits_per_pixel', ctypes.c_int),
+    ]
+
+
+class XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ('shmseg', ctypes.c_ulong),
+        ('shmid', ctypes.c_int),
+        ('shmaddr', ctypes.c_void_p),
+        ('readOnly', ctypes.c_int),
+    ]
+
+
+_ShmImage = namedtuple('_ShmImage', 'ximage info pixels')
+
+
+class XShmSource(FrameSource):
+    """Frame source reading the X11 root window through shared memory"""
+    
+    name = 'xshm'
+    
+    def __init__(self, display=None):
+        """
+        Initialize the source.
+        
+        Args:
+            display: X display name (default: the DISPLAY environment variable)
+        """
+        self._np = require_numpy()
+        self._x11 = _load_library('X11')
+        self._xext = _load_library('Xext')
+        self._libc = _load_library('c')
+        self._declare()
+        
+        self._display = self._x11.XOpenDisplay(display.encode() if display else None)
+        if not self._display:
+            raise RuntimeError("Cannot open X display - is DISPLAY set?")
+        if not self._xext.XShmQueryExtension(self._display):
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+            raise RuntimeError("The X server has no MIT-SHM extension (remote display?)")
+        screen = self._x11.XDefaultScreen(self._display)
+        self._root = self._x11.XRootWindow(self._display, screen)
+        self._visual = self._x11.XDefaultVisual(self._display, screen)
+        self._depth = self._x11.XDefaultDepth(self._display, screen)
+        self._size = (self._x11.XDisplayWidth(self._display, screen),
+                      self._x11.XDisplayHeight(self._display, screen))
+        self._images = {}  # (region, slot) -> _ShmImage
+        # Xlib connections are not thread-safe
+        self._lock = threading.Lock()
+        
+    def _declare(self):
+        """Declare the ctypes signatures of the functions we call"""
+        x11, xext, libc = self._x11, self._xext, self._libc
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDefaultVisual.restype = ctypes.c_void_p
+        x11.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XFree.argtypes = [ctypes.c_void_p]
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmCreateImage.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+                                         ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo),
+                                         ctypes.c_uint, ctypes.c_uint]
+        xext.XShmCreateImage.restype = ctypes.POINTER(XImage)
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+        xext.XShmGetImage.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XImage),
+                                      ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+        
+    def screen_size(self):
+        """Get the root window size"""
+        return self._size
+        
+    def _create_image(self, width, height):
+        """Create a shared memory XImage and the NumPy view of its pixels"""
+        info = XShmSegmentInfo()
+        ximage = self._xext.XShmCreateImage(self._display, self._visual, self._depth, ZPIXMAP, None,
+                                            ctypes.byref(info), width, height)
+        if not ximage:
+            raise RuntimeError("XShmCreateImage failed")
+        image = ximage.contents
+        if image.bits_per_pixel != 32:
+            self._x11.XFree(ximage)
+            raise RuntimeError(f"Unsupported {image.bits_per_pixel}-bit display - capture needs 24/32-bit colour")
+        size = image.bytes_per_line * height
+        info.shmid = self._libc.shmget(IPC_PRIVATE, size, IPC_CREAT | 0o600)
+        if info.shmid < 0:
+            self._x11.XFree(ximage)
+            raise RuntimeError("Cannot allocate shared memory for screen capture")
+        address = self._libc.shmat(info.shmid, None, 0)
+        if address in (None, _SHMAT_FAILED):
+            self._libc.shmctl(info.shmid, IPC_RMID, None)
+            self._x11.XFree(ximage)
+            raise RuntimeError("Cannot attach shared memory for screen capture")
+        info.shmaddr = image.data = address
+        info.readOnly = False
+        attached = self._xext.XShmAttach(self._display, ctypes.byref(info))
+        self._x11.XSync(self._display, False)
+        # The segment is freed once both sides detach, even if we crash
+        self._libc.shmctl(info.shmid, IPC_RMID, None)
+        if not attached:
+            self._libc.shmdt(address)
+            self._x11.XFree(ximage)
+            raise RuntimeError("XShmAttach failed")
+        np = self._np
+        buffer = (ctypes.c_ubyte * size).from_address(address)
+        pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(height, image.bytes_per_line // 4, 4)[:, :width]
+        return _ShmImage(ximage, info, pixels)
+        
+    def grab(self, region, slot=0):
+        """Capture a rectangle into its shared memory buffer"""
+        key = (tuple(region), slot)
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.check_region(region)
+                image = self._images[key] = self._create_image(region[2], region[3])
+            if not self._xext.XShmGetImage(self._display, self._root, image.ximage, region[0], region[1],
+                                           ALL_PLANES):
+                raise RuntimeError("XShmGetImage failed")
+            timestamp = time.monotonic_ns()
+        return Frame(timestamp, region, image.pixels)
+        
+    def release(self, region):
+        """Free the buffers of a region that is no longer captured"""
+        with self._lock:
+            for key in [key for key in self._images if key[0] == tuple(region)]:
+                self._free(self._images.pop(key))
+                
+    def _free(self, image):
+        """Detach and free one shared memory image"""
+        self._xext.XShmDetach(self._display, ctypes.byref(image.info))
+        self._x11.XSync(self._display, False)
+        self._x11.XFree(image.ximage)
+        self._libc.shmdt(image.info.shmaddr)
+        
+    def close(self):
+        """Free every buffer and close the X display connection"""
+        with self._lock:
+            if self._display:
+                for image in self._images.values():
+                    self._free(image)
+                self._images.clear()
+                self._x11.XCloseDisplay(self._display)
+                self._display = None
@@ -0,0 +1,159 @@
+"""
+Config directory watcher module.
+
+This module contains the ConfigWatcher class which watches the configs
+directory in the background (inotify on Linux, polling elsewhere) and
+reports batches of changed config filenames.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from .catalog import is_config_filename
+
+# inotify constants from <sys/inotify.h>. IN_MODIFY is not watched: it
+# fires for every write() of a save, while the file is still incomplete;
+# IN_CLOSE_WRITE reports each save once, after its last write
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def _open_inotify(directory):
+    """Create an inotify fd watching directory, or return None if unavailable"""
+    if not sys.platform.startswith('linux'):
+        return None
+    path = ctypes.util.find_library('c')
+    if not path:
+        return None
+    libc = ctypes.CDLL(path, use_errno=True)
+    fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class ConfigWatcher:
+    """Background watcher that batches config directory changes"""
+    
+    def __init__(self, directory, callback, debounce=0.2, poll_interval=1.0):
+        """
+        Initialize the watcher.
+        
+        Args:
+            directory: Directory to watch
+            callback: Called from the watcher thread with a set of changed filenames
+            debounce: Seconds of quiet before a batch of changes is reported
+            poll_interval: Seconds between scans when inotify is unavailable
+        """
+        self.directory = directory
+        self.callback = callback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.mode = None  # 'inotify' or 'polling' once started
+        self.thread = None
+        self._fd = None
+        self._wake_r = None
+        self._wake_w = None
+        self._stopping = False
+        self._previous = {}
+        
+    def start(self):
+        """Start watching in a daemon thread"""
+        if self.thread:
+            return
+        self._stopping = False
+        self._wake_r, self._wake_w = os.pipe()
+        self._fd = _open_inotify(self.directory)
+        self.mode = 'inotify' if self._fd is not None else 'polling'
+        self._previous = self._snapshot() if self._fd is None else {}
+        target = self._run_inotify if self._fd is not None else self._run_polling
+        self.thread = threading.Thread(target=target, daemon=True)
+        self.thread.start()
+        
+    def stop(self):
+        """Stop watching and wait for the thread to exit"""
+        if not self.thread:
+            return
+        self._stopping = True
+        os.write(self._wake_w, b'x')
+        self.thread.join()
+        self.thread = None
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._wake_r = self._wake_w = None
+        
+    def _emit(self, names):
+        """Report a batch of changed config filenames"""
+        names = {name for name in names if is_config_filename(name)}
+        if names:
+            self.callback(names)
+            
+    def _run_inotify(self):
+        """Read inotify events, reporting each batch after a quiet period"""
+        pending = set()
+        while not self._stopping:
+            # Block until something happens; once events are pending, only
+            # wait for the debounce period before flushing the batch
+            timeout = self.debounce if pending else None
+            readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+            if self._wake_r in readable:
+                break
+            if not readable:
+                self._emit(pending)
+                pending = set()
+                continue
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name:
+                    pending.add(os.fsdecode(name))
+                    
+    def _snapshot(self):
+        """(mtime_ns, size) of every config file in the directory"""
+        try:
+            with os.scandir(self.directory) as it:
+                return {e.name: (e.stat().st_mtime_ns, e.stat().st_size)
+                        for e in it if is_config_filename(e.name)}
+        except OSError:
+            return {}
+            
+    def _run_polling(self):
+        """Fallback: compare directory snapshots every poll_interval"""
+        previous = self._previous
+        while not self._stopping:
+            readable, _, _ = select.select([self._wake_r], [], [], self.poll_interval)
+            if readable:
+                break
+            current = self._snapshot()
+            changed = {name for name in previous.keys() | current.keys()
+                       if previous.get(name) != current.get(name)}
+            previous = current
+            if changed:
+                # Let a burst of writes finish before reporting it
+                time.sleep(self.debounce)
+                self._emit(changed)
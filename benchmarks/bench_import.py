@@ -0,0 +1,73 @@
+"""
+Import-time benchmark for the headless entry point.
+
+Measures the cold import time of ``autoclicker.cli`` in fresh interpreters
+and checks that no GUI or optional heavy module is pulled in.
+
+Usage: python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the headless path must never import
+FORBIDDEN = ('tkinter', 'pynput', 'numpy')
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "loaded = [m for m in {forbidden!r} if m in sys.modules]\n"
+    "print(elapsed * 1000, ','.join(loaded))\n"
+)
+
+
+def measure(module='autoclicker.cli', runs=10):
+    """
+    Import module in fresh interpreters.
+    
+    Returns:
+        (list of import times in ms, list of forbidden modules seen)
+    """
+    times = []
+    loaded = set()
+    code = PROBE.format(module=module, forbidden=FORBIDDEN)
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        elapsed, _, names = result.stdout.strip().partition(' ')
+        times.append(float(elapsed))
+        loaded.update(n for n in names.split(',') if n)
+    return times, sorted(loaded)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=50.0,
+                        help="Fail if the median import time exceeds this")
+    args = parser.parse_args(argv)
+    
+    times, loaded = measure(runs=args.runs)
+    median = statistics.median(times)
+    print(f"import autoclicker.cli: median {median:.1f} ms, "
+          f"min {min(times):.1f} ms, max {max(times):.1f} ms ({args.runs} runs)")
+          
+    ok = True
+    if loaded:
+        print(f"FAIL: headless import pulled in {', '.join(loaded)}")
+        ok = False
+    if median > args.budget_ms:
+        print(f"FAIL: median import time over budget ({args.budget_ms:.0f} ms)")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Click timing jitter benchmark: threaded engine vs engine process.
+
+Runs the same click sequence with the recording backend in both modes
+while busy threads in this process stand in for the GUI and the hotkey
+listener competing for the GIL, and reports how late each click fired
+relative to its deadline.
+
+Usage: python benchmarks/bench_jitter.py [--clicks N] [--load THREADS]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from autoclicker.backends import RecordingBackend  # noqa: E402
+from autoclicker.events import ClickEvent  # noqa: E402
+from autoclicker.models import ClickPoint  # noqa: E402
+from autoclicker.process import ProcessAutoClicker  # noqa: E402
+
+
+def busy(stop):
+    """Pure-Python work that holds the GIL in short bursts"""
+    while not stop.is_set():
+        sum(i * i for i in range(20000))
+
+
+def measure(use_process, clicks=100, load=2):
+    """
+    Run clicks clicks and collect their lateness.
+    
+    Returns:
+        List of per-click drift values in ms
+    """
+    clicker = ProcessAutoClicker(backend=RecordingBackend(), use_process=use_process)
+    clicker.add_point(ClickPoint(x=100, y=100, delay=0.1))
+    clicker.start_delay = 0.5
+    clicker.loop_count = clicks
+    clicker.verify_position = False
+    subscription = clicker.events.subscribe('bench', maxlen=clicks * 2, types=(ClickEvent,))
+    
+    stop = threading.Event()
+    workers = [threading.Thread(target=busy, args=(stop,), daemon=True) for _ in range(load)]
+    for worker in workers:
+        worker.start()
+    try:
+        clicker.start()
+        while clicker.running:
+            time.sleep(0.1)
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+        clicker.close()
+    return [event.drift_ns / 1e6 for event in subscription.drain()]
+
+
+def summarize(name, drifts):
+    """Print a one-line summary of drift values"""
+    drifts = sorted(drifts)
+    p99 = drifts[min(len(drifts) - 1, int(len(drifts) * 0.99))]
+    print(f"{name:8s} clicks {len(drifts):4d} | p50 {statistics.median(drifts):6.2f} ms | "
+          f"p99 {p99:6.2f} ms | max {drifts[-1]:6.2f} ms | stdev {statistics.pstdev(drifts):6.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clicks', type=int, default=100)
+    parser.add_argument('--load', type=int, default=2, help="Busy threads competing for the GIL")
+    args = parser.parse_args(argv)
+    
+    print(f"{args.clicks} clicks at 100 ms, {args.load} busy thread(s) in the controlling process")
+    for name, use_process in (('thread', False), ('process', True)):
+        drifts = measure(use_process, args.clicks, args.load)
+        if not drifts:
+            print(f"{name}: no clicks recorded")
+            return 1
+        summarize(name, drifts)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
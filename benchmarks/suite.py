@@ -0,0 +1,333 @@
+"""
+Benchmark suite for the engine, models, config I/O and imports.
+
+Everything runs headless: the engine clicks into the recording backend
+on a virtual clock, so a run measures pure per-click overhead instead of
+waiting out the configured delays. Results can be saved as a JSON
+baseline and later compared against a fresh run (or another results
+file); any benchmark that got slower by more than the threshold is
+flagged and the command exits with status 1.
+
+Usage:
+    python benchmarks/suite.py run [--only NAME ...] [--repeat N] [--save FILE]
+    python benchmarks/suite.py compare BASELINE [--current FILE] [--threshold PCT]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import bench_import  # noqa: E402
+from autoclicker.backends import RecordingBackend  # noqa: E402
+from autoclicker.catalog import ConfigCatalog  # noqa: E402
+from autoclicker.core import AutoClicker  # noqa: E402
+from autoclicker.models import ClickPoint  # noqa: E402
+from autoclicker.plan import ClickPlan  # noqa: E402
+from autoclicker.timing import VirtualClock  # noqa: E402
+from autoclicker.utils import optional_numpy  # noqa: E402
+
+CONFIG_SIZES = (10, 1000, 100000)
+CATALOG_SIZE = 1000
+
+
+def make_points(count):
+    """count randomized click points spread over a 1000x1000 area"""
+    return [ClickPoint(x=i % 1000, y=(i * 7) % 1000, delay=0.6 + (i % 5) * 0.1, randomize=True, random_range=3)
+            for i in range(count)]
+
+
+def bench_engine_click(clicks=20000, points=10):
+    """Engine overhead per click (us): the whole _run loop on a virtual clock"""
+    clicker = AutoClicker(backend=RecordingBackend(max_events=1000), clock=VirtualClock())
+    for point in make_points(points):
+        clicker.add_point(point)
+    clicker.start_delay = 0
+    clicker.loop_count = clicks // points
+    start = time.perf_counter()
+    clicker.start()
+    clicker.thread.join()
+    elapsed = time.perf_counter() - start
+    return elapsed / clicker.click_count * 1e6
+
+
+def bench_click_position(calls=200000):
+    """ClickPoint.get_click_position with randomization (ns per call)"""
+    point = ClickPoint(x=500, y=500, randomize=True, random_range=5)
+    get = point.get_click_position
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        get()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bench_plan_position(calls=200000):
+    """ClickPlan.position, the engine's compiled equivalent (ns per call)"""
+    plan = ClickPlan.compile(make_points(10))
+    position = plan.position
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        position(i % 10)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bench_config_io(count, tmp_dir):
+    """save_config and load_config of a count-point config (ms each)"""
+    clicker = AutoClicker(backend=RecordingBackend())
+    for point in make_points(count):
+        clicker.add_point(point)
+    path = os.path.join(tmp_dir, f"config_{count}.json")
+    start = time.perf_counter()
+    clicker.save_config(path, name=f"{count} points")
+    saved = time.perf_counter()
+    AutoClicker(backend=RecordingBackend()).load_config(path)
+    loaded = time.perf_counter()
+    return (saved - start) * 1000, (loaded - saved) * 1000
+
+
+def bench_replay_grab(calls=20000):
+    """ReplaySource.grab of a 100x100 region from a recorded 1080p frame (us per call)"""
+    from autoclicker.vision import Region, ReplaySource
+    np = optional_numpy()
+    source = ReplaySource(np.zeros((2, 1080, 1920, 4), dtype=np.uint8))
+    region = Region(800, 400, 100, 100)
+    grab = source.grab
+    start = time.perf_counter()
+    for _ in range(calls):
+        grab(region)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_inventory_scan(calls=5000):
+    """SlotScanner.scan of a 28-slot inventory from a recorded 1080p frame (us per call)"""
+    from autoclicker.models import InventoryGrid
+    from autoclicker.vision import ReplaySource
+    from autoclicker.vision.inventory import SlotScanner
+    np = optional_numpy()
+    scanner = SlotScanner(InventoryGrid(1650, 700), ReplaySource(np.zeros((2, 1080, 1920, 4), dtype=np.uint8)))
+    scan = scanner.scan
+    start = time.perf_counter()
+    for _ in range(calls):
+        scan()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_idle_feed(calls=5000):
+    """MotionTracker.feed of a 200x200 idle wait region, the capture thread's per-frame cost (us per call)"""
+    from autoclicker.models import IdleWait
+    from autoclicker.vision import Region, ReplaySource
+    from autoclicker.vision.idle import MotionTracker
+    np = optional_numpy()
+    source = ReplaySource(np.random.default_rng(0).integers(0, 256, (2, 1080, 1920, 4), dtype=np.uint8))
+    tracker = MotionTracker(IdleWait(800, 400, 200, 200))
+    frames = [source.grab(Region(800, 400, 200, 200)) for _ in range(2)]
+    feed = tracker.feed
+    start = time.perf_counter()
+    for i in range(calls):
+        feed(frames[i & 1])
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def make_catalog_dir(tmp_dir, count=CATALOG_SIZE):
+    """Directory of count small saved configs"""
+    configs_dir = os.path.join(tmp_dir, 'catalog')
+    os.makedirs(configs_dir, exist_ok=True)
+    clicker = AutoClicker(backend=RecordingBackend())
+    for point in make_points(10):
+        clicker.add_point(point)
+    for i in range(count):
+        clicker.save_config(os.path.join(configs_dir, f"config_{i:04d}.json"), name=f"Config {i}",
+                            description="Benchmark config")
+    return configs_dir
+
+
+def bench_catalog_scan(configs_dir):
+    """
+    The config panel's refresh over the catalog directory (ms each):
+    cold (no index, every file parsed) and warm (index up to date)
+    """
+    index = os.path.join(configs_dir, '.catalog.json')
+    if os.path.exists(index):
+        os.remove(index)
+    start = time.perf_counter()
+    catalog = ConfigCatalog(configs_dir)
+    catalog.scan()
+    catalog.sorted_entries()
+    cold = time.perf_counter()
+    catalog = ConfigCatalog(configs_dir)
+    catalog.scan()
+    catalog.sorted_entries()
+    warm = time.perf_counter()
+    return (cold - start) * 1000, (warm - cold) * 1000
+
+
+def run_suite(only=None, repeat=5):
+    """
+    Run the benchmarks.
+    
+    Args:
+        only: Run only benchmarks whose name starts with one of these
+        repeat: Runs per benchmark; the median is the reported value
+        
+    Returns:
+        Dict of name -> {'value', 'min', 'unit'} (lower is better for all)
+    """
+    samples = {}
+    units = {}
+    
+    def wanted(name):
+        return not only or any(name.startswith(prefix) for prefix in only)
+        
+    def add(name, unit, value):
+        samples.setdefault(name, []).append(value)
+        units[name] = unit
+        
+    tmp_dir = tempfile.mkdtemp(prefix='autoclicker-bench-')
+    try:
+        catalog_dir = None
+        if wanted(f"catalog_cold_scan_{CATALOG_SIZE}") or wanted(f"catalog_warm_scan_{CATALOG_SIZE}"):
+            catalog_dir = make_catalog_dir(tmp_dir)
+        for _ in range(repeat):
+            if wanted('engine_click'):
+                add('engine_click', 'us', bench_engine_click())
+            if wanted('click_position'):
+                add('click_position', 'ns', bench_click_position())
+            if wanted('plan_position'):
+                add('plan_position', 'ns', bench_plan_position())
+            for count in CONFIG_SIZES:
+                if wanted(f"config_save_{count}") or wanted(f"config_load_{count}"):
+                    save_ms, load_ms = bench_config_io(count, tmp_dir)
+                    add(f"config_save_{count}", 'ms', save_ms)
+                    add(f"config_load_{count}", 'ms', load_ms)
+            if wanted('replay_grab') and optional_numpy() is not None:
+                add('replay_grab', 'us', bench_replay_grab())
+            if wanted('inventory_scan') and optional_numpy() is not None:
+                add('inventory_scan', 'us', bench_inventory_scan())
+            if wanted('idle_feed') and optional_numpy() is not None:
+                add('idle_feed', 'us', bench_idle_feed())
+            if catalog_dir:
+                cold_ms, warm_ms = bench_catalog_scan(catalog_dir)
+                add(f"catalog_cold_scan_{CATALOG_SIZE}", 'ms', cold_ms)
+                add(f"catalog_warm_scan_{CATALOG_SIZE}", 'ms', warm_ms)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    if wanted('import_cli'):
+        # Each run is already a fresh interpreter
+        for value in bench_import.measure(runs=max(repeat, 5))[0]:
+            add('import_cli', 'ms', value)
+    return {name: {'value': statistics.median(values), 'min': min(values), 'unit': units[name]}
+            for name, values in samples.items() if wanted(name)}
+
+
+def print_results(results):
+    """Print results as a table"""
+    for name, result in results.items():
+        print(f"{name:28s} {result['value']:12.3f} {result['unit']:3s} (min {result['min']:.3f})")
+
+
+def save_results(results, path, repeat):
+    """Write results and a description of this machine to a JSON file"""
+    with open(path, 'w') as f:
+        json.dump({
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'repeat': repeat,
+            'results': results,
+        }, f, indent=2)
+
+
+def load_results(path):
+    """Read a results file written by save_results"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def compare(baseline, current, threshold=10.0):
+    """
+    Compare two result sets.
+    
+    Args:
+        baseline: Baseline results dict (name -> result)
+        current: Current results dict
+        threshold: Allowed slowdown in percent before a benchmark is
+            flagged as a regression
+            
+    Returns:
+        List of names that regressed
+    """
+    regressions = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current or name not in baseline:
+            print(f"{name:28s} only in {'baseline' if name in baseline else 'current run'}")
+            continue
+        old = baseline[name]['value']
+        new = current[name]['value']
+        change = (new - old) / old * 100 if old else 0.0
+        if change > threshold:
+            flag = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "improved"
+        else:
+            flag = ""
+        unit = current[name]['unit']
+        print(f"{name:28s} {old:12.3f} -> {new:12.3f} {unit:3s} {change:+7.1f}% {flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = commands.add_parser('run', help="Run the benchmarks")
+    run_parser.add_argument('--only', nargs='+', default=None, metavar='NAME',
+                            help="Run only benchmarks whose name starts with NAME")
+    run_parser.add_argument('--repeat', type=int, default=5, help="Runs per benchmark (median is kept)")
+    run_parser.add_argument('--save', default=None, metavar='FILE', help="Save the results as a JSON baseline")
+    
+    compare_parser = commands.add_parser('compare', help="Compare against a saved baseline")
+    compare_parser.add_argument('baseline', help="Baseline results file")
+    compare_parser.add_argument('--current', default=None, metavar='FILE',
+                                help="Results file to compare (default: run the benchmarks now)")
+    compare_parser.add_argument('--threshold', type=float, default=10.0,
+                                help="Flag benchmarks more than this many percent slower")
+    compare_parser.add_argument('--repeat', type=int, default=5, help="Runs per benchmark for a fresh run")
+    args = parser.parse_args(argv)
+    
+    if args.command == 'run':
+        results = run_suite(args.only, args.repeat)
+        print_results(results)
+        if args.save:
+            save_results(results, args.save, args.repeat)
+            print(f"Saved to {args.save}")
+        return 0
+        
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)['results']
+    else:
+        # Only rerun what the baseline has, so partial baselines stay quick
+        current = run_suite(list(baseline['results']), args.repeat)
+    print(f"Baseline: {args.baseline} ({baseline['created']}, Python {baseline['python']}, {baseline['platform']})")
+    regressions = compare(baseline['results'], current, args.threshold)
+    if regressions:
+        print(f"FAIL: {len(regressions)} benchmark(s) more than {args.threshold:.0f}% slower: "
+              f"{', '.join(regressions)}")
+        return 1
+    print(f"OK: nothing more than {args.threshold:.0f}% slower")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Config catalog: incremental scans and the persisted index.
+"""
+
+import json
+import os
+
+from autoclicker.catalog import CATALOG_FILENAME, ConfigCatalog
+
+
+def write_config(directory, filename, name, points=1, mtime_ns=None):
+    path = os.path.join(directory, filename)
+    with open(path, 'w') as f:
+        json.dump({'name': name, 'description': 'd', 'click_points': [{}] * points, 'saved_at': 'today'}, f)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_scan_indexes_configs_and_survives_a_reload(tmp_path):
+    directory = str(tmp_path)
+    write_config(directory, 'a.json', 'Alpha', points=3)
+    write_config(directory, 'b.json', 'Beta')
+    (tmp_path / 'notes.txt').write_text('not a config')
+    (tmp_path / 'broken.json').write_text('{')
+    catalog = ConfigCatalog(directory)
+    changes = catalog.scan()
+    assert sorted(changes.added) == ['a.json', 'b.json', 'broken.json']
+    assert catalog.entries['a.json']['name'] == 'Alpha' and catalog.entries['a.json']['points'] == 3
+    assert [name for name, _ in catalog.invalid()] == ['broken.json']
+    assert os.path.exists(os.path.join(directory, CATALOG_FILENAME))
+    
+    reloaded = ConfigCatalog(directory)
+    assert reloaded.entries == catalog.entries
+    assert not reloaded.scan()
+
+
+def test_scan_only_rereads_changed_files(tmp_path):
+    directory = str(tmp_path)
+    write_config(directory, 'a.json', 'Alpha', mtime_ns=10 ** 18)
+    write_config(directory, 'b.json', 'Beta')
+    catalog = ConfigCatalog(directory)
+    catalog.scan()
+    write_config(directory, 'a.json', 'Alpha 2', mtime_ns=2 * 10 ** 18)
+    os.remove(os.path.join(directory, 'b.json'))
+    changes = catalog.scan()
+    assert (changes.added, changes.updated, changes.removed) == ([], ['a.json'], ['b.json'])
+    assert catalog.entries['a.json']['name'] == 'Alpha 2'
+
+
+def test_scan_of_named_files(tmp_path):
+    directory = str(tmp_path)
+    catalog = ConfigCatalog(directory)
+    write_config(directory, 'a.json', 'Alpha')
+    write_config(directory, 'b.json', 'Beta')
+    changes = catalog.scan(['a.json', '.catalog.json', 'gone.json'])
+    assert (changes.added, changes.removed) == (['a.json'], [])
+    assert list(catalog.entries) == ['a.json']
@@ -0,0 +1,60 @@
+"""
+Cursor tracking: cached positions and the adaptive settle time.
+"""
+
+from autoclicker.backends import RecordingBackend
+from autoclicker.cursor import ROUND_TRIPS, CursorTracker
+
+
+class SlowDisplay(RecordingBackend):
+    """Recording backend on a fake clock whose position queries take round_trip_ns"""
+    
+    def __init__(self, round_trip_ns):
+        self.now = 0
+        super().__init__(clock=lambda: self.now)
+        self.round_trip_ns = round_trip_ns
+        
+    def get_position(self):
+        self.now += self.round_trip_ns
+        return super().get_position()
+
+
+def make_tracker(round_trip_ns):
+    backend = SlowDisplay(round_trip_ns)
+    return CursorTracker(backend, clock=lambda: backend.now)
+
+
+def test_settle_follows_the_measured_round_trip():
+    tracker = make_tracker(3_000_000)
+    tracker.start()
+    assert tracker.queries == ROUND_TRIPS
+    assert abs(tracker.settle_time() - 0.012) < 1e-9
+
+
+def test_moves_do_not_count_as_round_trips():
+    tracker = make_tracker(3_000_000)
+    tracker.start()
+    for i in range(100):
+        tracker.move(i, i)
+    assert abs(tracker.settle_time() - 0.012) < 1e-9
+
+
+def test_settle_is_clamped():
+    fast = make_tracker(0)
+    fast.start()
+    assert fast.settle_time() == fast.min_settle
+    slow = make_tracker(1_000_000_000)
+    slow.start()
+    assert slow.settle_time() == slow.max_settle
+
+
+def test_position_is_read_only_after_foreign_motion():
+    tracker = make_tracker(1000)
+    tracker.start()
+    tracker.move(10, 20)
+    assert tracker.get_position() == (10, 20)
+    assert tracker.queries == ROUND_TRIPS
+    tracker.backend.nudge(50, 60)
+    assert tracker.get_position() == (50, 60)
+    assert tracker.queries == ROUND_TRIPS + 1
+    assert tracker.foreign_events == 1
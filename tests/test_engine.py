@@ -0,0 +1,78 @@
+"""
+Click engine behaviour on a virtual clock against the recording backend.
+"""
+
+from autoclicker import trace
+from autoclicker.backends import RecordingBackend
+from autoclicker.core import AutoClicker
+from autoclicker.models import ClickPoint
+from autoclicker.timing import VirtualClock
+
+
+class BatchCountingBackend(RecordingBackend):
+    """Recording backend that counts click_at batches"""
+    
+    def __init__(self, clock):
+        super().__init__(clock=clock)
+        self.batches = 0
+        
+    def click_at(self, x, y, button='left'):
+        self.batches += 1
+        super().click_at(x, y, button)
+
+
+def run_engine(settle_time, loops=3):
+    """Run two points for loops loops; returns the engine"""
+    clock = VirtualClock(0)
+    engine = AutoClicker(backend=BatchCountingBackend(clock), clock=clock)
+    engine.add_point(ClickPoint(x=5, y=6, delay=0.5))
+    engine.add_point(ClickPoint(x=7, y=8, delay=0.5))
+    engine.start_delay = 0
+    engine.loop_count = loops
+    engine.settle_time = settle_time
+    engine.start()
+    engine.thread.join()
+    return engine
+
+
+def test_zero_settle_moves_and_clicks_in_one_batch():
+    engine = run_engine(settle_time=0.0)
+    assert engine.backend.batches == engine.click_count == 6
+    clicks = [e[:3] for e in engine.backend.events if e[0] != 'move']
+    assert clicks == [('left', 5, 6), ('left', 7, 8)] * 3
+
+
+def test_settle_moves_before_the_deadline():
+    engine = run_engine(settle_time=0.01)
+    assert engine.backend.batches == 0
+    # The first click is due at once, so only the later ones get the full settle
+    events = list(engine.backend.events)[2:]
+    for move, click in zip(events[::2], events[1::2]):
+        assert move[0] == 'move' and click[0] == 'left'
+        assert click[3] - move[3] >= 10_000_000
+
+
+def test_start_refuses_a_sequence_without_enabled_points():
+    engine = AutoClicker(backend=RecordingBackend(), clock=VirtualClock(0))
+    assert not engine.start()
+    point = ClickPoint(x=5, y=6, delay=0.5)
+    point.enabled = False
+    engine.add_point(point)
+    assert not engine.start()
+    assert not engine.running
+
+
+def test_trace_records_the_point_row(tmp_path):
+    clock = VirtualClock(0)
+    engine = AutoClicker(backend=RecordingBackend(clock=clock), clock=clock)
+    skipped = ClickPoint(x=1, y=1, delay=0.5)
+    skipped.enabled = False
+    for point in (skipped, ClickPoint(x=5, y=6, delay=0.5), ClickPoint(x=7, y=8, delay=0.5)):
+        engine.add_point(point)
+    engine.start_delay = 0
+    engine.loop_count = 2
+    engine.trace_path = str(tmp_path / 'run.trace')
+    engine.start()
+    engine.thread.join()
+    records = trace.load(engine.trace_path).records
+    assert [(r.index, r.x, r.y) for r in records] == [(1, 5, 6), (2, 7, 8)] * 2
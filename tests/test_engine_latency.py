@@ -0,0 +1,100 @@
+"""
+Stop and pause latency of the click engine.
+
+The engine runs in real time against the recording backend, with delays
+far longer than the test, so anything but an interruptible wait would
+show up as a latency of seconds.
+"""
+
+import time
+
+from autoclicker.backends import RecordingBackend
+from autoclicker.core import AutoClicker
+from autoclicker.models import ClickPoint
+
+MAX_LATENCY_MS = 20.0  # "A few milliseconds", with room for a loaded test machine
+
+
+def make_engine(delay, points=1, start_delay=0.0):
+    """Engine with points click points delay seconds apart, not started"""
+    engine = AutoClicker(backend=RecordingBackend())
+    for i in range(points):
+        engine.add_point(ClickPoint(x=10 * (i + 1), y=10, delay=delay))
+    engine.start_delay = start_delay
+    engine.verify_position = False
+    return engine
+
+
+def clicks(engine):
+    """Click timestamps recorded so far"""
+    return [t for kind, _, _, t in list(engine.backend.events) if kind != 'move']
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll predicate until it is true or timeout seconds pass"""
+    end = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > end:
+            raise AssertionError("Timed out waiting for the engine")
+        time.sleep(0.001)
+
+
+def test_stop_interrupts_a_long_delay():
+    engine = make_engine(delay=30.0)
+    engine.start()
+    wait_for(lambda: clicks(engine))
+    requested = time.monotonic()
+    engine.stop()
+    engine.thread.join(1.0)
+    assert not engine.thread.is_alive()
+    assert (time.monotonic() - requested) * 1000 < MAX_LATENCY_MS
+    assert 0 < engine.get_run_stats()['stop_latency_ms'] < MAX_LATENCY_MS
+    assert len(clicks(engine)) == 1
+
+
+def test_stop_interrupts_the_start_delay():
+    engine = make_engine(delay=1.0, start_delay=30.0)
+    engine.start()
+    time.sleep(0.02)
+    engine.stop()
+    engine.thread.join(1.0)
+    assert not engine.thread.is_alive()
+    assert engine.get_run_stats()['stop_latency_ms'] < MAX_LATENCY_MS
+    assert clicks(engine) == []
+
+
+def test_pause_holds_within_a_few_ms():
+    engine = make_engine(delay=30.0)
+    engine.start()
+    wait_for(lambda: clicks(engine))
+    engine.pause()
+    wait_for(lambda: engine.pause_latency_ns)
+    assert engine.get_run_stats()['pause_latency_ms'] < MAX_LATENCY_MS
+    engine.stop()
+    engine.thread.join(1.0)
+    assert not engine.thread.is_alive()
+    assert engine.get_run_stats()['stop_latency_ms'] < MAX_LATENCY_MS
+
+
+def test_pause_resume_keeps_the_schedule():
+    delay = 0.1
+    pause = 0.2
+    engine = make_engine(delay=delay, points=2)
+    engine.loop_count = 2
+    engine.start()
+    wait_for(lambda: clicks(engine))
+    time.sleep(0.03)
+    engine.pause()
+    time.sleep(pause)
+    engine.resume()
+    engine.thread.join(2.0)
+    assert not engine.thread.is_alive()
+    times = [t / 1e9 for t in clicks(engine)]
+    assert len(times) == 4
+    # The click due during the pause comes the pause's length late, with
+    # the remaining delay intact...
+    assert abs(times[1] - times[0] - delay - pause) < 0.015
+    # ...and the clicks after it stay on the shifted absolute schedule
+    for a, b in zip(times[1:], times[2:]):
+        assert abs(b - a - delay) < 0.015
+    assert engine.get_run_stats()['mean_drift_ms'] < 5.0
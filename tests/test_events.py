@@ -0,0 +1,67 @@
+"""
+Event bus drop policies and fan-out.
+"""
+
+import pytest
+
+from autoclicker.events import COALESCE, DROP_NEWEST, DROP_OLDEST, ClickEvent, EventBus, LoopEvent, StatusEvent
+
+
+def click(n):
+    return ClickEvent(n, 0, 1, 2, n, 1, 0)
+
+
+def test_drop_oldest_keeps_the_latest_events():
+    bus = EventBus()
+    subscription = bus.subscribe('log', maxlen=3, policy=DROP_OLDEST)
+    for n in range(5):
+        bus.publish(click(n))
+    assert len(subscription) == 3
+    assert [e.count for e in subscription.drain()] == [2, 3, 4]
+    assert subscription.dropped == 2 and subscription.drain() == []
+
+
+def test_drop_newest_keeps_the_first_events():
+    bus = EventBus()
+    subscription = bus.subscribe('log', maxlen=3, policy=DROP_NEWEST)
+    for n in range(5):
+        bus.publish(click(n))
+    assert [e.count for e in subscription.drain()] == [0, 1, 2]
+    assert subscription.dropped == 2
+    bus.publish(click(5))
+    assert [e.count for e in subscription.drain()] == [5]
+
+
+def test_coalesce_keeps_the_latest_of_each_type_in_time_order():
+    bus = EventBus()
+    subscription = bus.subscribe('gui', policy=COALESCE)
+    bus.publish(StatusEvent(1, 'Running'))
+    for n in range(2, 5):
+        bus.publish(click(n))
+    bus.publish(LoopEvent(6, 1, 0))
+    bus.publish(StatusEvent(5, 'Paused'))
+    assert subscription.drain() == [click(4), StatusEvent(5, 'Paused'), LoopEvent(6, 1, 0)]
+    assert subscription.dropped == 3
+    assert bus.get_stats() == {'gui': 3}
+
+
+def test_types_filter_and_ready_notification():
+    bus = EventBus()
+    subscription = bus.subscribe('status', types=(StatusEvent,))
+    notified = []
+    subscription.on_ready = lambda: notified.append(len(subscription))
+    bus.publish(click(1))
+    bus.publish(StatusEvent(2, 'a'))
+    bus.publish(StatusEvent(3, 'b'))
+    assert notified == [1]  # Once per batch
+    assert len(subscription.drain()) == 2
+    bus.publish(StatusEvent(4, 'c'))
+    assert notified == [1, 1]
+    bus.unsubscribe(subscription)
+    bus.publish(StatusEvent(5, 'd'))
+    assert len(subscription) == 1
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        EventBus().subscribe('x', policy='block')
@@ -0,0 +1,61 @@
+"""
+Idle detection by frame differencing on replayed frame sequences.
+"""
+
+import pytest
+
+from autoclicker.models import IdleWait
+from autoclicker.timing import VirtualClock
+from autoclicker.vision.idle import IdleMonitor
+from autoclicker.vision.replay import ReplaySource
+
+np = pytest.importorskip('numpy')
+
+
+def frame(level):
+    """Flat grey BGRX frame"""
+    return np.full((40, 40, 4), level, dtype=np.uint8)
+
+
+def replay(levels, wait):
+    """Monitor for one idle wait over frames 0.1 s apart, and its clock"""
+    clock = VirtualClock(0)
+    source = ReplaySource([frame(level) for level in levels], interval=0.1, loop=False, clock=clock)
+    return IdleMonitor([wait], source, background=False), clock
+
+
+def checks(monitor, clock, count, since_ns=0):
+    """Check once per frame"""
+    results = []
+    for _ in range(count):
+        results.append(monitor.check(0, since_ns))
+        clock.sleep(0.1)
+    return results
+
+
+def test_idle_after_movement_and_enough_still_frames():
+    wait = IdleWait(0, 0, 40, 40, frames=3)
+    monitor, clock = replay([10, 60, 120] + [120] * 5, wait)
+    assert checks(monitor, clock, 8) == [False] * 5 + [True] * 3
+
+
+def test_a_region_that_never_moves_is_not_idle():
+    monitor, clock = replay([10] * 6, IdleWait(0, 0, 40, 40, frames=2))
+    assert not any(checks(monitor, clock, 6))
+
+
+def test_small_flicker_is_not_movement():
+    monitor, clock = replay([10, 12, 10, 12, 10, 12], IdleWait(0, 0, 40, 40, frames=2, threshold=3.0))
+    assert not any(checks(monitor, clock, 6))
+
+
+def test_change_mode_fires_once_the_region_differs():
+    monitor, clock = replay([10, 10, 80, 10], IdleWait(0, 0, 40, 40, mode='change'))
+    assert checks(monitor, clock, 4) == [False, False, True, True]
+
+
+def test_a_new_wait_starts_over():
+    monitor, clock = replay([10, 60] + [60] * 6, IdleWait(0, 0, 40, 40, frames=2))
+    assert checks(monitor, clock, 4) == [False, False, False, True]
+    # Re-armed after the movement: the region has been still ever since
+    assert not any(checks(monitor, clock, 4, since_ns=clock()))
@@ -0,0 +1,37 @@
+"""
+Headless imports: the package and the CLI never load tkinter or pynput.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import autoclicker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(statement):
+    """Names of GUI modules loaded after running statement in a fresh interpreter"""
+    code = (f"import sys\n{statement}\n"
+            "print(' '.join(m for m in ('tkinter', 'pynput') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_cli_imports_without_tkinter():
+    assert loaded_after("import autoclicker.cli") == []
+
+
+def test_engine_names_import_without_tkinter():
+    assert loaded_after("from autoclicker import AutoClicker, ClickPoint, PointTable, create_backend") == []
+
+
+def test_package_names_resolve_lazily():
+    from autoclicker.models import PointTable
+    assert autoclicker.PointTable is PointTable
+    assert 'PointTable' in dir(autoclicker)
+    with pytest.raises(AttributeError):
+        autoclicker.NotAName
@@ -0,0 +1,52 @@
+"""
+Inventory slot occupancy on synthetic inventory frames.
+"""
+
+import pytest
+
+from autoclicker.models import InventoryGrid
+from autoclicker.vision.inventory import SlotScanner
+from autoclicker.vision.replay import ReplaySource
+
+np = pytest.importorskip('numpy')
+
+BACKGROUND = (62, 53, 41)
+GRID = InventoryGrid(x=40, y=30, background=BACKGROUND)
+
+
+def inventory(items, item_size=14):
+    """BGRX frame of the grid's region with an item drawn in each slot of items"""
+    x, y, width, height = GRID.region()
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    pixels[..., :3] = BACKGROUND[::-1]
+    for slot in items:
+        cx, cy = GRID.center(slot)
+        top, left = cy - y - item_size // 2, cx - x - item_size // 2
+        pixels[top:top + item_size, left:left + item_size, :3] = (20, 180, 220)
+    return pixels
+
+
+def test_occupied_slots_are_found():
+    scanner = SlotScanner(GRID)
+    items = {0, 5, 6, 13, 27}
+    assert scanner.occupied(inventory(items)) == [slot in items for slot in range(28)]
+    assert not any(scanner.occupied(inventory([])))
+
+
+def test_small_specks_and_noise_stay_empty():
+    scanner = SlotScanner(GRID)
+    pixels = inventory([])
+    rng = np.random.default_rng(0)
+    noise = rng.integers(-15, 16, size=pixels.shape[:2] + (3,))
+    pixels[..., :3] = np.clip(pixels[..., :3] + noise, 0, 255)
+    assert not any(scanner.occupied(pixels))
+    fill = scanner.fill(inventory([3], item_size=2))
+    assert 0 < fill[3] < GRID.min_fill
+
+
+def test_scan_and_background_sampling():
+    x, y, _, _ = GRID.region()
+    source = ReplaySource([inventory([1, 2])], origin=(x, y))
+    scanner = SlotScanner(GRID, source)
+    assert scanner.scan()[:4] == [False, True, True, False]
+    assert scanner.sample_background(inventory([1, 2])) == BACKGROUND
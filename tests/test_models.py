@@ -0,0 +1,75 @@
+"""
+Click point models: PointTable columns, transforms and serialization.
+"""
+
+import pytest
+
+from autoclicker.models import ClickPoint, IdleWait, InventoryGrid, PixelCondition, PointTable
+
+
+def make_table():
+    return PointTable([
+        ClickPoint(x=10, y=20, delay=1.0),
+        ClickPoint(x=30, y=40, delay=2.0, condition=PixelCondition([(31, 41, (255, 0, 0))], tolerance=5)),
+        ClickPoint(x=50, y=60, delay=0.6, inventory=InventoryGrid(50, 60), idle=IdleWait(0, 0, 100, 80)),
+    ])
+
+
+@pytest.fixture(params=['numpy', 'stdlib'])
+def columns(request, monkeypatch):
+    """Run a test with NumPy column transforms and again without NumPy"""
+    from autoclicker import models
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(models, 'optional_numpy', lambda: None)
+    return request.param
+
+
+def test_translate_moves_points_and_their_regions(columns):
+    table = make_table()
+    table.translate(5, -3)
+    assert list(table.xs) == [15, 35, 55] and list(table.ys) == [17, 37, 57]
+    assert table[0].condition is None
+    assert table[1].condition.pixels == ((36, 38, (255, 0, 0)),)
+    assert table[2].inventory.center(0) == (55, 57)
+    assert table[2].idle.region() == (5, -3, 100, 80)
+
+
+def test_scale_moves_points_and_their_regions(columns):
+    table = make_table()
+    table.scale(2.0, origin=(10, 20))
+    assert list(table.xs) == [10, 50, 90] and list(table.ys) == [20, 60, 100]
+    assert table[1].condition.pixels == ((52, 62, (255, 0, 0)),)
+    assert table[2].idle.region() == (-10, -20, 200, 160)
+
+
+def test_regions_added_after_a_transform_still_move():
+    table = PointTable([ClickPoint(x=i, y=i, delay=1.0) for i in range(10)])
+    table.translate(1, 1)  # Caches "no regions"
+    point = table[4]
+    point.idle = IdleWait(0, 0, 10, 10)
+    table[4] = point
+    table.translate(1, 1)
+    assert table[4].idle.region() == (1, 1, 10, 10)
+    assert all(table[i].idle is None for i in range(10) if i != 4)
+
+
+def test_round_trip_keeps_every_column():
+    table = make_table()
+    table.set_enabled([True, False, True])
+    copy = PointTable.from_dicts(table.to_dicts())
+    assert copy.to_dicts() == table.to_dicts()
+    assert copy[1].condition == table[1].condition
+    assert copy[2].inventory == table[2].inventory
+    assert copy[2].idle == table[2].idle
+    assert copy.enabled_indices() == [0, 2]
+
+
+def test_delete_and_insert_keep_columns_aligned():
+    table = make_table()
+    del table[1]
+    table.insert(0, ClickPoint(x=1, y=2, delay=3.0))
+    assert [p.x for p in table] == [1, 10, 50]
+    assert [p.condition for p in table] == [None, None, None]
+    assert table[2].idle == IdleWait(0, 0, 100, 80)
@@ -0,0 +1,94 @@
+"""
+Click thread performance profile: what is applied, and graceful
+degradation when the process lacks the permissions.
+"""
+
+import gc
+import os
+import threading
+
+import pytest
+
+from autoclicker import perf
+from autoclicker.perf import PerformanceProfile
+
+
+def in_thread(func):
+    """Run func on a fresh thread, as the engine does, and return its result"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def deny(*args):
+    raise PermissionError(1, "Operation not permitted")
+
+
+@pytest.fixture
+def unprivileged(monkeypatch):
+    """Refuse every scheduling change, like an ordinary user's process"""
+    for name in ('sched_setaffinity', 'sched_setscheduler', 'setpriority'):
+        if hasattr(os, name):
+            monkeypatch.setattr(perf.os, name, deny)
+
+
+def test_default_profile_changes_nothing():
+    profile = PerformanceProfile()
+    assert not profile.enabled
+    
+    def run():
+        profile.apply()
+        profile.between_loops()
+        profile.restore()
+        return profile.get_stats()
+        
+    stats = in_thread(run)
+    assert stats['perf_cpu'] is None and stats['perf_policy'] == 'default' and stats['perf_notes'] == []
+    assert stats['gc_collections'] == 0
+
+
+def test_denied_options_are_reported_not_raised(unprivileged):
+    profile = PerformanceProfile(cpu=0, priority='realtime')
+    assert profile.enabled
+    
+    def run():
+        profile.apply()
+        saved = dict(profile._saved)
+        profile.restore()
+        return saved, profile.get_stats()
+        
+    saved, stats = in_thread(run)
+    assert saved == {}  # Nothing to undo
+    assert stats['perf_cpu'] is None and stats['perf_policy'] == 'default'
+    assert stats['perf_notes'] == ["CPU pinning failed", "SCHED_FIFO not permitted", "nice not permitted"]
+
+
+def test_gc_control_collects_only_between_loops():
+    profile = PerformanceProfile(gc_control=True)
+    assert gc.isenabled()
+    
+    def run():
+        profile.apply()
+        during = gc.isenabled()
+        profile.between_loops()
+        profile.between_loops()
+        profile.restore()
+        return during
+        
+    assert in_thread(run) is False
+    assert gc.isenabled() and gc.get_freeze_count() == 0
+    assert profile.gc_collections == 2 and profile.gc_max_pause_ns <= profile.gc_pause_ns
+
+
+def test_counters_round_trip():
+    profile = PerformanceProfile(cpu=1, priority='high', gc_control=True)
+    copy = PerformanceProfile.from_dict(profile.to_dict())
+    assert copy.to_dict() == profile.to_dict()
+    profile.failures = perf.NICE_DENIED
+    profile.gc_collections = 3
+    copy.load_counters(profile.counters())
+    assert copy.get_stats() == profile.get_stats()
+    with pytest.raises(ValueError):
+        PerformanceProfile(priority='urgent')
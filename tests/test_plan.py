@@ -0,0 +1,85 @@
+"""
+Compiled click plans: entries, pre-drawn randomization and passes.
+"""
+
+from array import array
+
+import pytest
+
+from autoclicker import plan as plan_module
+from autoclicker.models import ClickPoint, PointTable
+from autoclicker.plan import BLOCK_SIZE, DELAY_VARIATION, MIN_DELAY, ClickPlan
+
+
+@pytest.fixture(params=['numpy', 'stdlib'])
+def draws(request, monkeypatch):
+    """Run a test with NumPy draws and again with the stdlib fallback"""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(plan_module, 'optional_numpy', lambda: None)
+    return request.param
+
+
+def make_points():
+    disabled = ClickPoint(x=500, y=600, delay=0.5)
+    disabled.enabled = False
+    return [
+        ClickPoint(x=100, y=200, delay=1.0, randomize=True, random_range=5),
+        ClickPoint(x=300, y=400, delay=2.0),
+        disabled,
+        ClickPoint(x=700, y=800, delay=0.05, randomize=True, random_range=1),
+    ]
+
+
+def test_compile_keeps_enabled_points_in_order():
+    plan = ClickPlan.compile(make_points())
+    assert list(plan.xs) == [100, 300, 700]
+    assert list(plan.indices) == [0, 1, 3]
+    table_plan = ClickPlan.compile(PointTable(make_points()))
+    assert list(table_plan.xs) == list(plan.xs)
+    assert list(table_plan.spreads) == [5, 0, 1]
+
+
+def test_positions_and_delays_stay_in_range(draws):
+    plan = ClickPlan.compile(make_points())
+    seen = set()
+    for _ in range(3 * BLOCK_SIZE // len(plan)):  # Past a few redraws
+        x, y = plan.position(0)
+        assert 95 <= x <= 105 and 195 <= y <= 205
+        seen.add(x)
+        assert plan.position(1) == (300, 400)
+        assert 1 - DELAY_VARIATION <= plan.delay(0) <= 1 + DELAY_VARIATION
+        assert 2 - 2 * DELAY_VARIATION <= plan.delay(1) <= 2 + 2 * DELAY_VARIATION
+        assert plan.delay(2) == MIN_DELAY
+        plan.next_pass()
+    assert seen == set(range(95, 106))
+
+
+def test_a_pass_is_stable_until_next_pass(draws):
+    plan = ClickPlan.compile(make_points())
+    first = plan.position(0), plan.delay(0)
+    assert (plan.position(0), plan.delay(0)) == first
+    changed = False
+    for _ in range(20):
+        plan.next_pass()
+        changed = changed or (plan.position(0), plan.delay(0)) != first
+    assert changed
+
+
+def test_plans_larger_than_a_block_draw_one_pass_at_a_time(draws):
+    count = BLOCK_SIZE + 10
+    plan = ClickPlan(array('i', range(count)), array('i', [0]) * count, array('i', [0]) * count,
+                     array('d', [1.0]) * count, array('i', range(count)))
+    assert plan.position(count - 1) == (count - 1, 0)
+    plan.next_pass()
+    assert plan.position(count - 1) == (count - 1, 0)
+
+
+def test_inventory_point_expands_to_its_slots():
+    from autoclicker.models import InventoryGrid
+    grid = InventoryGrid(563, 213, columns=2, rows=2)
+    plan = ClickPlan.compile([ClickPoint(x=563, y=213, delay=0.6, inventory=grid)])
+    assert len(plan) == 4
+    assert list(plan.slots) == list(grid.slot_order())
+    assert [(plan.xs[i], plan.ys[i]) for i in range(4)] == [grid.center(s) for s in grid.slot_order()]
@@ -0,0 +1,48 @@
+"""
+Pixel conditions checked against replayed frames.
+"""
+
+import pytest
+
+from autoclicker.models import PixelCondition
+from autoclicker.timing import VirtualClock
+from autoclicker.vision.probe import ConditionMonitor, PixelProbe
+from autoclicker.vision.replay import ReplaySource
+
+np = pytest.importorskip('numpy')
+
+RED = (200, 30, 30)
+GREEN = (30, 200, 30)
+
+
+def frame(color, width=20, height=20):
+    """BGRX frame of one (r, g, b) colour"""
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    pixels[..., :3] = color[::-1]
+    return pixels
+
+
+def test_probe_checks_every_pixel_or_any():
+    pixels = frame(RED)
+    pixels[5, 12, :3] = GREEN[::-1]  # (x=12, y=5)
+    both = [(3, 4, RED), (12, 5, RED)]
+    assert not PixelProbe(PixelCondition(both, tolerance=10)).matches(pixels[4:6, 3:13])
+    assert PixelProbe(PixelCondition(both, tolerance=10, match='any')).matches(pixels[4:6, 3:13])
+    near = [(3, 4, (210, 20, 40))]
+    assert PixelProbe(PixelCondition(near, tolerance=10)).matches(pixels[4:5, 3:4])
+    assert not PixelProbe(PixelCondition(near, tolerance=9)).matches(pixels[4:5, 3:4])
+
+
+def test_monitor_fires_once_the_frame_shows_the_colour():
+    clock = VirtualClock(0)
+    source = ReplaySource([frame(RED), frame(RED), frame(GREEN)], interval=0.1, loop=False, clock=clock)
+    condition = PixelCondition([(8, 8, GREEN)])
+    monitor = ConditionMonitor([None, condition], source, background=False)
+    assert monitor.probes[0] is None
+    seen = []
+    for _ in range(4):
+        seen.append(monitor.check(1))
+        clock.sleep(0.1)
+    assert seen == [False, False, True, True]
+    # Frames captured before since_ns don't count
+    assert not monitor.check(1, since_ns=clock() + 1)
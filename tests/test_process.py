@@ -0,0 +1,77 @@
+"""
+Shared-memory telemetry of the process-isolated engine.
+"""
+
+import threading
+
+from autoclicker.backends import RecordingBackend
+from autoclicker.core import AutoClicker
+from autoclicker.events import ClickEvent, StatusEvent
+from autoclicker.process import _SEQ, TELEMETRY_SIZE, WRITE_INTERVAL_NS, TelemetryReader, TelemetryWriter
+from autoclicker.timing import VirtualClock
+
+
+def make_writer():
+    engine = AutoClicker(backend=RecordingBackend(), clock=VirtualClock(0))
+    return TelemetryWriter(bytearray(TELEMETRY_SIZE), engine)
+
+
+def test_reader_sees_the_written_counters():
+    writer = make_writer()
+    writer.engine.click_count = 42
+    writer.engine.slots_skipped = 7
+    writer.write()
+    snapshot = TelemetryReader(writer.buf).read()
+    assert snapshot.click_count == 42 and snapshot.slots_skipped == 7
+    assert not snapshot.running
+    assert writer.seq == 2 and _SEQ.unpack_from(writer.buf, 0)[0] == 2
+
+
+def test_reader_falls_back_to_the_last_snapshot_during_a_write():
+    writer = make_writer()
+    reader = TelemetryReader(writer.buf)
+    writer.engine.click_count = 2
+    writer.write()
+    assert reader.read().click_count == 2
+    # Leave the sequence odd, as if the writer were halfway through
+    writer.engine.click_count = 3
+    _SEQ.pack_into(writer.buf, 0, writer.seq + 1)
+    assert reader.read().click_count == 2
+    writer.write()
+    assert reader.read().click_count == 3
+
+
+def test_clicks_are_published_at_most_once_per_interval():
+    writer = make_writer()
+    for n in range(10):
+        writer.offer(ClickEvent(n * WRITE_INTERVAL_NS // 4, 0, 0, 0, 1, 1, 0))
+    # Clicks at 0, 1/4, ..., 9/4 intervals: written at 0, 1 and 2 intervals
+    assert writer.seq == 6
+    assert writer.last_click_ns == 9 * WRITE_INTERVAL_NS // 4
+    writer.offer(StatusEvent(0, 'Stopped'))
+    assert writer.seq == 8
+
+
+def test_concurrent_reads_are_never_torn():
+    writer = make_writer()
+    engine = writer.engine
+    writer.write()
+    done = threading.Event()
+    torn = []
+    
+    def read():
+        reader = TelemetryReader(writer.buf)
+        while not done.is_set():
+            snapshot = reader.read()
+            # The writer always keeps these two equal
+            if snapshot.click_count != snapshot.current_loop:
+                torn.append(snapshot)
+                
+    thread = threading.Thread(target=read)
+    thread.start()
+    for n in range(20000):
+        engine.click_count = engine.current_loop = n
+        writer.write()
+    done.set()
+    thread.join()
+    assert torn == []
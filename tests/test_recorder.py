@@ -0,0 +1,52 @@
+"""
+Macro recordings: the event ring, conversion to click points and
+serialization. Only the key press round trip needs pynput (and so a
+display).
+"""
+
+import pytest
+
+from autoclicker import recorder
+from autoclicker.recorder import EventRing, Macro, MacroEvent
+
+
+def make_macro():
+    """Left clicks at 0 s and 1 s, a right click between them, stopped at 1.5 s"""
+    return Macro([
+        MacroEvent(0, 'click', 10, 20, 'left', None),
+        MacroEvent(600_000_000, 'click', 30, 40, 'right', None),
+        MacroEvent(1_000_000_000, 'click', 50, 60, 'left', None),
+    ], 1_500_000_000)
+
+
+def test_ring_keeps_the_newest_events():
+    ring = EventRing(capacity=3)
+    for n in range(5):
+        ring.push(n, x=n, y=2 * n, code=1)
+    assert ring.dropped == 2
+    assert list(ring) == [(2, 2, 4, 1, None), (3, 3, 6, 1, None), (4, 4, 8, 1, None)]
+
+
+def test_left_clicks_become_points_with_their_delays():
+    macro = make_macro()
+    assert len(macro.clicks) == 3 and macro.duration == 1.5
+    points = macro.to_points()
+    assert [(p.x, p.y, p.delay) for p in points] == [(10, 20, 1.0), (50, 60, 0.5)]
+    assert [p.delay for p in macro.to_points(speed=2.0)] == [0.5, 0.25]
+    assert Macro([], 0).to_points() == []
+
+
+def test_click_macros_round_trip():
+    macro = make_macro()
+    data = macro.to_dict()
+    assert data['events'][1] == [600.0, 'click', 30, 40, 'right']
+    copy = Macro.from_dict(data)
+    assert copy.events == macro.events and copy.duration_ns == macro.duration_ns
+
+
+def test_key_presses_round_trip():
+    keyboard = pytest.importorskip('pynput', exc_type=ImportError).keyboard
+    keys = [keyboard.Key.space, keyboard.KeyCode.from_char('a'), keyboard.KeyCode.from_vk(65437)]
+    assert [recorder.encode_key(key) for key in keys] == ['Key.space', 'a', '<65437>']
+    macro = Macro([MacroEvent(n * 1_000_000, 'key', 0, 0, None, key) for n, key in enumerate(keys)], 10_000_000)
+    assert Macro.from_dict(macro.to_dict()).events == macro.events
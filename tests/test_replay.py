@@ -0,0 +1,54 @@
+"""
+Replayed frame source: playback timing, region grabs and recordings.
+"""
+
+import pytest
+
+from autoclicker.timing import VirtualClock
+from autoclicker.vision.base import Region
+from autoclicker.vision.replay import ReplaySource, save_recording
+
+np = pytest.importorskip('numpy')
+
+
+def make_frames(count=3, width=8, height=6):
+    """Frames whose every pixel holds the frame number, then its x and y"""
+    frames = np.zeros((count, height, width, 4), dtype=np.uint8)
+    frames[..., 0] = np.arange(count)[:, None, None]
+    frames[..., 1] = np.arange(width)[None, None, :]
+    frames[..., 2] = np.arange(height)[None, :, None]
+    return frames
+
+
+def test_frames_follow_the_clock_and_loop():
+    clock = VirtualClock(1000)
+    source = ReplaySource(make_frames(), interval=0.1, clock=clock)
+    shown = []
+    for _ in range(7):
+        shown.append(int(source.grab(Region(0, 0, 1, 1)).pixels[0, 0, 0]))
+        clock.sleep(0.05)
+    assert shown == [0, 0, 1, 1, 2, 2, 0]
+    source.loop = False
+    assert source.index_at(10 ** 10) == 2
+
+
+def test_grab_returns_the_region_relative_to_the_origin():
+    source = ReplaySource(make_frames(), origin=(100, 50), clock=VirtualClock(0))
+    assert source.screen_size() == (108, 56)
+    frame = source.grab(Region(103, 52, 2, 3))
+    assert frame.pixels.shape == (3, 2, 4)
+    assert frame.pixels[0, 0, 1] == 3 and frame.pixels[0, 0, 2] == 2
+    with pytest.raises(ValueError):
+        source.grab(Region(99, 50, 2, 2))
+
+
+def test_bgr_frames_and_recordings(tmp_path):
+    bgr = make_frames()[..., :3]
+    path = str(tmp_path / 'frames.npz')
+    save_recording(path, make_frames(), timestamps_ns=[5, 25, 30], origin=(4, 2))
+    source = ReplaySource.load(path, clock=VirtualClock(0))
+    assert source.origin == (4, 2) and list(source.timestamps_ns) == [0, 20, 25]
+    assert np.array_equal(source.frames, make_frames())
+    assert ReplaySource(bgr).frames.shape == (3, 6, 8, 4)
+    with pytest.raises(ValueError):
+        ReplaySource(make_frames(), timestamps_ns=[0, 1])
@@ -0,0 +1,82 @@
+"""
+Absolute-deadline scheduling on a virtual clock.
+"""
+
+from autoclicker.scheduler import DeadlineScheduler
+from autoclicker.timing import VirtualClock
+
+MS = 1_000_000
+
+
+class OversleepingClock(VirtualClock):
+    """Virtual clock whose sleeps wake up late, like a loaded system"""
+    
+    def __init__(self, late_ms):
+        super().__init__(0)
+        self.late_ns = int(late_ms * MS)
+        
+    def sleep(self, seconds):
+        super().sleep(seconds)
+        self.now_ns += self.late_ns
+        return False
+
+
+def make_scheduler(clock):
+    return DeadlineScheduler(clock=clock, sleep=clock.sleep)
+
+
+def test_late_wakeups_do_not_add_up():
+    clock = OversleepingClock(late_ms=3)
+    scheduler = make_scheduler(clock)
+    scheduler.start()
+    for n in range(1, 101):
+        scheduler.advance(0.5)
+        scheduler.wait()
+        assert scheduler.deadline_ns == n * 500 * MS
+    # Every click is 3 ms late, never 3 ms more than the previous one
+    assert scheduler.drift_ns == scheduler.max_drift_ns == 3 * MS
+    stats = scheduler.get_stats()
+    assert stats['mean_drift_ms'] == 3.0 and stats['scheduled'] == 50.0
+
+
+def test_a_slow_step_is_caught_up_at_the_next_deadline():
+    clock = VirtualClock(0)
+    scheduler = make_scheduler(clock)
+    scheduler.start(delay=1.0)
+    scheduler.wait()
+    scheduler.advance(1.0)
+    clock.sleep(0.4)  # Slow move or callback after the click
+    start = clock()
+    scheduler.wait()
+    assert clock() - start == 600 * MS and scheduler.drift_ns == 0
+    scheduler.advance(1.0)
+    clock.sleep(1.5)  # Overran the next deadline entirely
+    assert scheduler.remaining() == 0
+    assert scheduler.wait() == 500 * MS
+    scheduler.advance(1.0)
+    scheduler.wait()
+    assert clock() == 4000 * MS and scheduler.max_drift_ns == 500 * MS
+
+
+def test_shift_moves_the_whole_session():
+    clock = VirtualClock(0)
+    scheduler = make_scheduler(clock)
+    scheduler.start(delay=1.0)
+    clock.sleep(0.25)
+    scheduler.shift(2 * 1000 * MS)  # Paused for two seconds
+    assert scheduler.origin_ns == 2000 * MS and scheduler.deadline_ns == 3000 * MS
+    assert scheduler.remaining() == 2.75
+    assert scheduler.wait() == 0
+    assert scheduler.scheduled_ns == 1000 * MS
+
+
+def test_wait_ahead_and_interrupted_waits():
+    clock = VirtualClock(0)
+    interrupted = []
+    scheduler = DeadlineScheduler(clock=clock, sleep=lambda s: bool(interrupted) or clock.sleep(s))
+    scheduler.start(delay=1.0)
+    assert scheduler.wait_ahead(0.2)
+    assert clock() == 800 * MS and scheduler.waits == 0
+    interrupted.append(True)
+    assert scheduler.wait() is None
+    assert scheduler.waits == 0
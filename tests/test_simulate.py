@@ -0,0 +1,69 @@
+"""
+Virtual-time session estimates against hand-computed timelines.
+"""
+
+import pytest
+
+from autoclicker import plan
+from autoclicker.models import ClickPoint, PointTable
+from autoclicker.simulate import MIN_LOOPS, format_estimate, format_summary, simulate
+
+
+@pytest.fixture
+def exact_delays(monkeypatch):
+    """Turn off the ±5% delay variation so timelines can be computed by hand"""
+    monkeypatch.setattr(plan, 'DELAY_VARIATION', 0.0)
+
+
+def make_config(loops):
+    """Two points 1 s and 2 s apart after a 3 s start delay: 3 s loops"""
+    points = PointTable([ClickPoint(x=10, y=10, delay=1.0), ClickPoint(x=20, y=20, delay=2.0)])
+    disabled = ClickPoint(x=30, y=30, delay=50.0)
+    disabled.enabled = False
+    points.append(disabled)
+    return {'click_points': points.to_dicts(), 'loop_count': loops, 'start_delay': 3.0}
+
+
+def test_short_session_is_simulated_in_full(exact_delays):
+    estimate = simulate(make_config(5), settle_time=0.0)
+    assert not estimate.extrapolated and estimate.simulated_loops == 5
+    assert estimate.clicks_per_loop == 2
+    assert estimate.first_click_s == 3.0
+    assert estimate.loop_starts_s == [3.0, 6.0, 9.0, 12.0, 15.0]
+    # The last click is the second point of loop 5
+    assert estimate.duration_s == 16.0
+    assert estimate.loop_mean_s == 3.0 and estimate.loop_stdev_s == 0.0
+    assert estimate.loops_per_hour == 1200 and estimate.clicks_per_hour == 2400
+
+
+def test_long_session_stops_once_the_mean_converges(exact_delays):
+    estimate = simulate(make_config(10000), settle_time=0.0)
+    assert estimate.extrapolated and estimate.simulated_loops == MIN_LOOPS
+    assert estimate.clicks_per_loop == 2
+    assert estimate.duration_s == pytest.approx(3.0 + 9999 * 3.0 + 1.0)
+
+
+def test_jittered_session_estimate_is_close():
+    estimate = simulate(make_config(10000))
+    assert estimate.simulated_loops < 10000
+    assert estimate.loop_mean_s == pytest.approx(3.0, rel=0.005)
+    assert estimate.duration_s == pytest.approx(30001.0, rel=0.005)
+
+
+def test_infinite_and_empty_configs(exact_delays):
+    estimate = simulate(make_config(5), loops=0, settle_time=0.0)
+    assert estimate.duration_s is None
+    assert format_summary(estimate).endswith("runs until stopped")
+    empty = make_config(5)
+    empty['click_points'] = empty['click_points'][2:]
+    with pytest.raises(ValueError):
+        simulate(empty)
+
+
+def test_report_lists_each_milestone_once(exact_delays):
+    report = format_estimate(simulate(make_config(3), settle_time=0.0), now=0)
+    milestones = [line.split()[1] for line in report.splitlines() if 'starts' in line]
+    assert milestones == ['2']
+    report = format_estimate(simulate(make_config(8), settle_time=0.0), now=0)
+    assert [line.split()[1] for line in report.splitlines() if 'starts' in line] == ['2', '4', '6']
+    assert "8 loops take 25.0s" in report
@@ -0,0 +1,121 @@
+"""
+GUI status model change tracking and the render loop's frame scheduling,
+against a stand-in Tk root.
+"""
+
+import os
+import select
+import threading
+
+from autoclicker.gui.status_model import RenderLoop, StatusModel
+
+
+class FakeTk:
+    """Records file handlers like Tk's createfilehandler"""
+    
+    def __init__(self):
+        self.handlers = {}
+        
+    def createfilehandler(self, fd, mask, func):
+        self.handlers[fd] = func
+
+
+class FakeRoot:
+    """Tk root that queues after() jobs instead of running a main loop"""
+    
+    def __init__(self):
+        self.tk = FakeTk()
+        self.scheduled = []  # (delay_ms, func) of every after() call
+        self.jobs = []
+        
+    def after(self, delay_ms, func):
+        self.scheduled.append((delay_ms, func))
+        self.jobs.append(func)
+        return len(self.scheduled)
+        
+    def run_pending(self):
+        """One main loop pass: readable file handlers, then due jobs"""
+        for fd, func in list(self.tk.handlers.items()):
+            if select.select([fd], [], [], 0)[0]:
+                func(fd, 0)
+        jobs, self.jobs = self.jobs, []
+        for func in jobs:
+            func()
+
+
+def make_loop():
+    root = FakeRoot()
+    frames = []
+    loop = RenderLoop(root, lambda: frames.append(loop.frames), max_fps=30)
+    return root, loop, frames
+
+
+def test_status_model_tracks_only_real_changes():
+    model = StatusModel()
+    assert model.set(status='Ready', clicks=0)
+    assert not model.set(status='Ready')
+    assert model.set(clicks=1)
+    assert model.take_changes() == {'status': 'Ready', 'clicks': 1}
+    assert not model.dirty and model.take_changes() == {}
+    model.set(clicks=1, loops=2)
+    assert model.take_changes() == {'loops': 2}
+    assert model.get('clicks') == 1 and model.get('missing', 'x') == 'x'
+
+
+def test_an_idle_loop_schedules_nothing():
+    root, loop, frames = make_loop()
+    loop.start()
+    for _ in range(5):
+        root.run_pending()
+    assert root.scheduled == [] and frames == []
+
+
+def test_requests_are_merged_into_one_frame():
+    root, loop, frames = make_loop()
+    loop.request()
+    loop.start()  # A request made before start gets its frame
+    root.run_pending()
+    assert frames == [1]
+    for _ in range(3):
+        loop.request()
+    root.run_pending()
+    root.run_pending()
+    assert frames == [1, 2]
+    # Nothing is left armed after the frame
+    scheduled = len(root.scheduled)
+    root.run_pending()
+    assert len(root.scheduled) == scheduled == 2
+
+
+def test_frames_are_capped_and_requests_while_rendering_count():
+    root, loop, frames = make_loop()
+    loop.render = lambda: (frames.append(loop.frames), loop.frames == 1 and loop.request())
+    loop.start()
+    loop.request()
+    root.run_pending()
+    root.run_pending()
+    assert frames == [1, 2]
+    first, second = root.scheduled
+    assert first[0] == 0 and 0 < second[0] <= loop.interval_ms
+
+
+def test_requests_from_other_threads_only_write_the_pipe():
+    root, loop, frames = make_loop()
+    loop.start()
+    fd = next(iter(root.tk.handlers))
+    loop.request()
+    loop.request()
+    assert root.scheduled == []
+    assert os.read(fd, 16) == b'\0'
+
+
+def test_queued_calls_run_on_the_next_frame_before_rendering():
+    root, loop, frames = make_loop()
+    loop.start()
+    calls = []
+    thread = threading.Thread(target=lambda: loop.call(lambda: calls.append(list(frames))))
+    thread.start()
+    thread.join()
+    assert calls == [] and root.scheduled == []
+    root.run_pending()
+    assert calls == [[]] and frames == [1]
@@ -0,0 +1,49 @@
+"""
+Log-bucketed latency histograms.
+"""
+
+import random
+
+from autoclicker.telemetry import MAX_VALUE, LogHistogram, bucket_index, bucket_value
+
+
+def test_buckets_are_exact_below_64_and_within_3_percent_above():
+    for value in range(64):
+        assert bucket_value(bucket_index(value)) == value
+    previous = -1
+    for value in [2 ** k + d for k in range(6, 40) for d in (0, 1, 2 ** (k - 1), 2 ** k - 1)]:
+        index = bucket_index(value)
+        assert index >= previous
+        previous = index
+        assert abs(bucket_value(index) - value) / value < 0.032
+
+
+def test_percentiles_match_the_exact_values():
+    rng = random.Random(1)
+    values = [int(rng.lognormvariate(13, 1)) for _ in range(20000)]  # ~0.4 ms median
+    histogram = LogHistogram()
+    for value in values:
+        histogram.record(value)
+    values.sort()
+    for fraction, estimate in zip((0.5, 0.9, 0.99), histogram.percentiles(0.5, 0.9, 0.99)):
+        exact = values[int(len(values) * fraction) - 1]
+        assert abs(estimate - exact) / exact < 0.035
+    stats = histogram.get_stats()
+    assert stats['count'] == 20000
+    assert stats['min_ms'] == values[0] / 1e6 and stats['max_ms'] == values[-1] / 1e6
+    assert abs(stats['mean_ms'] - sum(values) / len(values) / 1e6) < 1e-9
+
+
+def test_clamping_reset_and_shared_buffers():
+    buffer = bytearray(LogHistogram.NBYTES)
+    histogram = LogHistogram(buffer)
+    histogram.record(-5)
+    histogram.record(MAX_VALUE * 2)
+    low, high = histogram.percentiles(0.0, 1.0)
+    assert low == 0 and abs(high - MAX_VALUE) / MAX_VALUE < 0.032
+    assert histogram.get_stats()['max_ms'] == MAX_VALUE / 1e6
+    # A second histogram on the same buffer sees the counts in place
+    assert LogHistogram(buffer).count == 2
+    histogram.reset()
+    assert histogram.count == 0 and histogram.percentiles(0.5) == [0]
+    assert histogram.get_stats()['min_ms'] == 0.0
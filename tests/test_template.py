@@ -0,0 +1,66 @@
+"""
+Template capture and normalized cross-correlation search on synthetic screens.
+"""
+
+import pytest
+
+from autoclicker.vision.base import Region
+from autoclicker.vision.replay import ReplaySource
+from autoclicker.vision.template import TemplateLocator, TemplateMatcher, capture_template, to_gray
+
+np = pytest.importorskip('numpy')
+
+WIDTH, HEIGHT = 240, 180
+
+
+def screen(seed=0, shift=(0, 0)):
+    """Blotchy random texture as a BGRX frame, optionally moved by shift"""
+    rng = np.random.default_rng(seed)
+    coarse = rng.integers(0, 256, size=(HEIGHT // 3 + 2, WIDTH // 3 + 2, 3), dtype=np.uint8)
+    texture = np.kron(coarse, np.ones((3, 3, 1), dtype=np.uint8))
+    pixels = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+    dx, dy = shift
+    pixels[..., :3] = np.roll(texture, (dy, dx), axis=(0, 1))[:HEIGHT, :WIDTH]
+    return pixels
+
+
+def test_matcher_finds_a_patch_of_the_image():
+    gray = to_gray(screen())
+    matcher = TemplateMatcher(capture_template(ReplaySource([screen()]), 100, 70))
+    x, y, score = matcher.match(gray)
+    assert (x, y) == (84, 54) and score > 0.99
+    assert matcher.match(gray[:10, :10]) is None
+
+
+def test_capture_refuses_a_flat_area_and_clamps_at_the_edge():
+    flat = np.full((HEIGHT, WIDTH, 4), 90, dtype=np.uint8)
+    with pytest.raises(ValueError):
+        capture_template(ReplaySource([flat]), 50, 50)
+    target = capture_template(ReplaySource([screen()]), 3, 5)
+    assert (target.anchor_x, target.anchor_y) == (3, 5)
+
+
+def test_locator_searches_near_then_everywhere_then_gives_up():
+    target = capture_template(ReplaySource([screen()]), 100, 70, search_radius=20)
+    locator = TemplateLocator([None, target], [(0, 0), (100, 70)], ReplaySource([screen(shift=(7, -4))]))
+    assert locator.matchers[0] is None
+    x, y, score, scope = locator.locate(1)
+    assert (x, y, scope) == (107, 66, 'local') and score > 0.99
+    
+    locator.source = ReplaySource([screen(shift=(90, 60))])
+    x, y, score, scope = locator.locate(1)
+    assert (x, y, scope) == (190, 130, 'global') and score > 0.99
+    assert locator.positions[1] == (190, 130)
+    
+    locator.source = ReplaySource([screen(seed=1)])
+    x, y, score, scope = locator.locate(1)
+    assert (x, y, scope) == (190, 130, 'missed') and score < target.threshold
+
+
+def test_grab_region_matches_the_template_size():
+    source = ReplaySource([screen()])
+    target = capture_template(source, 100, 70, size=16)
+    assert (target.width, target.height) == (16, 16)
+    patch = np.frombuffer(target.pixels, dtype=np.uint8).reshape(16, 16)
+    expected = np.rint(to_gray(source.grab(Region(92, 62, 16, 16)).pixels))
+    assert np.array_equal(patch, expected)
@@ -0,0 +1,56 @@
+"""
+Game tick phase tracking and tick-aligned scheduling on a virtual clock.
+"""
+
+from autoclicker.scheduler import DeadlineScheduler
+from autoclicker.ticks import TickClock
+from autoclicker.timing import VirtualClock
+
+MS = 1_000_000
+
+
+def test_ticks_for_rounds_to_whole_ticks():
+    ticks = TickClock(clock=VirtualClock(0))
+    assert [ticks.ticks_for(d) for d in (0.0, 0.2, 0.31, 0.6, 0.89, 0.91, 3.0)] == [1, 1, 1, 1, 1, 2, 5]
+
+
+def test_phase_follows_the_last_sync():
+    clock = VirtualClock(0)
+    ticks = TickClock(clock=clock)
+    ticks.sync(250 * MS)
+    assert ticks.phase_ms(250 * MS) == 0 and ticks.phase_ms(1000 * MS) == 150
+    assert ticks.phase_ms(100 * MS) == 450
+    assert ticks.next_boundary(851 * MS) == 1450 * MS
+    assert ticks.next_boundary(850 * MS) == 850 * MS
+    assert ticks.nearest_boundary(1100 * MS) == 850 * MS and ticks.nearest_boundary(1200 * MS) == 1450 * MS
+    clock.sleep(0.7)
+    ticks.sync()
+    assert ticks.phase_ms() == 0 and ticks.syncs == 2
+
+
+def test_clicks_land_lead_ms_before_boundaries():
+    clock = VirtualClock(0)
+    ticks = TickClock(lead_ms=50, clock=clock)
+    ticks.sync(100 * MS)
+    scheduler = DeadlineScheduler(clock=clock, sleep=clock.sleep)
+    scheduler.start()
+    ticks.align(scheduler)
+    assert scheduler.deadline_ns == 50 * MS
+    deadlines = []
+    for delay in (0.6, 1.3, 0.1):
+        scheduler.wait()
+        ticks.advance(scheduler, delay)
+        deadlines.append(scheduler.deadline_ns // MS)
+    assert deadlines == [650, 1850, 2450]
+
+
+def test_a_missed_tick_moves_to_the_next_reachable_one():
+    clock = VirtualClock(0)
+    ticks = TickClock(lead_ms=50, clock=clock)
+    scheduler = DeadlineScheduler(clock=clock, sleep=clock.sleep)
+    scheduler.start()
+    ticks.align(scheduler)
+    scheduler.wait()
+    clock.sleep(0.7)  # Held up past the next tick's lead point
+    ticks.advance(scheduler, 0.6)
+    assert scheduler.deadline_ns == 1750 * MS and ticks.boundary_ns == 1800 * MS
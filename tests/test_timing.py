@@ -0,0 +1,70 @@
+"""
+Wait strategies and sleep calibration.
+"""
+
+import sys
+import time
+
+import pytest
+
+from autoclicker.timing import (STRATEGY_NAMES, HybridStrategy, SleepStrategy, VirtualClock, calibrate,
+                                create_strategy)
+
+MS = 1_000_000
+
+
+def available(name):
+    return name != 'timerfd' or sys.platform.startswith('linux')
+
+
+def test_create_strategy_by_name():
+    for name in STRATEGY_NAMES:
+        if available(name):
+            strategy = create_strategy(name, margin=0.003)
+            assert strategy.name == name and strategy.margin == 0.003
+            strategy.close()
+    with pytest.raises(ValueError):
+        create_strategy('spin')
+
+
+def test_plain_sleep_reaches_the_target_on_a_virtual_clock():
+    clock = VirtualClock(0)
+    assert SleepStrategy().sleep_until(250 * MS, clock, clock.sleep)
+    assert clock() == 250 * MS
+    assert not SleepStrategy().sleep_until(500 * MS, clock, lambda seconds: True)
+
+
+def test_precise_phase_covers_only_the_margin():
+    clock = VirtualClock(0)
+    precise = []
+    strategy = HybridStrategy(margin=0.002)
+    strategy._precise = precise.append
+    assert strategy.sleep_until(100 * MS, clock, clock.sleep)
+    assert clock() == 98 * MS and precise == [2 * MS]
+    # An interrupted coarse phase skips the precise one
+    assert not strategy.sleep_until(200 * MS, clock, lambda seconds: True)
+    assert precise == [2 * MS]
+
+
+@pytest.mark.parametrize('name', [n for n in STRATEGY_NAMES if n != 'sleep'])
+def test_precise_strategies_wake_up_on_time(name):
+    if not available(name):
+        pytest.skip("timerfd is Linux-only")
+    strategy = create_strategy(name, margin=0.002)
+    try:
+        errors = []
+        for _ in range(20):
+            target = time.monotonic_ns() + 5 * MS
+            strategy.sleep_until(target, time.monotonic_ns, time.sleep)
+            errors.append(time.monotonic_ns() - target)
+    finally:
+        strategy.close()
+    errors.sort()
+    assert errors[0] >= 0 and errors[len(errors) // 2] < 1 * MS
+
+
+def test_calibrate_picks_a_margin_from_the_measured_error():
+    result = calibrate(samples=20, interval=0.001)
+    assert 0 <= result.p50_ms <= result.p90_ms <= result.p99_ms <= result.max_ms
+    assert 0.5 <= result.margin_ms <= 20.0
+    assert abs(result.margin_ms - max(0.5, min(20.0, result.p99_ms * 1.5))) <= 0.05 + 1e-9
@@ -0,0 +1,58 @@
+"""
+Session trace recording, ring wrap-around and export.
+"""
+
+import csv
+import json
+
+from autoclicker import trace
+
+
+def record_clicks(recorder, count):
+    """Record count clicks 0.5 s apart, cycling through three points"""
+    for n in range(count):
+        recorder.record(1_000_000_000 + n * 500_000_000, n % 3, n // 3, 10 * n, 20, 10 * n, 21, n == 4,
+                        500_000_000, 1000 * n)
+
+
+def test_records_round_trip(tmp_path):
+    path = str(tmp_path / 'session.trace')
+    recorder = trace.TraceRecorder(path, capacity=16)
+    record_clicks(recorder, 5)
+    recorder.close()
+    loaded = trace.load(path)
+    assert loaded.capacity == 16 and loaded.written == 5
+    assert [r.index for r in loaded.records] == [0, 1, 2, 0, 1]
+    assert loaded.records[4] == trace.TraceRecord(3_000_000_000, 500_000_000, 4000, 1, 1, 40, 20, 40, 21, 1)
+
+
+def test_full_ring_keeps_the_newest_records_in_order(tmp_path):
+    path = str(tmp_path / 'session.trace')
+    recorder = trace.TraceRecorder(path, capacity=4)
+    record_clicks(recorder, 10)
+    recorder.close()
+    loaded = trace.load(path)
+    assert loaded.written == 10
+    assert [r.x for r in loaded.records] == [60, 70, 80, 90]
+
+
+def test_exports(tmp_path):
+    path = str(tmp_path / 'session.trace')
+    recorder = trace.TraceRecorder(path, capacity=16)
+    record_clicks(recorder, 6)
+    recorder.close()
+    
+    out_path, count = trace.export(path, 'chrome')
+    assert out_path == str(tmp_path / 'session.json') and count == 6
+    with open(out_path) as f:
+        events = json.load(f)['traceEvents']
+    clicks = [e for e in events if e.get('cat') == 'click' and e['ph'] == 'X']
+    assert [e['ts'] for e in clicks] == [500_000 * n for n in range(6)]
+    assert [e['name'] for e in events if e.get('cat') == 'loop'] == ['loop 0', 'loop 1']
+    assert len([e for e in events if e['ph'] == 'i']) == 1
+    
+    out_path, count = trace.export(path, 'csv')
+    with open(out_path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 6
+    assert rows[4]['point'] == '2' and rows[4]['drifted'] == '1' and rows[4]['late_ms'] == '0.004'
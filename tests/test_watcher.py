@@ -0,0 +1,62 @@
+"""
+Config directory watching: batching with inotify and the polling fallback.
+"""
+
+import os
+import queue
+import sys
+
+import pytest
+
+from autoclicker import watcher as watcher_module
+from autoclicker.watcher import ConfigWatcher
+
+
+def start_watcher(directory, **options):
+    batches = queue.Queue()
+    watcher = ConfigWatcher(str(directory), batches.put, **options)
+    watcher.start()
+    return watcher, batches
+
+
+def write(directory, name, text='{}'):
+    with open(os.path.join(str(directory), name), 'w') as f:
+        f.write(text)
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux-only")
+def test_a_burst_of_saves_is_reported_as_one_batch(tmp_path):
+    watcher, batches = start_watcher(tmp_path, debounce=0.1)
+    try:
+        assert watcher.mode == 'inotify'
+        for n in range(5):
+            write(tmp_path, f'config{n}.json')
+        write(tmp_path, 'notes.txt')
+        write(tmp_path, '.catalog.json')
+        os.replace(os.path.join(str(tmp_path), 'config0.json'), os.path.join(str(tmp_path), 'moved.json'))
+        assert batches.get(timeout=2.0) == {f'config{n}.json' for n in range(5)} | {'moved.json'}
+        assert batches.empty()
+        os.remove(os.path.join(str(tmp_path), 'moved.json'))
+        assert batches.get(timeout=2.0) == {'moved.json'}
+    finally:
+        watcher.stop()
+    assert watcher.thread is None
+
+
+def test_polling_fallback_reports_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(watcher_module, '_open_inotify', lambda directory: None)
+    write(tmp_path, 'old.json')
+    watcher, batches = start_watcher(tmp_path, debounce=0.01, poll_interval=0.02)
+    try:
+        assert watcher.mode == 'polling'
+        write(tmp_path, 'new.json')
+        os.remove(os.path.join(str(tmp_path), 'old.json'))
+        # The two changes may straddle a poll
+        seen = batches.get(timeout=2.0)
+        if seen != {'new.json', 'old.json'}:
+            seen |= batches.get(timeout=2.0)
+        assert seen == {'new.json', 'old.json'}
+        write(tmp_path, 'new.json', '{"name": "changed"}')
+        assert batches.get(timeout=2.0) == {'new.json'}
+    finally:
+        watcher.stop()